@@ -1,6 +1,8 @@
 """The Serac integration."""
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
 
 from homeassistant.config_entries import ConfigEntry
@@ -8,12 +10,15 @@ from homeassistant.const import CONF_LATITUDE, CONF_LONGITUDE, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api.airquality_client import AirQualityClient
 from .api.bra_client import BraApiError, BraClient
 from .api.openmeteo_client import OpenMeteoApiError, OpenMeteoClient
 from .api.vigilance_client import VigilanceApiError, VigilanceClient
 from .const import (
+    AQI_CACHE,
+    BRA_SEMAPHORE,
     CONF_BRA_TOKEN,
     CONF_LOCATION_NAME,
     CONF_MASSIF_ID,
@@ -22,6 +27,7 @@ from .const import (
     CONF_VIGILANCE_TOKEN,
     DOMAIN,
     MASSIF_IDS,
+    SHARED_CLIENTS,
 )
 from .coordinator import AromeCoordinator, BraCoordinator, VigilanceCoordinator
 
@@ -96,16 +102,19 @@ async def async_cleanup_removed_massifs(hass: HomeAssistant, entry: ConfigEntry)
             device_registry.async_remove_device(device_entry.id)
 
 
-async def async_migrate_entity_ids(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Migrate entity IDs from old naming pattern to new consistent pattern.
+@functools.lru_cache(maxsize=32)
+def _build_migration_maps(
+    latitude: float, longitude: float
+) -> tuple[str, tuple[str, ...], tuple[tuple[str, str], ...]]:
+    """Build the entity ID migration tables for a location.
 
-    This removes old unavailable sensors and standardizes entity_ids to use
-    the coordinate-based pattern: location_{lat}_{lon}_mountain_weather_*
-    """
-    entity_registry = er.async_get(hass)
-    latitude = entry.data[CONF_LATITUDE]
-    longitude = entry.data[CONF_LONGITUDE]
+    Args:
+        latitude: Location latitude
+        longitude: Location longitude
 
+    Returns:
+        Tuple of (new entity_id base, entity IDs to remove, old -> new entity ID pairs)
+    """
     # Format coordinates for entity_id (rounded to 2 decimals, replace dots with underscores)
     lat_rounded = round(latitude, 2)
     lon_rounded = round(longitude, 2)
@@ -114,7 +123,7 @@ async def async_migrate_entity_ids(hass: HomeAssistant, entry: ConfigEntry) -> N
     new_entity_id_base = f"location_{lat_str}_{lon_str}_mountain_weather"
 
     # Old sensors to remove completely (no longer exist in code)
-    old_sensors_to_remove = [
+    old_sensors_to_remove = (
         "sensor.station_de_ski_orange_mountain_weather_sunrise",
         "sensor.station_de_ski_orange_mountain_weather_sunset",
         "sensor.station_de_ski_orange_mountain_weather_uv_index",
@@ -131,14 +140,7 @@ async def async_migrate_entity_ids(hass: HomeAssistant, entry: ConfigEntry) -> N
         f"sensor.{new_entity_id_base}_pm2_5_max_day_6",
         f"sensor.{new_entity_id_base}_pm10_max_day_5",
         f"sensor.{new_entity_id_base}_pm10_max_day_6",
-    ]
-
-    # Remove old unavailable sensors
-    for entity_id in old_sensors_to_remove:
-        entity_entry = entity_registry.async_get(entity_id)
-        if entity_entry and entity_entry.config_entry_id == entry.entry_id:
-            _LOGGER.info("Removing old unavailable sensor: %s", entity_id)
-            entity_registry.async_remove(entity_id)
+    )
 
     # Also handle full precision coordinate format (from previous migration)
     lat_full = str(latitude)
@@ -147,40 +149,71 @@ async def async_migrate_entity_ids(hass: HomeAssistant, entry: ConfigEntry) -> N
 
     # Migrate entity IDs that still use the old "station_de_ski_orange" pattern
     # or full precision coordinates to the new rounded coordinate-based pattern
-    old_to_new_mapping = {
+    old_to_new_mapping = (
         # Old naming pattern
-        "weather.station_de_ski_orange_mountain_weather": f"weather.{new_entity_id_base}",
-        "sensor.station_de_ski_orange_mountain_weather_elevation": f"sensor.{new_entity_id_base}_elevation",
-        "sensor.station_de_ski_orange_mountain_weather_humidity": f"sensor.{new_entity_id_base}_humidity",
-        "sensor.station_de_ski_orange_mountain_weather_wind_speed": f"sensor.{new_entity_id_base}_wind_speed",
-        "sensor.station_de_ski_orange_mountain_weather_wind_gust": f"sensor.{new_entity_id_base}_wind_gust",
-        "sensor.station_de_ski_orange_mountain_weather_cloud_coverage": f"sensor.{new_entity_id_base}_cloud_coverage",
+        ("weather.station_de_ski_orange_mountain_weather", f"weather.{new_entity_id_base}"),
+        ("sensor.station_de_ski_orange_mountain_weather_elevation", f"sensor.{new_entity_id_base}_elevation"),
+        ("sensor.station_de_ski_orange_mountain_weather_humidity", f"sensor.{new_entity_id_base}_humidity"),
+        ("sensor.station_de_ski_orange_mountain_weather_wind_speed", f"sensor.{new_entity_id_base}_wind_speed"),
+        ("sensor.station_de_ski_orange_mountain_weather_wind_gust", f"sensor.{new_entity_id_base}_wind_gust"),
+        ("sensor.station_de_ski_orange_mountain_weather_cloud_coverage", f"sensor.{new_entity_id_base}_cloud_coverage"),
         # Full precision coordinates (migrate to rounded for consistency)
-        f"weather.{old_full_precision_base}": f"weather.{new_entity_id_base}",
-        f"sensor.{old_full_precision_base}_elevation": f"sensor.{new_entity_id_base}_elevation",
-        f"sensor.{old_full_precision_base}_humidity": f"sensor.{new_entity_id_base}_humidity",
-        f"sensor.{old_full_precision_base}_wind_speed": f"sensor.{new_entity_id_base}_wind_speed",
-        f"sensor.{old_full_precision_base}_wind_gust": f"sensor.{new_entity_id_base}_wind_gust",
-        f"sensor.{old_full_precision_base}_cloud_coverage": f"sensor.{new_entity_id_base}_cloud_coverage",
-    }
-
-    for old_entity_id, new_entity_id in old_to_new_mapping.items():
+        (f"weather.{old_full_precision_base}", f"weather.{new_entity_id_base}"),
+        (f"sensor.{old_full_precision_base}_elevation", f"sensor.{new_entity_id_base}_elevation"),
+        (f"sensor.{old_full_precision_base}_humidity", f"sensor.{new_entity_id_base}_humidity"),
+        (f"sensor.{old_full_precision_base}_wind_speed", f"sensor.{new_entity_id_base}_wind_speed"),
+        (f"sensor.{old_full_precision_base}_wind_gust", f"sensor.{new_entity_id_base}_wind_gust"),
+        (f"sensor.{old_full_precision_base}_cloud_coverage", f"sensor.{new_entity_id_base}_cloud_coverage"),
+    )
+
+    return new_entity_id_base, old_sensors_to_remove, old_to_new_mapping
+
+
+async def async_migrate_entity_ids(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Migrate entity IDs from old naming pattern to new consistent pattern.
+
+    This removes old unavailable sensors and standardizes entity_ids to use
+    the coordinate-based pattern: location_{lat}_{lon}_mountain_weather_*
+    """
+    entity_registry = er.async_get(hass)
+    new_entity_id_base, old_sensors_to_remove, old_to_new_mapping = _build_migration_maps(
+        entry.data[CONF_LATITUDE], entry.data[CONF_LONGITUDE]
+    )
+
+    # Collect registry changes during a read-only scan and apply them in a
+    # single pass at the end, so listeners and saves are not interleaved
+    # with lookups
+    to_remove: dict[str, None] = {}
+    to_rename: list[tuple[str, str]] = []
+
+    # Remove old unavailable sensors
+    for entity_id in old_sensors_to_remove:
+        entity_entry = entity_registry.async_get(entity_id)
+        if entity_entry and entity_entry.config_entry_id == entry.entry_id:
+            _LOGGER.info("Removing old unavailable sensor: %s", entity_id)
+            to_remove[entity_id] = None
+
+    # Snapshot registered entity IDs once instead of probing per mapping
+    existing_entity_ids = set(entity_registry.entities.keys()).difference(to_remove)
+
+    for old_entity_id, new_entity_id in old_to_new_mapping:
+        if old_entity_id not in existing_entity_ids:
+            continue
         entity_entry = entity_registry.async_get(old_entity_id)
         if entity_entry and entity_entry.config_entry_id == entry.entry_id:
             # Check if target entity_id already exists
-            if entity_registry.async_get(new_entity_id):
+            if new_entity_id in existing_entity_ids:
                 _LOGGER.warning(
                     "Cannot migrate %s to %s: target already exists. Removing old entity.",
                     old_entity_id,
                     new_entity_id,
                 )
-                entity_registry.async_remove(old_entity_id)
+                to_remove[old_entity_id] = None
             else:
                 _LOGGER.info("Migrating entity ID: %s -> %s", old_entity_id, new_entity_id)
-                entity_registry.async_update_entity(
-                    entity_entry.entity_id,
-                    new_entity_id=new_entity_id,
-                )
+                to_rename.append((entity_entry.entity_id, new_entity_id))
+                existing_entity_ids.add(new_entity_id)
+            existing_entity_ids.discard(old_entity_id)
 
     # Remove old BRA sensors (v0.6.0 - new format includes massif_id in unique_id)
     # Old format: location_{lat}_{lon}_mountain_weather_avalanche_*
@@ -199,8 +232,79 @@ async def async_migrate_entity_ids(hass: HomeAssistant, entry: ConfigEntry) -> N
                     "Removing old BRA sensor (v0.6.0 migration): %s",
                     entity_entry.entity_id,
                 )
-                entity_registry.async_remove(entity_entry.entity_id)
+                to_remove[entity_entry.entity_id] = None
+
+    for entity_id in to_remove:
+        entity_registry.async_remove(entity_id)
+    for entity_id, new_entity_id in to_rename:
+        if entity_id not in to_remove:
+            entity_registry.async_update_entity(entity_id, new_entity_id=new_entity_id)
+
+
+def _acquire_shared_clients(
+    hass: HomeAssistant, latitude: float, longitude: float
+) -> tuple[tuple[float, float], OpenMeteoClient, AirQualityClient]:
+    """Get the Open-Meteo and Air Quality clients for a location.
+
+    Entries whose coordinates match to 3 decimals share one pair of clients,
+    built with the coordinates of the first entry and reference counted so
+    the pair is dropped when the last entry is unloaded.
+
+    Args:
+        hass: Home Assistant instance
+        latitude: Location latitude
+        longitude: Location longitude
 
+    Returns:
+        Tuple of (registry key, Open-Meteo client, Air Quality client)
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    shared = domain_data.setdefault(SHARED_CLIENTS, {})
+    key = (round(latitude, 3), round(longitude, 3))
+
+    if key not in shared:
+        shared[key] = {
+            "arome_client": OpenMeteoClient(
+                latitude=latitude,
+                longitude=longitude,
+                session=async_get_clientsession(hass),
+            ),
+            "airquality_client": AirQualityClient(
+                latitude=latitude,
+                longitude=longitude,
+                session=async_get_clientsession(hass),
+                # Survives the client so a reload reuses recent results
+                cache=domain_data.setdefault(AQI_CACHE, {}),
+            ),
+            "refcount": 0,
+        }
+    else:
+        _LOGGER.debug("Reusing shared API clients for %s", key)
+
+    clients = shared[key]
+    clients["refcount"] += 1
+    return key, clients["arome_client"], clients["airquality_client"]
+
+
+async def _async_release_shared_clients(
+    hass: HomeAssistant, key: tuple[float, float]
+) -> None:
+    """Release a reference to the shared clients for a location.
+
+    Args:
+        hass: Home Assistant instance
+        key: Registry key returned by _acquire_shared_clients
+    """
+    shared = hass.data.get(DOMAIN, {}).get(SHARED_CLIENTS, {})
+    clients = shared.get(key)
+    if clients is None:
+        return
+
+    clients["refcount"] -= 1
+    if clients["refcount"] <= 0:
+        del shared[key]
+        await clients["arome_client"].async_close()
+        await clients["airquality_client"].async_close()
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -229,6 +333,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         # Backward compatibility: convert old single massif to list
         massif_ids = [entry.data[CONF_MASSIF_ID]]
 
+    # Massif IDs may be stored as strings (multi_select keys) - normalize once
+    massif_ids = [int(m) if isinstance(m, str) else m for m in massif_ids]
+
     _LOGGER.debug(
         "Setting up Serac for %s (%.4f, %.4f)",
         location_name,
@@ -236,66 +343,108 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         longitude,
     )
 
-    # Initialize Open-Meteo client (no authentication required)
-    arome_client = OpenMeteoClient(
-        latitude=latitude,
-        longitude=longitude,
+    # Get Open-Meteo and Air Quality clients (shared between entries at the same location)
+    client_key, arome_client, airquality_client = _acquire_shared_clients(
+        hass, latitude, longitude
     )
 
-    # Initialize Air Quality client
-    airquality_client = AirQualityClient(
-        latitude=latitude,
-        longitude=longitude,
-    )
-
-    # Initialize AROME coordinator
-    arome_coordinator = AromeCoordinator(
-        hass=hass,
-        client=arome_client,
-        location_name=location_name,
-        airquality_client=airquality_client,
-    )
-
-    # Fetch initial weather data
     try:
-        await arome_coordinator.async_config_entry_first_refresh()
-    except OpenMeteoApiError as err:
-        _LOGGER.error("Error communicating with Open-Meteo API: %s", err)
-        raise ConfigEntryNotReady(f"Error communicating with Open-Meteo API: {err}") from err
-    except Exception as err:
-        _LOGGER.error("Unexpected error during AROME setup: %s", err)
-        raise ConfigEntryNotReady(f"Unexpected error: {err}") from err
-
-    # Store coordinators in hass.data
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = {
-        "arome_coordinator": arome_coordinator,
-        "arome_client": arome_client,
-        "airquality_client": airquality_client,
-    }
-
-    # Initialize BRA coordinators for each selected massif
-    bra_coordinators = {}
-    if bra_token and massif_ids:
-        for massif_id in massif_ids:
-            # Convert string ID to int if needed (from multi-select)
-            if isinstance(massif_id, str):
-                massif_id = int(massif_id)
-
-            # Get massif name from MASSIF_IDS
-            massif_name = "Unknown"
-            if massif_id in MASSIF_IDS:
-                massif_name, _ = MASSIF_IDS[massif_id]
+        # Initialize AROME coordinator
+        arome_coordinator = AromeCoordinator(
+            hass=hass,
+            client=arome_client,
+            location_name=location_name,
+            airquality_client=airquality_client,
+        )
 
+        # Initialize Vigilance coordinator if token is provided
+        vigilance_coordinator = None
+        if vigilance_token:
             _LOGGER.debug(
-                "Setting up BRA coordinator for massif %s (%s)",
-                massif_id,
-                massif_name,
+                "Setting up Vigilance coordinator for %s (lat=%.4f, lon=%.4f)",
+                location_name,
+                latitude,
+                longitude,
+            )
+            vigilance_client = VigilanceClient(
+                api_token=vigilance_token,
+                latitude=latitude,
+                longitude=longitude,
+                session=async_get_clientsession(hass),
+            )
+            vigilance_coordinator = VigilanceCoordinator(
+                hass=hass,
+                client=vigilance_client,
+                location_name=location_name,
+            )
+
+        # Fetch initial weather and vigilance data concurrently
+        refreshes = [arome_coordinator.async_config_entry_first_refresh()]
+        if vigilance_coordinator:
+            refreshes.append(vigilance_coordinator.async_config_entry_first_refresh())
+        results = await asyncio.gather(*refreshes, return_exceptions=True)
+
+        arome_result = results[0]
+        if isinstance(arome_result, OpenMeteoApiError):
+            _LOGGER.error("Error communicating with Open-Meteo API: %s", arome_result)
+            raise ConfigEntryNotReady(
+                f"Error communicating with Open-Meteo API: {arome_result}"
+            ) from arome_result
+        if isinstance(arome_result, Exception):
+            _LOGGER.error("Unexpected error during AROME setup: %s", arome_result)
+            raise ConfigEntryNotReady(f"Unexpected error: {arome_result}") from arome_result
+
+        if vigilance_coordinator:
+            vigilance_result = results[1]
+            if isinstance(vigilance_result, VigilanceApiError):
+                _LOGGER.warning(
+                    "Error setting up Vigilance coordinator for %s (weather alerts unavailable): %s",
+                    location_name,
+                    vigilance_result,
+                )
+                # Don't fail setup if Vigilance is unavailable
+            elif isinstance(vigilance_result, Exception):
+                _LOGGER.warning(
+                    "Unexpected error setting up Vigilance coordinator for %s: %s",
+                    location_name,
+                    vigilance_result,
+                )
+            else:
+                _LOGGER.info(
+                    "Successfully set up Vigilance coordinator for %s (dept: %s)",
+                    location_name,
+                    vigilance_coordinator.client._department,
+                )
+
+        # Store coordinators in hass.data
+        hass.data.setdefault(DOMAIN, {})
+        hass.data[DOMAIN][entry.entry_id] = {
+            "arome_coordinator": arome_coordinator,
+            "arome_client": arome_client,
+            "airquality_client": airquality_client,
+            "client_key": client_key,
+        }
+
+        # Initialize BRA coordinators for each selected massif
+        bra_coordinators = {}
+        if bra_token and massif_ids:
+            pending: list[tuple[int, str, BraCoordinator]] = []
+            # All massifs hit the same BRA backend; cap concurrent bulletin fetches
+            fetch_semaphore = hass.data[DOMAIN].setdefault(
+                BRA_SEMAPHORE, asyncio.Semaphore(3)
             )
-            try:
+            for massif_id in massif_ids:
+                massif_name = MASSIF_IDS.get(massif_id, ("Unknown", None))[0]
+
+                _LOGGER.debug(
+                    "Setting up BRA coordinator for massif %s (%s)",
+                    massif_id,
+                    massif_name,
+                )
                 bra_client = BraClient(
                     api_key=bra_token,
                     massif_id=massif_id,
+                    session=async_get_clientsession(hass),
                 )
                 bra_coordinator = BraCoordinator(
                     hass=hass,
@@ -303,109 +452,83 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                     location_name=location_name,
                     massif_id=massif_id,
                     massif_name=massif_name,
+                    fetch_semaphore=fetch_semaphore,
                 )
-                # Fetch initial BRA data
-                await bra_coordinator.async_config_entry_first_refresh()
-                bra_coordinators[massif_id] = bra_coordinator
-                _LOGGER.info(
-                    "Successfully set up BRA coordinator for %s (ID: %s)",
-                    massif_name,
-                    massif_id,
-                )
-            except BraApiError as err:
-                _LOGGER.warning(
-                    "Error setting up BRA coordinator for %s (avalanche data unavailable): %s",
-                    massif_name,
-                    err,
-                )
-                # Don't fail setup if BRA is unavailable (might be out of season)
-            except Exception as err:
-                _LOGGER.warning(
-                    "Unexpected error setting up BRA coordinator for %s: %s",
-                    massif_name,
-                    err,
-                )
+                pending.append((massif_id, massif_name, bra_coordinator))
 
-    # Store BRA coordinators
-    if bra_coordinators:
-        hass.data[DOMAIN][entry.entry_id]["bra_coordinators"] = bra_coordinators
-
-    # Initialize Vigilance coordinator if token is provided
-    vigilance_coordinator = None
-    if vigilance_token:
-        _LOGGER.debug(
-            "Setting up Vigilance coordinator for %s (lat=%.4f, lon=%.4f)",
-            location_name,
-            latitude,
-            longitude,
-        )
-        try:
-            vigilance_client = VigilanceClient(
-                api_token=vigilance_token,
-                latitude=latitude,
-                longitude=longitude,
-            )
-            vigilance_coordinator = VigilanceCoordinator(
-                hass=hass,
-                client=vigilance_client,
-                location_name=location_name,
-            )
-            # Fetch initial vigilance data
-            await vigilance_coordinator.async_config_entry_first_refresh()
-            _LOGGER.info(
-                "Successfully set up Vigilance coordinator for %s (dept: %s)",
-                location_name,
-                vigilance_client._department,
-            )
-        except VigilanceApiError as err:
-            _LOGGER.warning(
-                "Error setting up Vigilance coordinator for %s (weather alerts unavailable): %s",
-                location_name,
-                err,
-            )
-            # Don't fail setup if Vigilance is unavailable
-        except Exception as err:
-            _LOGGER.warning(
-                "Unexpected error setting up Vigilance coordinator for %s: %s",
-                location_name,
-                err,
+            # Fetch initial BRA data for all massifs concurrently
+            results = await asyncio.gather(
+                *(coordinator.async_config_entry_first_refresh() for _, _, coordinator in pending),
+                return_exceptions=True,
             )
 
-    # Store Vigilance coordinator
-    if vigilance_coordinator:
-        hass.data[DOMAIN][entry.entry_id]["vigilance_coordinator"] = vigilance_coordinator
+            for (massif_id, massif_name, bra_coordinator), result in zip(pending, results):
+                if isinstance(result, BraApiError):
+                    _LOGGER.warning(
+                        "Error setting up BRA coordinator for %s (avalanche data unavailable): %s",
+                        massif_name,
+                        result,
+                    )
+                    # Don't fail setup if BRA is unavailable (might be out of season)
+                elif isinstance(result, Exception):
+                    _LOGGER.warning(
+                        "Unexpected error setting up BRA coordinator for %s: %s",
+                        massif_name,
+                        result,
+                    )
+                else:
+                    bra_coordinators[massif_id] = bra_coordinator
+                    _LOGGER.info(
+                        "Successfully set up BRA coordinator for %s (ID: %s)",
+                        massif_name,
+                        massif_id,
+                    )
+
+        # Store BRA coordinators
+        if bra_coordinators:
+            hass.data[DOMAIN][entry.entry_id]["bra_coordinators"] = bra_coordinators
 
-    # Migrate old entity IDs and remove unavailable sensors
-    await async_migrate_entity_ids(hass, entry)
+        # Store Vigilance coordinator
+        if vigilance_coordinator:
+            hass.data[DOMAIN][entry.entry_id]["vigilance_coordinator"] = vigilance_coordinator
 
-    # Clean up entities for removed massifs (from options flow)
-    await async_cleanup_removed_massifs(hass, entry)
+        # Migrate old entity IDs and remove unavailable sensors
+        await async_migrate_entity_ids(hass, entry)
 
-    # Forward setup to platforms
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+        # Clean up entities for removed massifs (from options flow)
+        await async_cleanup_removed_massifs(hass, entry)
 
-    # Register service for vigilance updates (only once globally)
-    async def handle_update_vigilance(call):
-        """Handle the update_vigilance service call."""
-        _LOGGER.info("Manual vigilance update requested")
+        # Forward setup to platforms
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-        # Update all vigilance coordinators across all entries
-        updated_count = 0
-        for entry_id, entry_data in hass.data[DOMAIN].items():
-            if isinstance(entry_data, dict):
-                vigilance_coordinator = entry_data.get("vigilance_coordinator")
-                if vigilance_coordinator:
-                    await vigilance_coordinator.async_request_refresh()
-                    updated_count += 1
+        # Register service for vigilance updates (only once globally)
+        async def handle_update_vigilance(call):
+            """Handle the update_vigilance service call."""
+            _LOGGER.info("Manual vigilance update requested")
 
-        if updated_count > 0:
-            _LOGGER.info("Updated %d vigilance coordinator(s)", updated_count)
-        else:
-            _LOGGER.warning("No vigilance coordinators found to update")
+            # Update all vigilance coordinators across all entries
+            updated_count = 0
+            for entry_id, entry_data in hass.data[DOMAIN].items():
+                if entry_id not in (SHARED_CLIENTS, AQI_CACHE) and isinstance(entry_data, dict):
+                    vigilance_coordinator = entry_data.get("vigilance_coordinator")
+                    if vigilance_coordinator:
+                        await vigilance_coordinator.async_request_refresh()
+                        updated_count += 1
 
-    # Register service only once (not per entry)
-    if not hass.services.has_service(DOMAIN, "update_vigilance"):
-        hass.services.async_register(DOMAIN, "update_vigilance", handle_update_vigilance)
+            if updated_count > 0:
+                _LOGGER.info("Updated %d vigilance coordinator(s)", updated_count)
+            else:
+                _LOGGER.warning("No vigilance coordinators found to update")
+
+        # Register service only once (not per entry)
+        if not hass.services.has_service(DOMAIN, "update_vigilance"):
+            hass.services.async_register(DOMAIN, "update_vigilance", handle_update_vigilance)
+    except BaseException:
+        # Home Assistant doesn't unload an entry whose setup failed, so drop
+        # its data and client reference here
+        hass.data[DOMAIN].pop(entry.entry_id, None)
+        await _async_release_shared_clients(hass, client_key)
+        raise
 
     _LOGGER.info(
         "Successfully set up Serac for %s",
@@ -432,7 +555,12 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Remove data from hass.data
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        entry_data = hass.data[DOMAIN].pop(entry.entry_id)
+        await _async_release_shared_clients(hass, entry_data["client_key"])
+        if vigilance_coordinator := entry_data.get("vigilance_coordinator"):
+            await vigilance_coordinator.client.async_close()
+        for bra_coordinator in entry_data.get("bra_coordinators", {}).values():
+            await bra_coordinator.client.async_close()
 
     return unload_ok
 
@@ -1,31 +1,56 @@
 """Open-Meteo Air Quality API client for Serac integration."""
 from __future__ import annotations
 
+from datetime import timedelta
 import logging
+import time
 from typing import Any
 
 import aiohttp
+import orjson
+
+from ..const import AROME_UPDATE_INTERVAL
+from .base import BaseApiClient
 
 _LOGGER = logging.getLogger(__name__)
 
+# Air quality data is updated hourly at most. Expire cached results well before
+# the next scheduled refresh, which can fire slightly early, so each refresh
+# fetches instead of serving the previous hour's data for another interval
+_CACHE_TTL = (AROME_UPDATE_INTERVAL - timedelta(minutes=5)).total_seconds()
+
+AirQualityCache = dict[tuple[float, float], tuple[float, dict[str, Any]]]
+
 
 class AirQualityApiError(Exception):
     """Exception raised for Air Quality API errors."""
 
 
-class AirQualityClient:
+class AirQualityClient(BaseApiClient):
     """Client for Open-Meteo Air Quality API."""
 
-    def __init__(self, latitude: float, longitude: float) -> None:
+    def __init__(
+        self,
+        latitude: float,
+        longitude: float,
+        session: aiohttp.ClientSession | None = None,
+        cache: AirQualityCache | None = None,
+    ) -> None:
         """Initialize the Air Quality client.
 
         Args:
             latitude: Location latitude
             longitude: Location longitude
+            session: Shared aiohttp session (a private one is created if omitted)
+            cache: Result cache outliving the client (a private one if omitted)
         """
+        super().__init__(session)
         self.latitude = latitude
         self.longitude = longitude
         self.base_url = "https://air-quality-api.open-meteo.com/v1/air-quality"
+        # Expiry and result of the last fetch, keyed like the shared clients
+        self._cache: AirQualityCache = {} if cache is None else cache
+        self._cache_key = (round(latitude, 3), round(longitude, 3))
 
     async def async_get_air_quality(self) -> dict[str, Any]:
         """Fetch air quality data from Open-Meteo Air Quality API.
@@ -36,6 +61,11 @@ class AirQualityClient:
         Raises:
             AirQualityApiError: If the API request fails
         """
+        cached = self._cache.get(self._cache_key)
+        if cached is not None and time.monotonic() < cached[0]:
+            _LOGGER.debug("Using cached air quality data for %s", self._cache_key)
+            return cached[1]
+
         params = {
             "latitude": self.latitude,
             "longitude": self.longitude,
@@ -53,17 +83,17 @@ class AirQualityClient:
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    self.base_url, params=params, timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        raise AirQualityApiError(
-                            f"Air Quality API returned status {response.status}: {error_text}"
-                        )
-
-                    data = await response.json()
+            session = await self._get_session()
+            async with session.get(
+                self.base_url, params=params, timeout=aiohttp.ClientTimeout(total=30)
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    raise AirQualityApiError(
+                        f"Air Quality API returned status {response.status}: {error_text}"
+                    )
+
+                data = orjson.loads(await response.read())
 
             # Extract current air quality
             current = data.get("current", {})
@@ -88,10 +118,12 @@ class AirQualityClient:
                 hourly_times, hourly_aqi, hourly_pm25, hourly_pm10
             )
 
-            return {
+            result = {
                 "current": current_aqi,
                 "daily_forecast": daily_forecast,
             }
+            self._cache[self._cache_key] = (time.monotonic() + _CACHE_TTL, result)
+            return result
 
         except aiohttp.ClientError as err:
             raise AirQualityApiError(f"Error communicating with Air Quality API: {err}") from err
@@ -116,21 +148,24 @@ class AirQualityClient:
         Returns:
             List of daily aggregated data (max values per day)
         """
-        from datetime import datetime
-
         if not hourly_times or not hourly_aqi:
             return []
 
         daily_data = {}
+        series = (
+            ("aqi_max", hourly_aqi),
+            ("pm25_max", hourly_pm25),
+            ("pm10_max", hourly_pm10),
+        )
 
         for i, time_str in enumerate(hourly_times):
-            # Parse datetime and extract date
-            dt = datetime.fromisoformat(time_str.replace("Z", "+00:00"))
-            date_key = dt.date().isoformat()
+            # Open-Meteo times are "YYYY-MM-DDTHH:MM", so the date is the first 10 chars
+            date_key = time_str[:10]
 
             # Initialize day if not exists
-            if date_key not in daily_data:
-                daily_data[date_key] = {
+            day = daily_data.get(date_key)
+            if day is None:
+                day = daily_data[date_key] = {
                     "date": date_key,
                     "aqi_max": None,
                     "pm25_max": None,
@@ -138,20 +173,13 @@ class AirQualityClient:
                 }
 
             # Update max values for the day
-            if i < len(hourly_aqi) and hourly_aqi[i] is not None:
-                current_max = daily_data[date_key]["aqi_max"]
-                if current_max is None or hourly_aqi[i] > current_max:
-                    daily_data[date_key]["aqi_max"] = hourly_aqi[i]
-
-            if i < len(hourly_pm25) and hourly_pm25[i] is not None:
-                current_max = daily_data[date_key]["pm25_max"]
-                if current_max is None or hourly_pm25[i] > current_max:
-                    daily_data[date_key]["pm25_max"] = hourly_pm25[i]
-
-            if i < len(hourly_pm10) and hourly_pm10[i] is not None:
-                current_max = daily_data[date_key]["pm10_max"]
-                if current_max is None or hourly_pm10[i] > current_max:
-                    daily_data[date_key]["pm10_max"] = hourly_pm10[i]
+            for key, values in series:
+                if i < len(values):
+                    value = values[i]
+                    if value is not None:
+                        current_max = day[key]
+                        if current_max is None or value > current_max:
+                            day[key] = value
 
         # Convert to sorted list (by date)
         return [daily_data[date] for date in sorted(daily_data.keys())]
@@ -0,0 +1,43 @@
+"""Shared HTTP session handling for Serac API clients."""
+from __future__ import annotations
+
+import aiohttp
+
+
+class BaseApiClient:
+    """Base for API clients using an injected or lazily owned aiohttp session."""
+
+    def __init__(self, session: aiohttp.ClientSession | None = None) -> None:
+        """Initialize the client.
+
+        Args:
+            session: Shared aiohttp session (a private one is created if omitted)
+        """
+        self._session = session
+        self._owns_session = False
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the HTTP session, creating an owned one if none was injected.
+
+        Returns:
+            Shared aiohttp client session
+        """
+        if self._session is None or self._session.closed:
+            # Keep DNS results and idle connections between polls
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit_per_host=8,
+                    use_dns_cache=True,
+                    ttl_dns_cache=600,
+                    keepalive_timeout=60,
+                )
+            )
+            self._owns_session = True
+        return self._session
+
+    async def async_close(self) -> None:
+        """Close the HTTP session if it is owned by this client."""
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+        self._session = None
+        self._owns_session = False
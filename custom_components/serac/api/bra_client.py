@@ -1,33 +1,50 @@
 """BRA (Bulletin de Risque d'Avalanche) API client for Météo-France."""
 from __future__ import annotations
 
+import io
 import logging
 from typing import Any
 from xml.etree import ElementTree as ET
 
 import aiohttp
 
+from .base import BaseApiClient
+
 _LOGGER = logging.getLogger(__name__)
 
+# BRA risk levels are single digits on the European 1-5 scale
+_RISK_LEVEL_MAP: dict[str | None, int | None] = {
+    "1": 1,
+    "2": 2,
+    "3": 3,
+    "4": 4,
+    "5": 5,
+    "": None,
+    None: None,
+}
+
 
 class BraApiError(Exception):
     """Exception raised for BRA API errors."""
 
 
-class BraClient:
+class BraClient(BaseApiClient):
     """Client for Météo-France BRA API."""
 
     def __init__(
         self,
         api_key: str,
         massif_id: str | int,
+        session: aiohttp.ClientSession | None = None,
     ) -> None:
         """Initialize the BRA client.
 
         Args:
             api_key: Météo-France API key
             massif_id: Massif identifier (numeric: 1=Chablais, 2=Aravis, 3=Mont-Blanc)
+            session: Shared aiohttp session (a private one is created if omitted)
         """
+        super().__init__(session)
         self._api_key = api_key
         self._massif_id = str(massif_id)  # Convert to string for API
         self._api_base_url = "https://public-api.meteofrance.fr/public/DPBRA/v1"
@@ -52,20 +69,20 @@ class BraClient:
                 "format": "xml",
             }
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url,
-                    headers=headers,
-                    params=params,
-                    timeout=aiohttp.ClientTimeout(total=30),
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        raise BraApiError(
-                            f"Failed to get bulletin: {response.status} - {error_text}"
-                        )
-
-                    xml_content = await response.text()
+            session = await self._get_session()
+            async with session.get(
+                url,
+                headers=headers,
+                params=params,
+                timeout=aiohttp.ClientTimeout(total=30),
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    raise BraApiError(
+                        f"Failed to get bulletin: {response.status} - {error_text}"
+                    )
+
+                xml_content = await response.read()
 
             # Parse XML and extract data
             return self._parse_bulletin_xml(xml_content)
@@ -77,24 +94,36 @@ class BraClient:
         except Exception as err:
             raise BraApiError(f"Unexpected error fetching bulletin: {err}") from err
 
-    def _parse_bulletin_xml(self, xml_content: str) -> dict[str, Any]:
+    def _parse_bulletin_xml(self, xml_content: bytes) -> dict[str, Any]:
         """Parse BRA XML bulletin into structured data.
 
+        Only the root attributes and the CARTOUCHERISQUE subtree are needed,
+        so parsing stops as soon as the cartridge has been read.
+
         Args:
-            xml_content: Raw XML string from API
+            xml_content: Raw XML bytes from API
 
         Returns:
             Dictionary with bulletin data
         """
         try:
-            root = ET.fromstring(xml_content)
+            root = None
+            cartouche = None
+            for event, elem in ET.iterparse(
+                io.BytesIO(xml_content), events=("start", "end")
+            ):
+                if root is None:
+                    # First start event is the document root
+                    root = elem
+                elif event == "end" and elem.tag == "CARTOUCHERISQUE":
+                    cartouche = elem
+                    break
 
             # Extract bulletin metadata
             bulletin_date = root.attrib.get("DATEBULLETIN")
             massif_name = root.attrib.get("MASSIF")
 
             # Find risk cartridge
-            cartouche = root.find(".//CARTOUCHERISQUE")
             if cartouche is None:
                 _LOGGER.warning("No CARTOUCHERISQUE found in bulletin")
                 return {
@@ -131,19 +160,24 @@ class BraClient:
             # Extract warning/notice
             avis = cartouche.findtext("AVIS", default="")
 
+            try:
+                altitude = int(altitude_limit)
+            except (TypeError, ValueError):
+                altitude = None
+
             # Build result dictionary
             result = {
                 "bulletin_date": bulletin_date,
                 "massif_name": massif_name,
                 "has_data": True,
                 # Current risk (J+1)
-                "risk_max": int(risk_max) if risk_max else None,
-                "risk_high_altitude": int(risk_1) if risk_1 else None,
-                "risk_low_altitude": int(risk_2) if risk_2 else None,
-                "altitude_limit": int(altitude_limit) if altitude_limit else None,
+                "risk_max": _RISK_LEVEL_MAP.get(risk_max),
+                "risk_high_altitude": _RISK_LEVEL_MAP.get(risk_1),
+                "risk_low_altitude": _RISK_LEVEL_MAP.get(risk_2),
+                "altitude_limit": altitude,
                 "risk_comment": commentaire.strip(),
                 # Tomorrow risk (J+2)
-                "risk_max_j2": int(risk_max_j2) if risk_max_j2 else None,
+                "risk_max_j2": _RISK_LEVEL_MAP.get(risk_max_j2),
                 "date_risk_j2": date_risk_j2,
                 "risk_j2_text": risque_j2_text.strip(),
                 "risk_j2_comment": commentaire_j2.strip(),
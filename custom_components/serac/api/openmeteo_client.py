@@ -2,86 +2,223 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timedelta, timezone, tzinfo
 import logging
+import time
 from typing import Any
 
 import aiohttp
+import orjson
+
+from .base import BaseApiClient
 
 _LOGGER = logging.getLogger(__name__)
 
+# Fields requested in the forecast bundle
+_CURRENT_FIELDS = (
+    "temperature_2m,relative_humidity_2m,pressure_msl,"
+    "wind_speed_10m,wind_direction_10m,wind_gusts_10m,cloud_cover,"
+    "is_day,precipitation,rain,showers,snowfall"
+)
+_HOURLY_FIELDS = (
+    "temperature_2m,precipitation,weather_code,cloud_cover,"
+    "wind_speed_10m,wind_gusts_10m,wind_direction_10m,snowfall,rain"
+)
+_DAILY_FIELDS = (
+    "temperature_2m_max,temperature_2m_min,precipitation_sum,"
+    "weather_code,wind_speed_10m_max,wind_gusts_10m_max,wind_direction_10m_dominant,"
+    "sunrise,sunset,sunshine_duration,daylight_duration,uv_index_max,"
+    "rain_sum,showers_sum,snowfall_sum,precipitation_hours"
+)
+
+_ONE_HOUR = timedelta(hours=1)
+_ONE_DAY = timedelta(days=1)
+
+# Open-Meteo refreshes at most hourly; a payload this recent is reused without
+# a request (manual refreshes, reloads, entries sharing the client)
+_FRESH_FOR = 300
+
+
+def _build_weather_code_table() -> tuple[str, ...]:
+    """Build the WMO weather code -> Home Assistant condition table.
+
+    WMO Weather interpretation codes: https://open-meteo.com/en/docs
+    """
+    table = ["partlycloudy"] * 100
+    for codes, condition in (
+        ((0,), "sunny"),
+        ((1, 2), "partlycloudy"),
+        ((3,), "cloudy"),
+        ((45, 48), "fog"),
+        ((51, 53, 55, 56, 57), "rainy"),
+        ((61, 63, 65, 66, 67, 80, 81, 82), "pouring"),
+        ((71, 73, 75, 77, 85, 86), "snowy"),
+        ((95, 96, 99), "lightning-rainy"),
+    ):
+        for code in codes:
+            table[code] = condition
+    return tuple(table)
+
+
+_WEATHER_CODE_CONDITIONS = _build_weather_code_table()
+
+# Condition per 10% cloud cover bucket (0-9%, 10-19%, ..., 100%)
+_CLOUD_COVER_CONDITIONS = (
+    ("sunny",) * 2 + ("partlycloudy",) * 3 + ("cloudy",) * 6
+)
+
 
 class OpenMeteoApiError(Exception):
     """Exception raised for Open-Meteo API errors."""
 
 
-class OpenMeteoClient:
+class OpenMeteoClient(BaseApiClient):
     """Client for Open-Meteo API (uses Météo-France models for France)."""
 
     def __init__(
         self,
         latitude: float,
         longitude: float,
+        session: aiohttp.ClientSession | None = None,
     ) -> None:
         """Initialize the Open-Meteo client.
 
         Args:
             latitude: Location latitude
             longitude: Location longitude
+            session: Shared aiohttp session (a private one is created if omitted)
         """
+        super().__init__(session)
         self._latitude = latitude
         self._longitude = longitude
         self._base_url = "https://api.open-meteo.com/v1/forecast"
-
-    async def async_get_current_weather(self) -> dict[str, Any]:
-        """Get current weather conditions.
+        self._params = {
+            "latitude": latitude,
+            "longitude": longitude,
+            "current": _CURRENT_FIELDS,
+            "hourly": _HOURLY_FIELDS,
+            "daily": _DAILY_FIELDS,
+            "timezone": "auto",
+            "forecast_days": 8,
+        }
+        # In-flight bundle request shared by concurrent callers
+        self._bundle_task: asyncio.Task[dict[str, Any]] | None = None
+        # Validators and payload of the last response for conditional requests
+        self._etag: str | None = None
+        self._last_modified: str | None = None
+        self._last_data: dict[str, Any] | None = None
+        self._last_fetched: float | None = None
+        # Elevation is fixed for the coordinates, so it is kept once known
+        self._elevation: float | None = None
+
+    async def async_get_bundle(self) -> dict[str, Any]:
+        """Fetch current, daily and hourly data in a single request.
 
         Returns:
-            Dictionary with current weather data
+            Dictionary with current, daily_forecast, hourly_forecast, hourly_6h
+            and additional (elevation) data
+
+        Raises:
+            OpenMeteoApiError: If the request fails or returns invalid JSON
         """
+        if (
+            self._last_data is not None
+            and self._last_fetched is not None
+            and time.monotonic() - self._last_fetched < _FRESH_FOR
+        ):
+            _LOGGER.debug("Forecast fetched less than %ds ago, reusing last payload", _FRESH_FOR)
+            return self._parse_bundle(self._last_data)
+
         try:
-            async with aiohttp.ClientSession() as session:
-                params = {
-                    "latitude": self._latitude,
-                    "longitude": self._longitude,
-                    "current": "temperature_2m,relative_humidity_2m,pressure_msl,"
-                    "wind_speed_10m,wind_direction_10m,wind_gusts_10m,cloud_cover,"
-                    "is_day,precipitation,rain,showers,snowfall",
-                    "timezone": "auto",
-                }
-
-                async with session.get(
-                    self._base_url, params=params, timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
+            session = await self._get_session()
+            # Accept-Encoding is left to aiohttp: it advertises gzip/deflate
+            # (plus br when a Brotli decoder is installed) and decompresses
+            # transparently, so orjson parses the decompressed bytes directly
+            headers = {}
+            if self._last_data is not None:
+                if self._etag:
+                    headers["If-None-Match"] = self._etag
+                if self._last_modified:
+                    headers["If-Modified-Since"] = self._last_modified
+
+            async with session.get(
+                self._base_url,
+                params=self._params,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=30),
+            ) as response:
+                if response.status == 304:
+                    # Only conditional requests can get a 304, and those are
+                    # only sent once a payload is held
+                    if self._last_data is None:
+                        raise OpenMeteoApiError("Not modified (304) without a cached forecast")
+                    _LOGGER.debug("Forecast unchanged (304), reusing last payload")
+                    data = self._last_data
+                else:
                     response.raise_for_status()
-                    data = await response.json()
-
-                    current = data.get("current", {})
-
-                    return {
-                        "condition": self._map_condition(current),
-                        "temperature": current.get("temperature_2m"),
-                        "humidity": current.get("relative_humidity_2m"),
-                        "pressure": current.get("pressure_msl"),
-                        "wind_speed": current.get("wind_speed_10m"),
-                        "wind_bearing": current.get("wind_direction_10m"),
-                        "wind_gust": current.get("wind_gusts_10m"),
-                        "cloud_coverage": current.get("cloud_cover"),
-                        "is_day": current.get("is_day", 1) == 1,
-                        "precipitation": current.get("precipitation"),
-                        "rain": current.get("rain"),
-                        "showers": current.get("showers"),
-                        "snowfall": current.get("snowfall"),
-                        "visibility": None,  # Not provided by Open-Meteo
-                        "timestamp": current.get("time"),
-                    }
+                    data = orjson.loads(await response.read())
+                    self._etag = response.headers.get("ETag")
+                    self._last_modified = response.headers.get("Last-Modified")
+                    self._last_data = data
+                self._last_fetched = time.monotonic()
 
         except aiohttp.ClientError as err:
-            _LOGGER.error("Network error getting current weather: %s", err, exc_info=True)
+            _LOGGER.error("Network error getting forecast data: %s", err, exc_info=True)
             raise OpenMeteoApiError(f"Network error: {err}") from err
-        except Exception as err:
-            _LOGGER.error("Error getting current weather: %s (type: %s)", err, type(err).__name__, exc_info=True)
-            raise OpenMeteoApiError(f"Failed to get current weather: {err}") from err
+        except asyncio.TimeoutError as err:
+            _LOGGER.error("Timeout getting forecast data")
+            raise OpenMeteoApiError("Timeout getting forecast data") from err
+        except orjson.JSONDecodeError as err:
+            _LOGGER.error("Invalid JSON in forecast response: %s", err)
+            raise OpenMeteoApiError(f"Invalid response: {err}") from err
+
+        return self._parse_bundle(data)
+
+    def _parse_bundle(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Parse a forecast payload into the bundle sections.
+
+        Always re-parsed, even for a reused payload: hourly sections depend on
+        the current time. Parsers tolerate missing columns, so no catch-all is
+        needed here.
+
+        Args:
+            data: Decoded forecast response
+
+        Returns:
+            Bundle dictionary as returned by async_get_bundle
+        """
+        return {
+            "current": self._parse_current(data),
+            "daily_forecast": self._parse_daily(data),
+            "hourly_forecast": self._parse_hourly(data),
+            "hourly_6h": self._parse_hourly_6h(data),
+            "additional": {
+                "elevation": self._get_elevation(data),
+            },
+        }
+
+    async def _async_get_bundle_shared(self) -> dict[str, Any]:
+        """Return the bundle, joining a request that is already in flight.
+
+        The coordinator calls the per-section methods concurrently, so they
+        all resolve from one HTTP request.
+
+        Returns:
+            Bundle dictionary from async_get_bundle
+        """
+        task = self._bundle_task
+        if task is None or task.done():
+            task = self._bundle_task = asyncio.ensure_future(self.async_get_bundle())
+        # Shield so a cancelled caller doesn't cancel the request for the others
+        return await asyncio.shield(task)
+
+    async def async_get_current_weather(self) -> dict[str, Any]:
+        """Get current weather conditions.
+
+        Returns:
+            Dictionary with current weather data
+        """
+        return (await self._async_get_bundle_shared())["current"]
 
     async def async_get_daily_forecast(self) -> list[dict[str, Any]]:
         """Get daily forecast for 8 days (today + 7 next days).
@@ -89,74 +226,7 @@ class OpenMeteoClient:
         Returns:
             List of daily forecast dictionaries
         """
-        try:
-            async with aiohttp.ClientSession() as session:
-                params = {
-                    "latitude": self._latitude,
-                    "longitude": self._longitude,
-                    "daily": "temperature_2m_max,temperature_2m_min,precipitation_sum,"
-                    "weather_code,wind_speed_10m_max,wind_gusts_10m_max,wind_direction_10m_dominant,"
-                    "sunrise,sunset,sunshine_duration,daylight_duration,uv_index_max,"
-                    "rain_sum,showers_sum,snowfall_sum,precipitation_hours",
-                    "timezone": "auto",
-                    "forecast_days": 8,
-                }
-
-                async with session.get(
-                    self._base_url, params=params, timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-                    response.raise_for_status()
-                    data = await response.json()
-
-                    daily = data.get("daily", {})
-                    daily_forecasts = []
-
-                    times = daily.get("time", [])
-                    for i in range(len(times)):
-                        dt = datetime.fromisoformat(times[i])
-
-                        # Parse sunrise/sunset
-                        sunrise_str = daily.get("sunrise", [None])[i]
-                        sunset_str = daily.get("sunset", [None])[i]
-                        sunrise = datetime.fromisoformat(sunrise_str) if sunrise_str else None
-                        sunset = datetime.fromisoformat(sunset_str) if sunset_str else None
-
-                        # Ensure timezone awareness for sunrise/sunset
-                        if sunrise and sunrise.tzinfo is None:
-                            sunrise = sunrise.replace(tzinfo=timezone.utc)
-                        if sunset and sunset.tzinfo is None:
-                            sunset = sunset.replace(tzinfo=timezone.utc)
-
-                        daily_forecasts.append({
-                            "datetime": dt.isoformat(),
-                            "temperature": daily["temperature_2m_max"][i],
-                            "templow": daily["temperature_2m_min"][i],
-                            "precipitation_sum": daily["precipitation_sum"][i],
-                            "precipitation": daily["precipitation_sum"][i],  # Keep for backward compatibility
-                            "precipitation_probability": None,  # Not in daily
-                            "condition": self._map_weather_code(daily.get("weather_code", [None])[i]),
-                            "wind_speed": daily.get("wind_speed_10m_max", [None])[i],
-                            "wind_gust_speed": daily.get("wind_gusts_10m_max", [None])[i],
-                            "wind_bearing": daily.get("wind_direction_10m_dominant", [None])[i],
-                            "sunrise": sunrise,
-                            "sunset": sunset,
-                            "sunshine_duration": daily.get("sunshine_duration", [None])[i],
-                            "daylight_duration": daily.get("daylight_duration", [None])[i],
-                            "uv_index": daily.get("uv_index_max", [None])[i],
-                            "rain_sum": daily.get("rain_sum", [None])[i],
-                            "showers_sum": daily.get("showers_sum", [None])[i],
-                            "snowfall_sum": daily.get("snowfall_sum", [None])[i],
-                            "precipitation_hours": daily.get("precipitation_hours", [None])[i],
-                        })
-
-                    return daily_forecasts
-
-        except aiohttp.ClientError as err:
-            _LOGGER.error("Network error getting daily forecast: %s", err, exc_info=True)
-            raise OpenMeteoApiError(f"Network error: {err}") from err
-        except Exception as err:
-            _LOGGER.error("Error getting daily forecast: %s", err, exc_info=True)
-            raise OpenMeteoApiError(f"Failed to get daily forecast: {err}") from err
+        return (await self._async_get_bundle_shared())["daily_forecast"]
 
     async def async_get_hourly_forecast(self) -> list[dict[str, Any]]:
         """Get hourly forecast for 48 hours (future hours only).
@@ -164,69 +234,7 @@ class OpenMeteoClient:
         Returns:
             List of hourly forecast dictionaries
         """
-        try:
-            async with aiohttp.ClientSession() as session:
-                params = {
-                    "latitude": self._latitude,
-                    "longitude": self._longitude,
-                    "hourly": "temperature_2m,precipitation,weather_code,cloud_cover,"
-                    "wind_speed_10m,wind_gusts_10m,wind_direction_10m",
-                    "timezone": "auto",
-                    "forecast_days": 3,  # 72 hours to ensure we get 48+
-                }
-
-                async with session.get(
-                    self._base_url, params=params, timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-                    response.raise_for_status()
-                    data = await response.json()
-
-                    hourly = data.get("hourly", {})
-                    hourly_forecasts = []
-
-                    times = hourly.get("time", [])
-
-                    # Get current time for comparison
-                    # Parse first datetime to get timezone info
-                    if not times:
-                        return []
-
-                    first_dt = datetime.fromisoformat(times[0])
-                    # Use the same timezone as the forecast data
-                    if first_dt.tzinfo:
-                        now = datetime.now(tz=first_dt.tzinfo)
-                    else:
-                        now = datetime.now()
-
-                    for i in range(len(times)):
-                        dt = datetime.fromisoformat(times[i])
-
-                        # Only include future hours
-                        if dt > now:
-                            hourly_forecasts.append({
-                                "datetime": dt,  # Keep as datetime for processing
-                                "temperature": hourly["temperature_2m"][i],
-                                "precipitation": hourly["precipitation"][i],
-                                "precipitation_probability": None,  # Not in hourly
-                                "condition": self._map_weather_code(hourly.get("weather_code", [None])[i]),
-                                "wind_speed": hourly["wind_speed_10m"][i],
-                                "wind_gust_speed": hourly["wind_gusts_10m"][i],
-                                "wind_bearing": hourly["wind_direction_10m"][i],
-                                "cloud_coverage": hourly.get("cloud_cover", [None])[i],
-                            })
-
-                            # Stop after collecting 48 future hours
-                            if len(hourly_forecasts) >= 48:
-                                break
-
-                    return hourly_forecasts
-
-        except aiohttp.ClientError as err:
-            _LOGGER.error("Network error getting hourly forecast: %s", err, exc_info=True)
-            raise OpenMeteoApiError(f"Network error: {err}") from err
-        except Exception as err:
-            _LOGGER.error("Error getting hourly forecast: %s", err, exc_info=True)
-            raise OpenMeteoApiError(f"Failed to get hourly forecast: {err}") from err
+        return (await self._async_get_bundle_shared())["hourly_forecast"]
 
     async def async_get_hourly_6h(self) -> list[dict[str, Any]]:
         """Get hourly forecast for next 6 hours.
@@ -234,70 +242,7 @@ class OpenMeteoClient:
         Returns:
             List of hourly forecast dictionaries for next 6 hours
         """
-        try:
-            async with aiohttp.ClientSession() as session:
-                params = {
-                    "latitude": self._latitude,
-                    "longitude": self._longitude,
-                    "hourly": "temperature_2m,wind_speed_10m,wind_gusts_10m,cloud_cover,"
-                    "snowfall,rain,precipitation",
-                    "timezone": "auto",
-                    "forecast_days": 1,  # Only need today's data
-                }
-
-                async with session.get(
-                    self._base_url, params=params, timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-                    response.raise_for_status()
-                    data = await response.json()
-
-                    hourly = data.get("hourly", {})
-                    hourly_6h = []
-
-                    times = hourly.get("time", [])
-
-                    # Get current time for comparison
-                    if not times:
-                        return []
-
-                    first_dt = datetime.fromisoformat(times[0])
-                    # Use the same timezone as the forecast data
-                    if first_dt.tzinfo:
-                        now = datetime.now(tz=first_dt.tzinfo)
-                    else:
-                        now = datetime.now()
-
-                    hour_count = 0
-                    for i in range(len(times)):
-                        dt = datetime.fromisoformat(times[i])
-
-                        # Only include future hours
-                        if dt > now:
-                            hour_count += 1
-                            hourly_6h.append({
-                                "hour": hour_count,
-                                "datetime": dt,
-                                "temperature": hourly["temperature_2m"][i],
-                                "wind_speed": hourly["wind_speed_10m"][i],
-                                "wind_gust": hourly["wind_gusts_10m"][i],
-                                "cloud_cover": hourly.get("cloud_cover", [None])[i],
-                                "snowfall": hourly.get("snowfall", [None])[i],
-                                "rain": hourly.get("rain", [None])[i],
-                                "precipitation": hourly.get("precipitation", [None])[i],
-                            })
-
-                            # Stop after collecting 6 future hours
-                            if hour_count >= 6:
-                                break
-
-                    return hourly_6h
-
-        except aiohttp.ClientError as err:
-            _LOGGER.error("Network error getting hourly 6h forecast: %s", err, exc_info=True)
-            raise OpenMeteoApiError(f"Network error: {err}") from err
-        except Exception as err:
-            _LOGGER.error("Error getting hourly 6h forecast: %s", err, exc_info=True)
-            raise OpenMeteoApiError(f"Failed to get hourly 6h forecast: {err}") from err
+        return (await self._async_get_bundle_shared())["hourly_6h"]
 
     async def async_get_additional_data(self) -> dict[str, Any]:
         """Get additional weather data (elevation only).
@@ -305,33 +250,295 @@ class OpenMeteoClient:
         Returns:
             Dictionary with elevation data
         """
-        try:
-            async with aiohttp.ClientSession() as session:
-                params = {
-                    "latitude": self._latitude,
-                    "longitude": self._longitude,
-                    "timezone": "auto",
-                }
-
-                async with session.get(
-                    self._base_url, params=params, timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-                    response.raise_for_status()
-                    data = await response.json()
+        if self._elevation is not None:
+            return {"elevation": self._elevation}
+        return (await self._async_get_bundle_shared())["additional"]
 
-                    # Get elevation from response
-                    elevation = data.get("elevation", 0)
+    def _get_elevation(self, data: dict[str, Any]) -> float:
+        """Return the cached elevation, caching it from the response if needed.
 
-                    return {
-                        "elevation": elevation,
-                    }
+        Args:
+            data: Decoded Open-Meteo response
 
-        except aiohttp.ClientError as err:
-            _LOGGER.error("Network error getting additional data: %s", err, exc_info=True)
-            raise OpenMeteoApiError(f"Network error: {err}") from err
-        except Exception as err:
-            _LOGGER.error("Error getting additional data: %s", err, exc_info=True)
-            raise OpenMeteoApiError(f"Failed to get additional data: {err}") from err
+        Returns:
+            Elevation in meters
+        """
+        if self._elevation is None and data.get("elevation") is not None:
+            self._elevation = data["elevation"]
+        return self._elevation if self._elevation is not None else 0
+
+    def _parse_current(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Extract current conditions from an API response.
+
+        Args:
+            data: Decoded Open-Meteo response
+
+        Returns:
+            Dictionary with current weather data
+        """
+        current = data.get("current", {})
+
+        return {
+            "condition": self._map_condition(current),
+            "temperature": current.get("temperature_2m"),
+            "humidity": current.get("relative_humidity_2m"),
+            "pressure": current.get("pressure_msl"),
+            "wind_speed": current.get("wind_speed_10m"),
+            "wind_bearing": current.get("wind_direction_10m"),
+            "wind_gust": current.get("wind_gusts_10m"),
+            "cloud_coverage": current.get("cloud_cover"),
+            "is_day": current.get("is_day", 1) == 1,
+            "precipitation": current.get("precipitation"),
+            "rain": current.get("rain"),
+            "showers": current.get("showers"),
+            "snowfall": current.get("snowfall"),
+            "visibility": None,  # Not provided by Open-Meteo
+            "timestamp": current.get("time"),
+        }
+
+    def _parse_daily(self, data: dict[str, Any]) -> list[dict[str, Any]]:
+        """Extract the daily forecast from an API response.
+
+        Args:
+            data: Decoded Open-Meteo response
+
+        Returns:
+            List of daily forecast dictionaries
+        """
+        daily = data.get("daily", {})
+        times = daily.get("time", [])
+        missing = [None] * len(times)
+
+        def column(key: str) -> list[Any]:
+            return daily.get(key) or missing
+
+        base = self._regular_series_start(times, _ONE_DAY)
+        if base is not None:
+            step = _ONE_DAY
+            datetimes = [base + step * i for i in range(len(times))]
+        else:
+            datetimes = [datetime.fromisoformat(t) for t in times]
+
+        # All rows share the response timezone; naive times are treated as UTC
+        sun_tz = (datetimes[0].tzinfo if datetimes else None) or timezone.utc
+        parse_sun = self._parse_sun_time
+        map_code = self._map_weather_code
+
+        # Open-Meteo returns columns, so zip them into rows in one pass
+        return [
+            {
+                "datetime": dt.isoformat(),
+                "temperature": temp_max,
+                "templow": temp_min,
+                "precipitation_sum": precip,
+                "precipitation": precip,  # Keep for backward compatibility
+                "precipitation_probability": None,  # Not in daily
+                "condition": map_code(code),
+                "wind_speed": wind_speed,
+                "wind_gust_speed": wind_gust,
+                "wind_bearing": wind_bearing,
+                "sunrise": parse_sun(sunrise, sun_tz),
+                "sunset": parse_sun(sunset, sun_tz),
+                "sunshine_duration": sunshine,
+                "daylight_duration": daylight,
+                "uv_index": uv_index,
+                "rain_sum": rain,
+                "showers_sum": showers,
+                "snowfall_sum": snowfall,
+                "precipitation_hours": precip_hours,
+            }
+            for (
+                dt, temp_max, temp_min, precip, code, wind_speed, wind_gust,
+                wind_bearing, sunrise, sunset, sunshine, daylight, uv_index,
+                rain, showers, snowfall, precip_hours,
+            ) in zip(
+                datetimes,
+                column("temperature_2m_max"),
+                column("temperature_2m_min"),
+                column("precipitation_sum"),
+                column("weather_code"),
+                column("wind_speed_10m_max"),
+                column("wind_gusts_10m_max"),
+                column("wind_direction_10m_dominant"),
+                column("sunrise"),
+                column("sunset"),
+                column("sunshine_duration"),
+                column("daylight_duration"),
+                column("uv_index_max"),
+                column("rain_sum"),
+                column("showers_sum"),
+                column("snowfall_sum"),
+                column("precipitation_hours"),
+            )
+        ]
+
+    def _parse_hourly(self, data: dict[str, Any]) -> list[dict[str, Any]]:
+        """Extract the next 48 future hours from an API response.
+
+        Args:
+            data: Decoded Open-Meteo response
+
+        Returns:
+            List of hourly forecast dictionaries
+        """
+        hourly = data.get("hourly", {})
+        times = hourly.get("time", [])
+        rows = self._future_hours(times, 48)
+        if not rows:
+            return []
+
+        missing = [None] * len(times)
+        temperature = hourly.get("temperature_2m") or missing
+        precipitation = hourly.get("precipitation") or missing
+        codes = hourly.get("weather_code") or missing
+        wind_speed = hourly.get("wind_speed_10m") or missing
+        wind_gust = hourly.get("wind_gusts_10m") or missing
+        wind_bearing = hourly.get("wind_direction_10m") or missing
+        cloud_cover = hourly.get("cloud_cover") or missing
+        map_code = self._map_weather_code
+
+        return [
+            {
+                "datetime": times[i],  # ISO string as returned by the API
+                "temperature": temperature[i],
+                "precipitation": precipitation[i],
+                "precipitation_probability": None,  # Not in hourly
+                "condition": map_code(codes[i]),
+                "wind_speed": wind_speed[i],
+                "wind_gust_speed": wind_gust[i],
+                "wind_bearing": wind_bearing[i],
+                "cloud_coverage": cloud_cover[i],
+            }
+            for i, _ in rows
+        ]
+
+    def _parse_hourly_6h(self, data: dict[str, Any]) -> list[dict[str, Any]]:
+        """Extract the next 6 future hours from an API response.
+
+        Args:
+            data: Decoded Open-Meteo response
+
+        Returns:
+            List of hourly forecast dictionaries for next 6 hours
+        """
+        hourly = data.get("hourly", {})
+        rows = self._future_hours(hourly.get("time", []), 6)
+        if not rows:
+            return []
+
+        missing = [None] * len(hourly["time"])
+        temperature = hourly.get("temperature_2m") or missing
+        wind_speed = hourly.get("wind_speed_10m") or missing
+        wind_gust = hourly.get("wind_gusts_10m") or missing
+        cloud_cover = hourly.get("cloud_cover") or missing
+        snowfall = hourly.get("snowfall") or missing
+        rain = hourly.get("rain") or missing
+        precipitation = hourly.get("precipitation") or missing
+
+        return [
+            {
+                "hour": hour,
+                "datetime": dt,
+                "temperature": temperature[i],
+                "wind_speed": wind_speed[i],
+                "wind_gust": wind_gust[i],
+                "cloud_cover": cloud_cover[i],
+                "snowfall": snowfall[i],
+                "rain": rain[i],
+                "precipitation": precipitation[i],
+            }
+            for hour, (i, dt) in enumerate(rows, start=1)
+        ]
+
+    def _future_hours(self, times: list[str], limit: int) -> list[tuple[int, datetime]]:
+        """Select the first future rows of an hourly series.
+
+        Args:
+            times: Hourly ISO 8601 timestamps from the API
+            limit: Maximum number of rows to return
+
+        Returns:
+            List of (row index, timestamp) for up to limit hours after now
+        """
+        if not times:
+            return []
+
+        parse = datetime.fromisoformat
+        base = self._regular_series_start(times, _ONE_HOUR)
+        # Reuse the already parsed first row to pick the timezone
+        first_dt = base if base is not None else parse(times[0])
+        # Use the same timezone as the forecast data
+        if first_dt.tzinfo:
+            now = datetime.now(tz=first_dt.tzinfo)
+        else:
+            now = datetime.now()
+
+        if base is not None:
+            # Jump straight to the first future hour when the series is regular
+            start = self._first_future_index(base, now)
+            step = _ONE_HOUR
+            return [
+                (i, base + step * i)
+                for i in range(start, min(start + limit, len(times)))
+            ]
+
+        rows: list[tuple[int, datetime]] = []
+        append = rows.append
+        for i, time_str in enumerate(times):
+            dt = parse(time_str)
+            if dt > now:
+                append((i, dt))
+                if len(rows) >= limit:
+                    break
+        return rows
+
+    @staticmethod
+    def _parse_sun_time(value: str | None, tz: tzinfo) -> datetime | None:
+        """Parse a sunrise/sunset timestamp in the response timezone.
+
+        Args:
+            value: ISO 8601 timestamp or None
+            tz: Timezone of the daily series
+
+        Returns:
+            Timezone-aware datetime or None
+        """
+        return datetime.fromisoformat(value).replace(tzinfo=tz) if value else None
+
+    @staticmethod
+    def _regular_series_start(times: list[str], step: timedelta) -> datetime | None:
+        """Return the first timestamp if the series is evenly spaced.
+
+        Open-Meteo series are regular, so rows can be derived from the first
+        timestamp instead of parsing each one. Local-time series that cross a
+        DST change are not evenly spaced and fall back to per-row parsing.
+
+        Args:
+            times: ISO 8601 timestamps from the API
+            step: Expected spacing between rows
+
+        Returns:
+            First timestamp, or None if rows must be parsed individually
+        """
+        if not times:
+            return None
+        base = datetime.fromisoformat(times[0])
+        if base + step * (len(times) - 1) != datetime.fromisoformat(times[-1]):
+            return None
+        return base
+
+    @staticmethod
+    def _first_future_index(base: datetime, now: datetime) -> int:
+        """Return the index of the first hourly row after now.
+
+        Args:
+            base: Timestamp of the first row of an evenly spaced hourly series
+            now: Current time in the series timezone
+
+        Returns:
+            Index of the first row strictly later than now
+        """
+        return max(0, int((now - base) // _ONE_HOUR) + 1)
 
     @staticmethod
     def _map_weather_code(code: int | None) -> str:
@@ -345,27 +552,9 @@ class OpenMeteoClient:
         """
         if code is None:
             return "unknown"
-
-        # WMO Weather interpretation codes
-        # https://open-meteo.com/en/docs
-        if code == 0:
-            return "sunny"
-        elif code in (1, 2):
-            return "partlycloudy"
-        elif code == 3:
-            return "cloudy"
-        elif code in (45, 48):
-            return "fog"
-        elif code in (51, 53, 55, 56, 57):
-            return "rainy"
-        elif code in (61, 63, 65, 66, 67, 80, 81, 82):
-            return "pouring"
-        elif code in (71, 73, 75, 77, 85, 86):
-            return "snowy"
-        elif code in (95, 96, 99):
-            return "lightning-rainy"
-        else:
-            return "partlycloudy"
+        if 0 <= code < len(_WEATHER_CODE_CONDITIONS):
+            return _WEATHER_CODE_CONDITIONS[code]
+        return "partlycloudy"
 
     @staticmethod
     def _map_condition(current: dict) -> str:
@@ -378,11 +567,10 @@ class OpenMeteoClient:
             Home Assistant weather condition
         """
         # Open-Meteo doesn't provide weather code in current, so we use cloud cover
-        cloud_cover = current.get("cloud_cover", 50)
+        cloud_cover = current.get("cloud_cover")
+        if cloud_cover is None:
+            cloud_cover = 50
 
-        if cloud_cover < 20:
-            return "sunny"
-        elif cloud_cover < 50:
-            return "partlycloudy"
-        else:
-            return "cloudy"
+        # 10% buckets: <20 sunny, <50 partly cloudy, otherwise cloudy
+        bucket = min(max(int(cloud_cover // 10), 0), len(_CLOUD_COVER_CONDITIONS) - 1)
+        return _CLOUD_COVER_CONDITIONS[bucket]
@@ -2,24 +2,50 @@
 from __future__ import annotations
 
 import logging
+import math
 from typing import Any
 
 import aiohttp
+import orjson
 
-from ..const import DEPARTMENT_BOUNDARIES, VIGILANCE_COLOR_CODES, VIGILANCE_PHENOMENA
+from ..const import (
+    DEPARTMENT_BOUNDARIES,
+    DEPARTMENT_GRID,
+    VIGILANCE_COLOR_CODES,
+    VIGILANCE_PHENOMENA,
+)
+from .base import BaseApiClient
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _level_color(level: Any) -> str:
+    """Return the vigilance color for a level, defaulting to green.
+
+    Args:
+        level: Vigilance level (1-4)
+
+    Returns:
+        Color name
+    """
+    if isinstance(level, int) and 0 < level < len(VIGILANCE_COLOR_CODES):
+        return VIGILANCE_COLOR_CODES[level]
+    return "green"
+
+
 class VigilanceApiError(Exception):
     """Exception raised for Vigilance API errors."""
 
 
-class VigilanceClient:
+class VigilanceClient(BaseApiClient):
     """Client for Météo-France Vigilance API."""
 
     def __init__(
-        self, api_token: str, latitude: float, longitude: float
+        self,
+        api_token: str,
+        latitude: float,
+        longitude: float,
+        session: aiohttp.ClientSession | None = None,
     ) -> None:
         """Initialize the Vigilance client.
 
@@ -27,12 +53,17 @@ class VigilanceClient:
             api_token: Météo-France Vigilance API token
             latitude: Location latitude
             longitude: Location longitude
+            session: Shared aiohttp session (a private one is created if omitted)
         """
+        super().__init__(session)
         self._api_token = api_token
         self._latitude = latitude
         self._longitude = longitude
         self._base_url = "https://public-api.meteofrance.fr/public/DPVigilance/v1"
         self._department = self._get_department_code(latitude, longitude)
+        self._department_name = DEPARTMENT_BOUNDARIES.get(
+            self._department, {}
+        ).get("name", "Unknown")
 
     def _get_department_code(self, lat: float, lon: float) -> str | None:
         """Get French department code from GPS coordinates.
@@ -44,18 +75,16 @@ class VigilanceClient:
         Returns:
             Two-digit department code (e.g., "74" for Haute-Savoie) or None if not found
         """
-        # Check all department boundaries
-        for dept_code, dept_info in DEPARTMENT_BOUNDARIES.items():
-            bounds = dept_info["bounds"]
-            min_lat, max_lat, min_lon, max_lon = bounds
-
+        # Only check departments whose bounds overlap this 1° grid cell
+        cell = (math.floor(lat), math.floor(lon))
+        for dept_code, min_lat, max_lat, min_lon, max_lon in DEPARTMENT_GRID.get(cell, ()):
             if min_lat <= lat <= max_lat and min_lon <= lon <= max_lon:
                 _LOGGER.debug(
                     "Coordinates (%.4f, %.4f) matched department %s (%s)",
                     lat,
                     lon,
                     dept_code,
-                    dept_info["name"],
+                    DEPARTMENT_BOUNDARIES[dept_code]["name"],
                 )
                 return dept_code
 
@@ -96,65 +125,63 @@ class VigilanceClient:
             }
 
         try:
-            async with aiohttp.ClientSession() as session:
-                headers = {"apikey": self._api_token}
-                url = f"{self._base_url}/cartevigilance/encours"
+            session = await self._get_session()
+            headers = {"apikey": self._api_token}
+            url = f"{self._base_url}/cartevigilance/encours"
+
+            _LOGGER.debug(
+                "Fetching vigilance data for department %s from %s",
+                self._department,
+                url,
+            )
+
+            async with session.get(
+                url, headers=headers, timeout=aiohttp.ClientTimeout(total=30)
+            ) as response:
+                response.raise_for_status()
+                data = orjson.loads(await response.read())
 
                 _LOGGER.debug(
-                    "Fetching vigilance data for department %s from %s",
+                    "Vigilance API response received for department %s",
                     self._department,
-                    url,
                 )
 
-                async with session.get(
-                    url, headers=headers, timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-                    response.raise_for_status()
-                    data = await response.json()
+                # Extract data for our department
+                department_data = self._extract_department_data(data)
 
-                    _LOGGER.debug(
-                        "Vigilance API response received for department %s",
+                if not department_data:
+                    _LOGGER.warning(
+                        "No vigilance data found for department %s in API response",
                         self._department,
                     )
-
-                    # Extract data for our department
-                    department_data = self._extract_department_data(data)
-
-                    if not department_data:
-                        _LOGGER.warning(
-                            "No vigilance data found for department %s in API response",
-                            self._department,
-                        )
-                        return {
-                            "has_data": False,
-                            "department": self._department,
-                            "error": "no_data",
-                        }
-
-                    result = {
-                        "has_data": True,
+                    return {
+                        "has_data": False,
                         "department": self._department,
-                        "department_name": DEPARTMENT_BOUNDARIES.get(
-                            self._department, {}
-                        ).get("name", "Unknown"),
-                        "overall_level": department_data.get("overall_level", 1),
-                        "overall_color": VIGILANCE_COLOR_CODES.get(
-                            department_data.get("overall_level", 1), "green"
-                        ),
-                        "phenomena": department_data.get("phenomena", {}),
-                        "update_time": data.get("update_time"),
+                        "error": "no_data",
                     }
 
-                    _LOGGER.info(
-                        "Vigilance data for %s (%s): level %d (%s), %d phenomena",
-                        self._department,
-                        result["department_name"],
-                        result["overall_level"],
-                        result["overall_color"],
-                        len(result["phenomena"]),
-                    )
+                result = {
+                    "has_data": True,
+                    "department": self._department,
+                    "department_name": self._department_name,
+                    "overall_level": department_data.get("overall_level", 1),
+                    "overall_color": _level_color(
+                        department_data.get("overall_level", 1)
+                    ),
+                    "phenomena": department_data.get("phenomena", {}),
+                    "update_time": data.get("update_time"),
+                }
+
+                _LOGGER.info(
+                    "Vigilance data for %s (%s): level %d (%s), %d phenomena",
+                    self._department,
+                    result["department_name"],
+                    result["overall_level"],
+                    result["overall_color"],
+                    len(result["phenomena"]),
+                )
 
-                    return result
+                return result
 
         except aiohttp.ClientResponseError as err:
             if err.status == 404:
@@ -250,12 +277,9 @@ class VigilanceClient:
                 _LOGGER.debug("No domain_ids in current period")
                 return None
 
-            # Find our department in the domain_ids list
-            dept_data = None
-            for domain in domain_ids:
-                if domain.get("domain_id") == self._department:
-                    dept_data = domain
-                    break
+            # Index domains by ID to find our department
+            domains_by_id = {domain.get("domain_id"): domain for domain in domain_ids}
+            dept_data = domains_by_id.get(self._department)
 
             if not dept_data:
                 _LOGGER.debug(
@@ -272,6 +296,7 @@ class VigilanceClient:
             phenomena = {}
             phenomenon_items = dept_data.get("phenomenon_items", [])
 
+            phenomena_names = VIGILANCE_PHENOMENA
             for phenom_item in phenomenon_items:
                 # Get phenomenon ID as string, then convert to int
                 phenom_id_str = phenom_item.get("phenomenon_id")
@@ -279,14 +304,14 @@ class VigilanceClient:
                     continue
 
                 phenom_id_int = int(phenom_id_str)
-                phenom_name = VIGILANCE_PHENOMENA.get(phenom_id_int)
+                phenom_name = phenomena_names.get(phenom_id_int)
 
                 if phenom_name:
                     # Use phenomenon_max_color_id as the alert level
                     phenom_level = phenom_item.get("phenomenon_max_color_id", 1)
                     phenomena[phenom_name] = {
                         "level": phenom_level,
-                        "color": VIGILANCE_COLOR_CODES.get(phenom_level, "green"),
+                        "color": _level_color(phenom_level),
                     }
 
             _LOGGER.debug(
@@ -1,8 +1,12 @@
 """Config flow for Serac integration."""
 from __future__ import annotations
 
+import functools
 import logging
+from math import cos, radians, sin
+import re
 from typing import Any
+import unicodedata
 
 import voluptuous as vol
 
@@ -10,6 +14,7 @@ from homeassistant import config_entries
 from homeassistant.const import CONF_LATITUDE, CONF_LONGITUDE
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 import homeassistant.helpers.config_validation as cv
 
 from .api.openmeteo_client import OpenMeteoClient, OpenMeteoApiError
@@ -20,16 +25,27 @@ from .const import (
     CONF_MASSIF_IDS,
     CONF_VIGILANCE_TOKEN,
     DOMAIN,
-    MASSIF_IDS,
-    MASSIFS,
+    MASSIF_KEYS,
+    MASSIF_NAMES,
+    MASSIF_OPTIONS,
+    MASSIF_XYZ,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Lowercase letter, then up to 19 lowercase letters, digits or underscores
+_PREFIX_RE = re.compile(r"[a-z][a-z0-9_]{0,19}")
+_NON_ALNUM_DELETE_TABLE = str.maketrans(
+    "", "", "".join(chr(code) for code in range(128) if not chr(code).isalnum())
+)
+
 
 def _find_nearest_massif(latitude: float, longitude: float) -> tuple[str, str]:
     """Find the nearest massif to the given coordinates.
 
+    Coordinates are rounded to 4 decimals (~11 m), far finer than massif
+    spacing, so repeated lookups for the same spot hit the cache.
+
     Args:
         latitude: Latitude coordinate
         longitude: Longitude coordinate
@@ -37,33 +53,33 @@ def _find_nearest_massif(latitude: float, longitude: float) -> tuple[str, str]:
     Returns:
         Tuple of (massif_id, massif_name)
     """
-    from math import radians, cos, sin, asin, sqrt
+    return _nearest_massif_cached(round(latitude, 4), round(longitude, 4))
 
-    def haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-        """Calculate the great circle distance between two points."""
-        # Convert decimal degrees to radians
-        lon1, lat1, lon2, lat2 = map(radians, [lon1, lat1, lon2, lat2])
 
-        # Haversine formula
-        dlon = lon2 - lon1
-        dlat = lat2 - lat1
-        a = sin(dlat / 2) ** 2 + cos(lat1) * cos(lat2) * sin(dlon / 2) ** 2
-        c = 2 * asin(sqrt(a))
-        r = 6371  # Radius of earth in kilometers
-        return c * r
+@functools.lru_cache(maxsize=256)
+def _nearest_massif_cached(latitude: float, longitude: float) -> tuple[str, str]:
+    """Find the nearest massif to already-rounded coordinates."""
+    lat = radians(latitude)
+    lon = radians(longitude)
+    cos_lat = cos(lat)
+    qx = cos_lat * cos(lon)
+    qy = cos_lat * sin(lon)
+    qz = sin(lat)
 
-    min_distance = float("inf")
-    nearest_massif_id = None
-    nearest_massif_name = None
+    # Squared chord length is monotonic in great-circle distance
+    min_d2 = float("inf")
+    nearest = 0
 
-    for massif_id, (massif_name, massif_lat, massif_lon) in MASSIFS.items():
-        distance = haversine(latitude, longitude, massif_lat, massif_lon)
-        if distance < min_distance:
-            min_distance = distance
-            nearest_massif_id = massif_id
-            nearest_massif_name = massif_name
+    for index, (x, y, z) in enumerate(MASSIF_XYZ):
+        dx = x - qx
+        dy = y - qy
+        dz = z - qz
+        d2 = dx * dx + dy * dy + dz * dz
+        if d2 < min_d2:
+            min_d2 = d2
+            nearest = index
 
-    return nearest_massif_id, nearest_massif_name
+    return MASSIF_KEYS[nearest], MASSIF_NAMES[nearest]
 
 
 class SeracConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -81,7 +97,9 @@ class SeracConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Get the options flow for this handler."""
         return SeracOptionsFlow()
 
-    def _validate_prefix(self, prefix: str) -> bool:
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _validate_prefix(prefix: str) -> bool:
         """Validate entity prefix format.
 
         Args:
@@ -90,11 +108,12 @@ class SeracConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         Returns:
             True if valid, False otherwise
         """
-        import re
         # Must be lowercase alphanumeric + underscores, start with letter, 1-20 chars
-        return bool(re.match(r'^[a-z][a-z0-9_]{0,19}$', prefix))
+        return _PREFIX_RE.fullmatch(prefix) is not None
 
-    def _suggest_prefix(self, location_name: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _suggest_prefix(location_name: str) -> str:
         """Suggest a prefix from location name.
 
         Args:
@@ -103,11 +122,13 @@ class SeracConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         Returns:
             Suggested prefix (lowercase, alphanumeric only)
         """
-        import re
         # Take first word, remove special characters, convert to lowercase
         first_word = location_name.split()[0] if location_name else "mountain"
-        # Remove accents and special characters
-        slug = re.sub(r'[^a-zA-Z0-9]', '', first_word).lower()
+        # Strip accents ("Évian" -> "Evian"); most names are plain ASCII already
+        if not first_word.isascii():
+            first_word = unicodedata.normalize("NFKD", first_word).encode("ascii", "ignore").decode("ascii")
+        # Drop remaining special characters in a single translate pass
+        slug = first_word.translate(_NON_ALNUM_DELETE_TABLE).lower()
         # Ensure it starts with a letter
         if slug and not slug[0].isalpha():
             slug = "m" + slug
@@ -140,7 +161,11 @@ class SeracConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     )
 
                     # Initialize Open-Meteo client (no authentication needed)
-                    client = OpenMeteoClient(latitude=latitude, longitude=longitude)
+                    client = OpenMeteoClient(
+                        latitude=latitude,
+                        longitude=longitude,
+                        session=async_get_clientsession(self.hass),
+                    )
                     _LOGGER.debug("OpenMeteoClient initialized successfully")
 
                     # Test coordinates by fetching current weather
@@ -255,9 +280,6 @@ class SeracConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 data=self._data,
             )
 
-        # Create massif options for multi-select
-        massif_options = {str(num_id): name for num_id, (name, _) in MASSIF_IDS.items()}
-
         data_schema = vol.Schema(
             {
                 vol.Optional(
@@ -267,7 +289,7 @@ class SeracConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 vol.Optional(
                     CONF_MASSIF_IDS,
                     description="Select massifs for avalanche bulletins (requires BRA token)"
-                ): cv.multi_select(massif_options),
+                ): cv.multi_select(MASSIF_OPTIONS),
                 vol.Optional(
                     CONF_VIGILANCE_TOKEN,
                     description="Météo-France Vigilance API token for weather alerts (optional)"
@@ -328,12 +350,9 @@ class SeracOptionsFlow(config_entries.OptionsFlow):
         current_bra_token = self.config_entry.data.get(CONF_BRA_TOKEN, "")
         current_vigilance_token = self.config_entry.data.get(CONF_VIGILANCE_TOKEN, "")
 
-        # Create massif options for multi-select
-        massif_options = {str(num_id): name for num_id, (name, _) in MASSIF_IDS.items()}
-
         data_schema = vol.Schema({
             vol.Optional(CONF_BRA_TOKEN, default=current_bra_token): str,
-            vol.Optional(CONF_MASSIF_IDS, default=current_massifs): cv.multi_select(massif_options),
+            vol.Optional(CONF_MASSIF_IDS, default=current_massifs): cv.multi_select(MASSIF_OPTIONS),
             vol.Optional(CONF_VIGILANCE_TOKEN, default=current_vigilance_token): str,
         })
 
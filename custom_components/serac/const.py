@@ -1,10 +1,21 @@
 """Constants for the Serac integration."""
+from dataclasses import dataclass
 from datetime import timedelta
+import math
 from typing import Final
 
 # Integration domain
 DOMAIN: Final = "serac"
 
+# hass.data[DOMAIN] key for API clients shared between entries
+SHARED_CLIENTS: Final = "_shared_clients"
+
+# hass.data[DOMAIN] key for the semaphore capping concurrent BRA fetches
+BRA_SEMAPHORE: Final = "_bra_semaphore"
+
+# hass.data[DOMAIN] key for air quality results, kept across entry reloads
+AQI_CACHE: Final = "_aqi_cache"
+
 # Platforms
 PLATFORMS: Final = ["weather", "sensor"]
 
@@ -33,98 +44,74 @@ DEFAULT_NAME: Final = "Serac"
 ATTRIBUTION: Final = "Data from Open-Meteo (Météo-France AROME & ARPEGE models)"
 MANUFACTURER: Final = "Météo-France"
 
-# French Alps and Pyrenees Massifs - Numeric IDs for BRA API
-# Format: numeric_id -> (Name, Text ID)
-MASSIF_IDS: Final = {
+
+@dataclass(frozen=True, slots=True)
+class Massif:
+    """A massif covered by the BRA avalanche bulletins."""
+
+    num_id: int
+    text_id: str
+    name: str
+    latitude: float
+    longitude: float
+
+
+# French Alps, Pyrenees and Corsica massifs covered by the BRA API
+# Massif(numeric_id, text_id, name, approximate center latitude, center longitude)
+MASSIFS_TABLE: Final = (
     # Northern Alps (Haute-Savoie & Savoie)
-    1: ("Chablais", "CHABLAIS"),
-    2: ("Aravis", "ARAVIS"),
-    3: ("Mont-Blanc", "MONT-BLANC"),
-    4: ("Bauges", "BAUGES"),
-    5: ("Beaufortain", "BEAUFORTAIN"),
-    6: ("Haute-Tarentaise", "HAUTE-TARENTAISE"),
-    7: ("Chartreuse", "CHARTREUSE"),
-    8: ("Belledonne", "BELLEDONNE"),
-    9: ("Maurienne", "MAURIENNE"),
-    10: ("Vanoise", "VANOISE"),
-    11: ("Haute-Maurienne", "HAUTE-MAURIENNE"),
-    12: ("Grandes-Rousses", "GRANDES-ROUSSES"),
-    13: ("Thabor", "THABOR"),
-    14: ("Vercors", "VERCORS"),
-    15: ("Oisans", "OISANS"),
-    16: ("Pelvoux", "PELVOUX"),
+    Massif(1, "CHABLAIS", "Chablais", 46.3, 6.7),
+    Massif(2, "ARAVIS", "Aravis", 45.9, 6.5),
+    Massif(3, "MONT-BLANC", "Mont-Blanc", 45.9, 6.9),
+    Massif(4, "BAUGES", "Bauges", 45.7, 6.2),
+    Massif(5, "BEAUFORTAIN", "Beaufortain", 45.7, 6.6),
+    Massif(6, "HAUTE-TARENTAISE", "Haute-Tarentaise", 45.5, 6.9),
+    Massif(7, "CHARTREUSE", "Chartreuse", 45.4, 5.8),
+    Massif(8, "BELLEDONNE", "Belledonne", 45.3, 6.0),
+    Massif(9, "MAURIENNE", "Maurienne", 45.2, 6.6),
+    Massif(10, "VANOISE", "Vanoise", 45.4, 6.8),
+    Massif(11, "HAUTE-MAURIENNE", "Haute-Maurienne", 45.2, 6.9),
+    Massif(12, "GRANDES-ROUSSES", "Grandes-Rousses", 45.1, 6.1),
+    Massif(13, "THABOR", "Thabor", 45.1, 6.5),
+    Massif(14, "VERCORS", "Vercors", 45.0, 5.5),
+    Massif(15, "OISANS", "Oisans", 45.0, 6.3),
+    Massif(16, "PELVOUX", "Pelvoux", 44.9, 6.4),
     # Southern Alps
-    17: ("Queyras", "QUEYRAS"),
-    18: ("Dévoluy", "DEVOLUY"),
-    19: ("Champsaur", "CHAMPSAUR"),
-    20: ("Embrunais-Parpaillon", "EMBRUNAIS-PARPAILLON"),
-    21: ("Ubaye", "UBAYE"),
-    22: ("Mercantour", "MERCANTOUR"),
-    23: ("Alpes-Azur", "ALPES-AZUR"),
+    Massif(17, "QUEYRAS", "Queyras", 44.7, 6.8),
+    Massif(18, "DEVOLUY", "Dévoluy", 44.7, 5.9),
+    Massif(19, "CHAMPSAUR", "Champsaur", 44.7, 6.2),
+    Massif(20, "EMBRUNAIS-PARPAILLON", "Embrunais-Parpaillon", 44.5, 6.5),
+    Massif(21, "UBAYE", "Ubaye", 44.4, 6.7),
+    Massif(22, "MERCANTOUR", "Mercantour", 44.1, 7.4),
+    Massif(23, "ALPES-AZUR", "Alpes-Azur", 43.9, 7.2),
     # Pyrenees
-    40: ("Pays-Basque", "PAYS-BASQUE"),
-    41: ("Aspe-Ossau", "ASPE-OSSAU"),
-    42: ("Haute-Bigorre", "HAUTE-BIGORRE"),
-    43: ("Aure-Louron", "AURE-LOURON"),
-    44: ("Luchonnais", "LUCHONNAIS"),
-    45: ("Couserans", "COUSERANS"),
-    46: ("Haute-Ariège", "HAUTE-ARIEGE"),
-    47: ("Orlu-St-Barthélémy", "ORLU-ST-BARTHELEMY"),
-    48: ("Capcir-Puymorens", "CAPCIR-PUYMORENS"),
-    49: ("Cerdagne-Canigou", "CERDAGNE-CANIGOU"),
-    50: ("Andorre", "ANDORRE"),
+    Massif(40, "PAYS-BASQUE", "Pays-Basque", 43.0, -1.0),
+    Massif(41, "ASPE-OSSAU", "Aspe-Ossau", 42.9, -0.4),
+    Massif(42, "HAUTE-BIGORRE", "Haute-Bigorre", 42.8, 0.1),
+    Massif(43, "AURE-LOURON", "Aure-Louron", 42.8, 0.4),
+    Massif(44, "LUCHONNAIS", "Luchonnais", 42.8, 0.6),
+    Massif(45, "COUSERANS", "Couserans", 42.8, 1.0),
+    Massif(46, "HAUTE-ARIEGE", "Haute-Ariège", 42.6, 1.5),
+    Massif(47, "ORLU-ST-BARTHELEMY", "Orlu-St-Barthélémy", 42.6, 1.9),
+    Massif(48, "CAPCIR-PUYMORENS", "Capcir-Puymorens", 42.5, 2.0),
+    Massif(49, "CERDAGNE-CANIGOU", "Cerdagne-Canigou", 42.5, 2.3),
+    Massif(50, "ANDORRE", "Andorre", 42.6, 1.6),
     # Corsica
-    70: ("Corse", "CORSE"),
-}
+    Massif(70, "CORSE", "Corse", 42.2, 9.0),
+)
+
+# Numeric IDs for BRA API
+# Format: numeric_id -> (Name, Text ID)
+MASSIF_IDS: Final = {massif.num_id: (massif.name, massif.text_id) for massif in MASSIFS_TABLE}
+
+# Massif multi-select options for the config and options flows
+# Format: str(numeric_id) -> Name
+MASSIF_OPTIONS: Final = {str(num_id): name for num_id, (name, _) in MASSIF_IDS.items()}
 
-# French Alps and Pyrenees Massifs - For distance calculation
-# Format: ID -> (Name, Approximate center latitude, center longitude)
+# For distance calculation
+# Format: text_id -> (Name, Approximate center latitude, center longitude)
 MASSIFS: Final = {
-    # Alps (23 massifs)
-    "CHABLAIS": ("Chablais", 46.3, 6.7),
-    "ARAVIS": ("Aravis", 45.9, 6.5),
-    "MONT-BLANC": ("Mont-Blanc", 45.9, 6.9),
-    "BAUGES": ("Bauges", 45.7, 6.2),
-    "BEAUFORTAIN": ("Beaufortain", 45.7, 6.6),
-    "HAUTE-TARENTAISE": ("Haute-Tarentaise", 45.5, 6.9),
-    "CHARTREUSE": ("Chartreuse", 45.4, 5.8),
-    "BELLEDONNE": ("Belledonne", 45.3, 6.0),
-    "MAURIENNE": ("Maurienne", 45.2, 6.6),
-    "VANOISE": ("Vanoise", 45.4, 6.8),
-    "HAUTE-MAURIENNE": ("Haute-Maurienne", 45.2, 6.9),
-    "VERCORS": ("Vercors", 45.0, 5.5),
-    "OISANS": ("Oisans", 45.0, 6.3),
-    "GRANDES-ROUSSES": ("Grandes-Rousses", 45.1, 6.1),
-    "THABOR": ("Thabor", 45.1, 6.5),
-    "PELVOUX": ("Pelvoux", 44.9, 6.4),
-    "QUEYRAS": ("Queyras", 44.7, 6.8),
-    "DEVOLUY": ("Dévoluy", 44.7, 5.9),
-    "CHAMPSAUR": ("Champsaur", 44.7, 6.2),
-    "EMBRUNAIS-PARPAILLON": ("Embrunais-Parpaillon", 44.5, 6.5),
-    "UBAYE": ("Ubaye", 44.4, 6.7),
-    "MERCANTOUR": ("Mercantour", 44.1, 7.4),
-    "ALPES-AZUR": ("Alpes-Azur", 43.9, 7.2),
-
-    # Pyrenees (16 massifs)
-    "PAYS-BASQUE": ("Pays-Basque", 43.0, -1.0),
-    "ASPE-OSSAU": ("Aspe-Ossau", 42.9, -0.4),
-    "HAUTE-BIGORRE": ("Haute-Bigorre", 42.8, 0.1),
-    "AURE-LOURON": ("Aure-Louron", 42.8, 0.4),
-    "LUCHONNAIS": ("Luchonnais", 42.8, 0.6),
-    "COUSERANS": ("Couserans", 42.8, 1.0),
-    "HAUTE-ARIEGE": ("Haute-Ariège", 42.6, 1.5),
-    "ORLU-ST-BARTHELEMY": ("Orlu-St-Barthélémy", 42.6, 1.9),
-    "CAPCIR-PUYMORENS": ("Capcir-Puymorens", 42.5, 2.0),
-    "CERDAGNE-CANIGOU": ("Cerdagne-Canigou", 42.5, 2.3),
-    "ANDORRE": ("Andorre", 42.6, 1.6),
-    "MONTAGNE-BASQUE": ("Montagne-Basque", 43.0, -1.2),
-    "BEARN": ("Béarn", 42.9, -0.5),
-    "BIGORRE": ("Bigorre", 42.9, 0.0),
-    "COMMINGES": ("Comminges", 42.8, 0.7),
-    "ARIEGE": ("Ariège", 42.7, 1.3),
-
-    # Corsica (1 massif)
-    "CORSE": ("Corse", 42.2, 9.0),
+    massif.text_id: (massif.name, massif.latitude, massif.longitude) for massif in MASSIFS_TABLE
 }
 
 # Sensor types for AROME
@@ -213,12 +200,14 @@ SENSOR_TYPE_VIGILANCE_LEVEL: Final = "vigilance_level"
 SENSOR_TYPE_VIGILANCE_COLOR: Final = "vigilance_color"
 
 # Vigilance color codes (1-4 scale)
-VIGILANCE_COLOR_CODES: Final = {
-    1: "green",      # Vert - No particular vigilance
-    2: "yellow",     # Jaune - Be attentive
-    3: "orange",     # Orange - Be very vigilant
-    4: "red",        # Rouge - Absolute vigilance
-}
+# Indexed by level (1-4); index 0 is a placeholder so levels index directly
+VIGILANCE_COLOR_CODES: Final = (
+    "green",
+    "green",      # 1: Vert - No particular vigilance
+    "yellow",     # 2: Jaune - Be attentive
+    "orange",     # 3: Orange - Be very vigilant
+    "red",        # 4: Rouge - Absolute vigilance
+)
 
 # Vigilance phenomenon types
 VIGILANCE_PHENOMENA: Final = {
@@ -280,3 +269,46 @@ DEPARTMENT_BOUNDARIES: Final = {
     "68": {"name": "Haut-Rhin", "bounds": (47.4, 48.3, 6.8, 7.6)},
     "88": {"name": "Vosges", "bounds": (47.8, 48.5, 5.4, 7.2)},
 }
+
+
+def _build_department_grid() -> dict[tuple[int, int], tuple[tuple[str, float, float, float, float], ...]]:
+    """Index department bounding boxes by the 1°×1° cells they overlap.
+
+    Each entry is (code, min_lat, max_lat, min_lon, max_lon) so a lookup only
+    compares floats. Entries keep DEPARTMENT_BOUNDARIES order within each cell
+    so overlapping boxes resolve the same way as a scan of the full table.
+    """
+    grid: dict[tuple[int, int], list[tuple[str, float, float, float, float]]] = {}
+    for dept_code, dept_info in DEPARTMENT_BOUNDARIES.items():
+        min_lat, max_lat, min_lon, max_lon = dept_info["bounds"]
+        entry = (dept_code, min_lat, max_lat, min_lon, max_lon)
+        for lat_cell in range(math.floor(min_lat), math.floor(max_lat) + 1):
+            for lon_cell in range(math.floor(min_lon), math.floor(max_lon) + 1):
+                grid.setdefault((lat_cell, lon_cell), []).append(entry)
+    return {cell: tuple(entries) for cell, entries in grid.items()}
+
+
+# Department bounding boxes per (floor(lat), floor(lon)) cell
+DEPARTMENT_GRID: Final = _build_department_grid()
+
+
+def _build_massif_xyz() -> tuple[tuple[float, float, float], ...]:
+    """Precompute massif centers as unit-sphere Cartesian coordinates.
+
+    The squared chord length between two points on the sphere is monotonic in
+    their great-circle distance, so nearest-massif lookups only need
+    multiply-adds at query time.
+    """
+    points = []
+    for massif in MASSIFS_TABLE:
+        lat_rad = math.radians(massif.latitude)
+        lon_rad = math.radians(massif.longitude)
+        cos_lat = math.cos(lat_rad)
+        points.append((cos_lat * math.cos(lon_rad), cos_lat * math.sin(lon_rad), math.sin(lat_rad)))
+    return tuple(points)
+
+
+# Massif centers as parallel tuples in MASSIFS_TABLE order
+MASSIF_KEYS: Final = tuple(massif.text_id for massif in MASSIFS_TABLE)
+MASSIF_NAMES: Final = tuple(massif.name for massif in MASSIFS_TABLE)
+MASSIF_XYZ: Final = _build_massif_xyz()
@@ -20,8 +20,24 @@ from .const import AROME_UPDATE_INTERVAL, BRA_UPDATE_INTERVAL, VIGILANCE_UPDATE_
 
 _LOGGER = logging.getLogger(__name__)
 
+# Backoff sleep, module-level so tests can skip the delays without patching asyncio
+_sleep = asyncio.sleep
+
 T = TypeVar("T")
 
+# Weather coordinator data sections, as named in retry and warning logs
+_WEATHER_SECTIONS = (
+    "current weather",
+    "daily forecast",
+    "hourly forecast",
+    "6h forecast",
+    "additional data",
+    "air quality data",
+)
+
+# Auth and not-found errors won't succeed on retry
+_NO_RETRY_STATUSES = frozenset({401, 403, 404})
+
 
 async def async_retry_with_backoff(
     func: Callable[[], Any],
@@ -47,16 +63,22 @@ async def async_retry_with_backoff(
     Raises:
         Exception: The last exception if all retries fail
     """
-    delay = initial_delay
     last_exception = None
+    # HTTP errors are retried too, except the statuses in _NO_RETRY_STATUSES
+    catch = (*retry_on, aiohttp.ClientResponseError)
 
     for attempt in range(max_retries + 1):
         try:
             return await func()
-        except retry_on as err:
-            last_exception = err
+        except catch as err:
+            status = getattr(err, "status", None)
+            if status in _NO_RETRY_STATUSES:
+                _LOGGER.error("%s failed with auth/not found error (status %d): %s", context, status, err)
+                raise
 
+            last_exception = err
             if attempt < max_retries:
+                delay = initial_delay * backoff_factor**attempt
                 _LOGGER.warning(
                     "%s failed (attempt %d/%d), retrying in %.1fs: %s",
                     context,
@@ -65,8 +87,7 @@ async def async_retry_with_backoff(
                     delay,
                     err,
                 )
-                await asyncio.sleep(delay)
-                delay *= backoff_factor
+                await _sleep(delay)
             else:
                 _LOGGER.error(
                     "%s failed after %d attempts: %s",
@@ -74,34 +95,6 @@ async def async_retry_with_backoff(
                     max_retries + 1,
                     err,
                 )
-        except (
-            aiohttp.ClientResponseError,
-        ) as err:
-            # Don't retry on auth errors (401, 403) or not found (404)
-            if hasattr(err, "status") and err.status in (401, 403, 404):
-                _LOGGER.error("%s failed with auth/not found error (status %d): %s", context, err.status, err)
-                raise
-            # Retry on other HTTP errors (5xx, etc.)
-            last_exception = err
-            if attempt < max_retries:
-                _LOGGER.warning(
-                    "%s failed with HTTP error %d (attempt %d/%d), retrying in %.1fs: %s",
-                    context,
-                    err.status if hasattr(err, "status") else 0,
-                    attempt + 1,
-                    max_retries + 1,
-                    delay,
-                    err,
-                )
-                await asyncio.sleep(delay)
-                delay *= backoff_factor
-            else:
-                _LOGGER.error(
-                    "%s failed after %d attempts with HTTP error: %s",
-                    context,
-                    max_retries + 1,
-                    err,
-                )
 
     # If we get here, all retries failed
     if last_exception:
@@ -132,10 +125,35 @@ class AromeCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER,
             name=f"{DOMAIN}_{location_name}_arome",
             update_interval=AROME_UPDATE_INTERVAL,
+            # Skip listener updates when a refresh returns identical data
+            always_update=False,
         )
         self.client = client
         self.airquality_client = airquality_client
         self.location_name = location_name
+        # Retry log contexts per data section, built once
+        self._fetch_contexts = {
+            section: f"Fetch {section} for {location_name}" for section in _WEATHER_SECTIONS
+        }
+
+    async def _async_fetch_optional(
+        self, func: Callable[[], Any], default: T, section: str
+    ) -> T:
+        """Fetch an optional data section, falling back to a default on failure.
+
+        Args:
+            func: Client method to call with retry logic
+            default: Value returned if the fetch fails
+            section: Description of the data section for logging
+
+        Returns:
+            Result of the fetch, or the default if it failed
+        """
+        try:
+            return await async_retry_with_backoff(func, context=self._fetch_contexts[section])
+        except Exception as err:
+            _LOGGER.warning("Error fetching %s for %s: %s", section, self.location_name, err)
+            return default
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from Open-Meteo API.
@@ -146,7 +164,7 @@ class AromeCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         Raises:
             UpdateFailed: If update fails
         """
-        start_time = time.monotonic()
+        start_ns = time.perf_counter_ns()
         try:
             _LOGGER.debug(
                 "Starting weather data update for %s (lat=%.4f, lon=%.4f)",
@@ -155,81 +173,77 @@ class AromeCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 self.client._longitude,
             )
 
-            # Define wrapped API calls with retry logic
-            async def fetch_current():
-                return await async_retry_with_backoff(
-                    self.client.async_get_current_weather,
-                    context=f"Fetch current weather for {self.location_name}",
-                )
+            client = self.client
+            contexts = self._fetch_contexts
 
-            async def fetch_daily():
-                return await async_retry_with_backoff(
-                    self.client.async_get_daily_forecast,
-                    context=f"Fetch daily forecast for {self.location_name}",
-                )
-
-            async def fetch_hourly():
-                return await async_retry_with_backoff(
-                    self.client.async_get_hourly_forecast,
-                    context=f"Fetch hourly forecast for {self.location_name}",
-                )
-
-            async def fetch_hourly_6h():
-                return await async_retry_with_backoff(
-                    self.client.async_get_hourly_6h,
-                    context=f"Fetch 6h forecast for {self.location_name}",
-                )
-
-            async def fetch_additional():
-                return await async_retry_with_backoff(
-                    self.client.async_get_additional_data,
-                    context=f"Fetch additional data for {self.location_name}",
-                )
-
-            # Fetch all data in parallel for better performance
-            tasks = [
-                fetch_current(),
-                fetch_daily(),
-                fetch_hourly(),
-                fetch_hourly_6h(),
-                fetch_additional(),
-            ]
-
-            # Add air quality task if client is available
-            if self.airquality_client:
-
-                async def fetch_air_quality():
-                    return await async_retry_with_backoff(
-                        self.airquality_client.async_get_air_quality,
-                        context=f"Fetch air quality for {self.location_name}",
+            # Sections that rarely change keep their last value if a refresh fails
+            previous = self.data or {}
+            previous_additional = (
+                {"elevation": previous["elevation"]} if "elevation" in previous else {}
+            )
+            previous_air_quality = previous.get("air_quality", {})
+
+            # Fetch all data in parallel; a failed required fetch cancels the rest
+            air_quality_task = None
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    current_task = tg.create_task(
+                        async_retry_with_backoff(
+                            client.async_get_current_weather,
+                            context=contexts["current weather"],
+                        )
+                    )
+                    daily_task = tg.create_task(
+                        async_retry_with_backoff(
+                            client.async_get_daily_forecast,
+                            context=contexts["daily forecast"],
+                        )
+                    )
+                    hourly_task = tg.create_task(
+                        self._async_fetch_optional(
+                            client.async_get_hourly_forecast,
+                            [],
+                            "hourly forecast",
+                        )
+                    )
+                    hourly_6h_task = tg.create_task(
+                        self._async_fetch_optional(client.async_get_hourly_6h, [], "6h forecast")
+                    )
+                    additional_task = tg.create_task(
+                        self._async_fetch_optional(
+                            client.async_get_additional_data,
+                            previous_additional,
+                            "additional data",
+                        )
                     )
 
-                tasks.append(fetch_air_quality())
-
-            # Execute all API calls in parallel (with retry logic per task)
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            # Unpack results
-            current_weather = results[0] if not isinstance(results[0], Exception) else {}
-            daily_forecast = results[1] if not isinstance(results[1], Exception) else []
-            hourly_forecast = results[2] if not isinstance(results[2], Exception) else []
-            hourly_6h = results[3] if not isinstance(results[3], Exception) else []
-            additional_data = results[4] if not isinstance(results[4], Exception) else {}
+                    # Add air quality task if client is available
+                    if self.airquality_client:
+                        air_quality_task = tg.create_task(
+                            self._async_fetch_optional(
+                                self.airquality_client.async_get_air_quality,
+                                previous_air_quality,
+                                "air quality data",
+                            )
+                        )
+            except ExceptionGroup as group:
+                # Check for critical errors
+                for task, section in ((current_task, "current weather"), (daily_task, "daily forecast")):
+                    if task.done() and not task.cancelled() and task.exception() is not None:
+                        err = task.exception()
+                        raise UpdateFailed(f"Failed to get {section}: {err}") from err
+                raise group.exceptions[0] from group
+
+            current_weather = current_task.result()
+            daily_forecast = daily_task.result()
+            hourly_forecast = hourly_task.result()
+            hourly_6h = hourly_6h_task.result()
+            additional_data = additional_task.result()
 
             # Handle air quality data
-            air_quality_data = {}
-            if self.airquality_client and len(results) > 5:
-                if isinstance(results[5], Exception):
-                    _LOGGER.warning("Error fetching air quality data for %s: %s", self.location_name, results[5])
-                else:
-                    air_quality_data = results[5]
-                    _LOGGER.debug("Successfully fetched air quality data for %s", self.location_name)
-
-            # Check for critical errors
-            if isinstance(results[0], Exception):
-                raise UpdateFailed(f"Failed to get current weather: {results[0]}") from results[0]
-            if isinstance(results[1], Exception):
-                raise UpdateFailed(f"Failed to get daily forecast: {results[1]}") from results[1]
+            air_quality_data = air_quality_task.result() if air_quality_task else {}
+            if air_quality_data:
+                _LOGGER.debug("Successfully fetched air quality data for %s", self.location_name)
 
             # Combine all data
             data = {
@@ -241,7 +255,7 @@ class AromeCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 "air_quality": air_quality_data,
             }
 
-            elapsed_time = time.monotonic() - start_time
+            elapsed_time = (time.perf_counter_ns() - start_ns) / 1e9
             _LOGGER.info(
                 "Weather update completed for %s in %.2fs: %d daily forecasts, %d hourly forecasts, %s air quality",
                 self.location_name,
@@ -250,18 +264,19 @@ class AromeCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 len(hourly_forecast),
                 "available" if air_quality_data else "unavailable",
             )
-            _LOGGER.debug(
-                "Weather data details for %s: elevation=%dm, 6h forecasts=%d, current_temp=%.1f°C",
-                self.location_name,
-                additional_data.get("elevation", 0),
-                len(hourly_6h),
-                current_weather.get("temperature", 0),
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Weather data details for %s: elevation=%dm, 6h forecasts=%d, current_temp=%.1f°C",
+                    self.location_name,
+                    additional_data.get("elevation", 0),
+                    len(hourly_6h),
+                    current_weather.get("temperature", 0),
+                )
 
             return data
 
         except OpenMeteoApiError as err:
-            elapsed_time = time.monotonic() - start_time
+            elapsed_time = (time.perf_counter_ns() - start_ns) / 1e9
             _LOGGER.error(
                 "Failed to fetch weather data for %s after %.2fs (lat=%.4f, lon=%.4f): %s",
                 self.location_name,
@@ -272,7 +287,7 @@ class AromeCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             )
             raise UpdateFailed(f"Error fetching weather data: {err}") from err
         except Exception as err:
-            elapsed_time = time.monotonic() - start_time
+            elapsed_time = (time.perf_counter_ns() - start_ns) / 1e9
             _LOGGER.error(
                 "Unexpected error fetching weather data for %s after %.2fs: %s (type: %s)",
                 self.location_name,
@@ -293,6 +308,7 @@ class BraCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         location_name: str,
         massif_id: int,
         massif_name: str,
+        fetch_semaphore: asyncio.Semaphore,
     ) -> None:
         """Initialize the BRA coordinator.
 
@@ -302,17 +318,23 @@ class BraCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             location_name: Name of the location for logging
             massif_id: Numeric ID of the massif
             massif_name: Name of the massif
+            fetch_semaphore: Semaphore shared by all BRA coordinators
         """
         super().__init__(
             hass,
             _LOGGER,
             name=f"{DOMAIN}_{location_name}_bra",
             update_interval=BRA_UPDATE_INTERVAL,
+            # Skip listener updates when a refresh returns identical data
+            always_update=False,
         )
         self.client = client
         self.location_name = location_name
         self.massif_id = massif_id
         self.massif_name = massif_name
+        self._fetch_semaphore = fetch_semaphore
+        self._region = "French Alps" if massif_id <= 23 else "Pyrenees/Corsica"
+        self._retry_context = f"Fetch BRA bulletin for {massif_name} (massif {massif_id})"
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from BRA API.
@@ -323,23 +345,24 @@ class BraCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         Raises:
             UpdateFailed: If update fails
         """
-        start_time = time.monotonic()
+        start_ns = time.perf_counter_ns()
         try:
             _LOGGER.debug(
                 "Starting BRA bulletin update for %s - massif %s (%s, ID: %d)",
                 self.location_name,
                 self.massif_name,
-                "French Alps" if self.massif_id <= 23 else "Pyrenees/Corsica",
+                self._region,
                 self.massif_id,
             )
 
             # Fetch bulletin data with retry logic
-            bulletin_data = await async_retry_with_backoff(
-                self.client.async_get_bulletin,
-                context=f"Fetch BRA bulletin for {self.massif_name} (massif {self.massif_id})",
-            )
+            async with self._fetch_semaphore:
+                bulletin_data = await async_retry_with_backoff(
+                    self.client.async_get_bulletin,
+                    context=self._retry_context,
+                )
 
-            elapsed_time = time.monotonic() - start_time
+            elapsed_time = (time.perf_counter_ns() - start_ns) / 1e9
 
             if not bulletin_data.get("has_data"):
                 _LOGGER.warning(
@@ -359,18 +382,19 @@ class BraCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 bulletin_data.get("risk_max_j2"),
                 bulletin_data.get("bulletin_date"),
             )
-            _LOGGER.debug(
-                "BRA details for %s: altitude_limit=%s, high_risk=%s, low_risk=%s",
-                self.massif_name,
-                bulletin_data.get("altitude_limit"),
-                bulletin_data.get("risk_high_altitude"),
-                bulletin_data.get("risk_low_altitude"),
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "BRA details for %s: altitude_limit=%s, high_risk=%s, low_risk=%s",
+                    self.massif_name,
+                    bulletin_data.get("altitude_limit"),
+                    bulletin_data.get("risk_high_altitude"),
+                    bulletin_data.get("risk_low_altitude"),
+                )
 
             return bulletin_data
 
         except BraApiError as err:
-            elapsed_time = time.monotonic() - start_time
+            elapsed_time = (time.perf_counter_ns() - start_ns) / 1e9
             _LOGGER.error(
                 "Failed to fetch BRA bulletin for %s (massif ID: %d) after %.2fs: %s",
                 self.massif_name,
@@ -380,7 +404,7 @@ class BraCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             )
             raise UpdateFailed(f"Error fetching BRA data: {err}") from err
         except Exception as err:
-            elapsed_time = time.monotonic() - start_time
+            elapsed_time = (time.perf_counter_ns() - start_ns) / 1e9
             _LOGGER.error(
                 "Unexpected error fetching BRA data for %s (massif ID: %d) after %.2fs: %s (type: %s)",
                 self.massif_name,
@@ -413,6 +437,8 @@ class VigilanceCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER,
             name=f"{DOMAIN}_{location_name}_vigilance",
             update_interval=VIGILANCE_UPDATE_INTERVAL,
+            # Skip listener updates when a refresh returns identical data
+            always_update=False,
         )
         self.client = client
         self.location_name = location_name
@@ -426,7 +452,7 @@ class VigilanceCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         Raises:
             UpdateFailed: If update fails
         """
-        start_time = time.monotonic()
+        start_ns = time.perf_counter_ns()
         try:
             _LOGGER.debug(
                 "Starting Vigilance alert update for %s (lat=%.4f, lon=%.4f, dept=%s)",
@@ -442,7 +468,7 @@ class VigilanceCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 context=f"Fetch vigilance alerts for {self.location_name}",
             )
 
-            elapsed_time = time.monotonic() - start_time
+            elapsed_time = (time.perf_counter_ns() - start_ns) / 1e9
 
             if not vigilance_data.get("has_data"):
                 reason = vigilance_data.get("error", "unknown")
@@ -473,18 +499,19 @@ class VigilanceCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 vigilance_data.get("overall_level", 0),
                 len(vigilance_data.get("phenomena", {})),
             )
-            _LOGGER.debug(
-                "Vigilance details for %s: dept=%s, update_time=%s, phenomena=%s",
-                self.location_name,
-                vigilance_data.get("department"),
-                vigilance_data.get("update_time"),
-                list(vigilance_data.get("phenomena", {}).keys()),
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Vigilance details for %s: dept=%s, update_time=%s, phenomena=%s",
+                    self.location_name,
+                    vigilance_data.get("department"),
+                    vigilance_data.get("update_time"),
+                    list(vigilance_data.get("phenomena", {}).keys()),
+                )
 
             return vigilance_data
 
         except VigilanceApiError as err:
-            elapsed_time = time.monotonic() - start_time
+            elapsed_time = (time.perf_counter_ns() - start_ns) / 1e9
             _LOGGER.error(
                 "Failed to fetch vigilance data for %s (dept %s) after %.2fs: %s",
                 self.location_name,
@@ -494,7 +521,7 @@ class VigilanceCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             )
             raise UpdateFailed(f"Error fetching vigilance data: {err}") from err
         except Exception as err:
-            elapsed_time = time.monotonic() - start_time
+            elapsed_time = (time.perf_counter_ns() - start_ns) / 1e9
             _LOGGER.error(
                 "Unexpected error fetching vigilance data for %s (dept %s) after %.2fs: %s (type: %s)",
                 self.location_name,
@@ -1,7 +1,7 @@
 """Diagnostics support for Serac."""
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Callable
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
@@ -9,6 +9,29 @@ from homeassistant.helpers import device_registry as dr, entity_registry as er
 
 from .const import CONF_BRA_TOKEN, DOMAIN
 
+# Summaries for container values in the data structure dump, keyed by type
+_CONTAINER_DESCRIBERS: dict[type, Callable[[Any], str]] = {
+    dict: lambda value: f"<dict with {len(value)} keys>",
+    list: lambda value: f"<list with {len(value)} items>",
+}
+
+
+def _to_iso(value: Any) -> str | None:
+    """Convert a timestamp to an ISO format string.
+
+    Args:
+        value: Datetime, ISO string or None
+
+    Returns:
+        ISO format string, or None if the value has no ISO representation
+    """
+    if not value:
+        return None
+    if isinstance(value, str):
+        return value
+    isoformat = getattr(value, "isoformat", None)
+    return isoformat() if isoformat else None
+
 
 async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, entry: ConfigEntry
@@ -28,14 +51,13 @@ async def async_get_config_entry_diagnostics(
     data = hass.data[DOMAIN].get(entry.entry_id, {})
 
     # Redact sensitive data from config
-    config_data = {**entry.data}
+    config_data = dict(entry.data)
     if CONF_BRA_TOKEN in config_data:
         token = config_data[CONF_BRA_TOKEN]
         # Show only first 4 and last 4 characters
-        if token and len(token) > 8:
-            config_data[CONF_BRA_TOKEN] = f"{token[:4]}...{token[-4:]}"
-        else:
-            config_data[CONF_BRA_TOKEN] = "***REDACTED***"
+        config_data[CONF_BRA_TOKEN] = (
+            f"{token[:4]}...{token[-4:]}" if token and len(token) > 8 else "***REDACTED***"
+        )
 
     # Build diagnostics data
     diagnostics_data: dict[str, Any] = {
@@ -50,19 +72,10 @@ async def async_get_config_entry_diagnostics(
     arome_coordinator = data.get("arome_coordinator")
     if arome_coordinator:
         # Get last update time from data timestamp if available
-        last_update = None
-        if hasattr(arome_coordinator, "last_update_success_time"):
-            last_update = arome_coordinator.last_update_success_time
-        elif arome_coordinator.data and "timestamp" in arome_coordinator.data:
+        last_update = getattr(arome_coordinator, "last_update_success_time", None)
+        if last_update is None and arome_coordinator.data:
             last_update = arome_coordinator.data.get("timestamp")
-
-        # Convert to ISO format string if it's a datetime object
-        last_update_str = None
-        if last_update:
-            if isinstance(last_update, str):
-                last_update_str = last_update
-            elif hasattr(last_update, "isoformat"):
-                last_update_str = last_update.isoformat()
+        last_update_str = _to_iso(last_update)
 
         diagnostics_data["coordinators"]["arome"] = {
             "last_update_success": arome_coordinator.last_update_success,
@@ -73,19 +86,14 @@ async def async_get_config_entry_diagnostics(
                 else None
             ),
             "has_data": arome_coordinator.data is not None,
-            "data_keys": list(arome_coordinator.data.keys()) if arome_coordinator.data else [],
         }
 
-        # Add sample data structure (without actual values)
+        # Add sample data structure (without actual values); this also names every key
         if arome_coordinator.data:
             data_structure = {}
             for key, value in arome_coordinator.data.items():
-                if isinstance(value, dict):
-                    data_structure[key] = f"<dict with {len(value)} keys>"
-                elif isinstance(value, list):
-                    data_structure[key] = f"<list with {len(value)} items>"
-                else:
-                    data_structure[key] = type(value).__name__
+                describe = _CONTAINER_DESCRIBERS.get(type(value))
+                data_structure[key] = describe(value) if describe else type(value).__name__
             diagnostics_data["coordinators"]["arome"]["data_structure"] = data_structure
 
     # BRA coordinators status
@@ -94,19 +102,10 @@ async def async_get_config_entry_diagnostics(
         diagnostics_data["coordinators"]["bra"] = {}
         for massif_id, coordinator in bra_coordinators.items():
             # Get last update time from data if available
-            last_update = None
-            if hasattr(coordinator, "last_update_success_time"):
-                last_update = coordinator.last_update_success_time
-            elif coordinator.data and "bulletin_date" in coordinator.data:
+            last_update = getattr(coordinator, "last_update_success_time", None)
+            if last_update is None and coordinator.data:
                 last_update = coordinator.data.get("bulletin_date")
-
-            # Convert to ISO format string if it's a datetime object
-            last_update_str = None
-            if last_update:
-                if isinstance(last_update, str):
-                    last_update_str = last_update
-                elif hasattr(last_update, "isoformat"):
-                    last_update_str = last_update.isoformat()
+            last_update_str = _to_iso(last_update)
 
             diagnostics_data["coordinators"]["bra"][str(massif_id)] = {
                 "massif_name": coordinator.massif_name,
@@ -118,56 +117,48 @@ async def async_get_config_entry_diagnostics(
                     else None
                 ),
                 "has_data": coordinator.data is not None and coordinator.data.get("has_data", False),
-                "data_keys": list(coordinator.data.keys()) if coordinator.data else [],
+                "data_keys": tuple(coordinator.data) if coordinator.data else (),
             }
 
-    # Entity statistics
+    # Entity statistics (single pass over this entry's entities)
     entity_registry = er.async_get(hass)
-    entities = [
-        entity
-        for entity in entity_registry.entities.values()
-        if entity.config_entry_id == entry.entry_id
-    ]
-
-    diagnostics_data["statistics"]["total_entities"] = len(entities)
-    diagnostics_data["statistics"]["entity_breakdown"] = {
-        "weather": sum(1 for e in entities if e.domain == "weather"),
-        "sensor": sum(1 for e in entities if e.domain == "sensor"),
-    }
-
-    # Count sensor types
-    sensor_types = {}
-    avalanche_sensors = 0
-    weather_sensors = 0
-    for entity in entities:
-        if entity.domain == "sensor":
+    total_entities = weather_entities = sensor_entities = 0
+    avalanche_sensors = weather_sensors = 0
+    for entity in er.async_entries_for_config_entry(entity_registry, entry.entry_id):
+        total_entities += 1
+        domain = entity.domain
+        if domain == "weather":
+            weather_entities += 1
+        elif domain == "sensor":
+            sensor_entities += 1
             if "avalanche" in entity.entity_id:
                 avalanche_sensors += 1
             else:
                 weather_sensors += 1
 
+    diagnostics_data["statistics"]["total_entities"] = total_entities
+    diagnostics_data["statistics"]["entity_breakdown"] = {
+        "weather": weather_entities,
+        "sensor": sensor_entities,
+    }
     diagnostics_data["statistics"]["sensor_breakdown"] = {
         "weather_sensors": weather_sensors,
         "avalanche_sensors": avalanche_sensors,
     }
 
-    # Device statistics
+    # Device statistics (single pass over this entry's devices)
     device_registry = dr.async_get(hass)
-    devices = [
-        device
-        for device in device_registry.devices.values()
-        if entry.entry_id in device.config_entries
-    ]
-
-    diagnostics_data["statistics"]["total_devices"] = len(devices)
-    diagnostics_data["statistics"]["device_names"] = [
-        device.name for device in devices
-    ]
-
-    # Count massif devices
-    massif_devices = sum(1 for d in devices if "massif" in str(d.identifiers))
+    device_names = []
+    massif_devices = 0
+    for device in dr.async_entries_for_config_entry(device_registry, entry.entry_id):
+        device_names.append(device.name)
+        if "massif" in str(device.identifiers):
+            massif_devices += 1
+
+    diagnostics_data["statistics"]["total_devices"] = len(device_names)
+    diagnostics_data["statistics"]["device_names"] = device_names
     diagnostics_data["statistics"]["device_breakdown"] = {
-        "main_weather_device": 1 if len(devices) > 0 else 0,
+        "main_weather_device": 1 if device_names else 0,
         "massif_devices": massif_devices,
     }
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime
+import functools
 import logging
 from typing import Any
 from zoneinfo import ZoneInfo
@@ -24,7 +25,7 @@ from homeassistant.const import (
     UnitOfTemperature,
     UnitOfTime,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
@@ -70,31 +71,100 @@ from .utils import sanitize_entity_id_part
 
 _LOGGER = logging.getLogger(__name__)
 
+# BRA bulletins are published in French local time
+_PARIS_TZ = ZoneInfo("Europe/Paris")
 
+
+@functools.lru_cache(maxsize=64)
 def _parse_bra_datetime(date_str: str | None) -> datetime | None:
     """Parse BRA datetime string as Europe/Paris time and convert to UTC.
 
     BRA dates are in format '2026-02-11 16:00:00' without timezone.
     The API is French (Météo-France), so times are in Europe/Paris timezone.
-    We convert to UTC for Home Assistant storage.
+    We convert to UTC for Home Assistant storage. Bulletin dates change only
+    a few times a day, so results (including failures) are memoized.
     """
-    if not date_str:
+    if not date_str or not isinstance(date_str, str):
         return None
     try:
-        # Parse the datetime string
         dt = datetime.fromisoformat(date_str)
-        # Add Europe/Paris timezone (this is the source timezone)
-        dt_paris = dt.replace(tzinfo=ZoneInfo("Europe/Paris"))
-        # Convert to UTC for storage
-        return dt_paris.astimezone(dt_util.UTC)
-    except (ValueError, AttributeError) as err:
+    except ValueError as err:
         _LOGGER.warning("Failed to parse BRA datetime '%s': %s", date_str, err)
         return None
+    # Attach the Europe/Paris source timezone, then convert to UTC for storage
+    return dt.replace(tzinfo=_PARIS_TZ).astimezone(dt_util.UTC)
+
+
+def _path(*keys: str) -> Callable[[dict[str, Any]], Any]:
+    """Build an accessor for a value nested under the given keys.
+
+    Args:
+        *keys: Keys to follow from the coordinator data
+
+    Returns:
+        Function returning the nested value, or None if any level is missing
+    """
+
+    def get(data: dict[str, Any]) -> Any:
+        value = data
+        try:
+            for key in keys:
+                value = value[key]
+        except (KeyError, TypeError):
+            return None
+        return value
+
+    return get
+
+
+def _daily_value(
+    forecast_path: tuple[str, ...],
+    day_idx: int,
+    key: str,
+    transform: Callable[[Any], Any] | None = None,
+) -> Callable[[dict[str, Any]], Any]:
+    """Build an accessor for one field of a daily forecast entry.
+
+    Args:
+        forecast_path: Keys leading to the daily forecast list
+        day_idx: Index of the day in the forecast
+        key: Field to read from that day's entry
+        transform: Optional conversion applied to non-None values
+
+    Returns:
+        Function returning the field value, or None if the day is missing
+    """
+    get_forecast = _path(*forecast_path)
+
+    def get(data: dict[str, Any]) -> Any:
+        forecast = get_forecast(data)
+        if not forecast or day_idx >= len(forecast):
+            return None
+        value = forecast[day_idx].get(key)
+        if transform is not None and value is not None:
+            return transform(value)
+        return value
+
+    return get
 
 
-@dataclass
+def _seconds_to_hours(seconds: float) -> float:
+    """Convert a duration in seconds to hours."""
+    return seconds / 3600
+
+
+# Daily forecast lists in the weather coordinator data
+_WEATHER_DAILY = ("daily_forecast",)
+_AIR_QUALITY_DAILY = ("air_quality", "daily_forecast")
+
+
+@dataclass(frozen=True)
 class SeracSensorDescription(SensorEntityDescription):
-    """Class describing Serac sensor entities."""
+    """Class describing Serac sensor entities.
+
+    Frozen to match Home Assistant's entity descriptions, which are frozen
+    dataclasses; instances are module-level constants shared by all entries.
+    """
 
     value_fn: Callable[[dict[str, Any]], StateType] = None
     extra_attributes_fn: Callable[[dict[str, Any]], dict[str, Any]] | None = None
@@ -120,7 +190,7 @@ CURRENT_SENSORS: tuple[SeracSensorDescription, ...] = (
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("current", {}).get("temperature"),
+        value_fn=_path("current", "temperature"),
     ),
     SeracSensorDescription(
         key=SENSOR_TYPE_HUMIDITY,
@@ -128,14 +198,14 @@ CURRENT_SENSORS: tuple[SeracSensorDescription, ...] = (
         native_unit_of_measurement=PERCENTAGE,
         device_class=SensorDeviceClass.HUMIDITY,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("current", {}).get("humidity"),
+        value_fn=_path("current", "humidity"),
     ),
     SeracSensorDescription(
         key=SENSOR_TYPE_IS_DAY,
         name="Is Day",
         device_class=SensorDeviceClass.ENUM,
         icon="mdi:weather-sunny",
-        value_fn=lambda data: "day" if data.get("current", {}).get("is_day") else "night",
+        value_fn=lambda data, is_day=_path("current", "is_day"): "day" if is_day(data) else "night",
     ),
     SeracSensorDescription(
         key=SENSOR_TYPE_WIND_SPEED_CURRENT,
@@ -144,7 +214,7 @@ CURRENT_SENSORS: tuple[SeracSensorDescription, ...] = (
         device_class=SensorDeviceClass.WIND_SPEED,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:weather-windy",
-        value_fn=lambda data: data.get("current", {}).get("wind_speed"),
+        value_fn=_path("current", "wind_speed"),
     ),
     SeracSensorDescription(
         key=SENSOR_TYPE_WIND_DIRECTION_CURRENT,
@@ -152,7 +222,7 @@ CURRENT_SENSORS: tuple[SeracSensorDescription, ...] = (
         native_unit_of_measurement="°",
         icon="mdi:compass",
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("current", {}).get("wind_bearing"),
+        value_fn=_path("current", "wind_bearing"),
     ),
     SeracSensorDescription(
         key=SENSOR_TYPE_WIND_GUST_CURRENT,
@@ -161,7 +231,7 @@ CURRENT_SENSORS: tuple[SeracSensorDescription, ...] = (
         device_class=SensorDeviceClass.WIND_SPEED,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:weather-windy-variant",
-        value_fn=lambda data: data.get("current", {}).get("wind_gust"),
+        value_fn=_path("current", "wind_gust"),
     ),
     SeracSensorDescription(
         key=SENSOR_TYPE_PRECIPITATION_CURRENT,
@@ -170,7 +240,7 @@ CURRENT_SENSORS: tuple[SeracSensorDescription, ...] = (
         device_class=SensorDeviceClass.PRECIPITATION,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:weather-pouring",
-        value_fn=lambda data: data.get("current", {}).get("precipitation"),
+        value_fn=_path("current", "precipitation"),
     ),
     SeracSensorDescription(
         key=SENSOR_TYPE_RAIN_CURRENT,
@@ -179,7 +249,7 @@ CURRENT_SENSORS: tuple[SeracSensorDescription, ...] = (
         device_class=SensorDeviceClass.PRECIPITATION,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:weather-rainy",
-        value_fn=lambda data: data.get("current", {}).get("rain"),
+        value_fn=_path("current", "rain"),
     ),
     SeracSensorDescription(
         key=SENSOR_TYPE_SHOWERS_CURRENT,
@@ -188,7 +258,7 @@ CURRENT_SENSORS: tuple[SeracSensorDescription, ...] = (
         device_class=SensorDeviceClass.PRECIPITATION,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:weather-partly-rainy",
-        value_fn=lambda data: data.get("current", {}).get("showers"),
+        value_fn=_path("current", "showers"),
     ),
     SeracSensorDescription(
         key=SENSOR_TYPE_SNOWFALL_CURRENT,
@@ -197,7 +267,7 @@ CURRENT_SENSORS: tuple[SeracSensorDescription, ...] = (
         device_class=SensorDeviceClass.PRECIPITATION,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:weather-snowy",
-        value_fn=lambda data: data.get("current", {}).get("snowfall"),
+        value_fn=_path("current", "snowfall"),
     ),
     SeracSensorDescription(
         key=SENSOR_TYPE_CLOUD_COVERAGE,
@@ -205,7 +275,7 @@ CURRENT_SENSORS: tuple[SeracSensorDescription, ...] = (
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:cloud-percent",
-        value_fn=lambda data: data.get("current", {}).get("cloud_coverage"),
+        value_fn=_path("current", "cloud_coverage"),
     ),
 )
 
@@ -217,7 +287,7 @@ AIR_QUALITY_CURRENT_SENSORS: tuple[SeracSensorDescription, ...] = (
         native_unit_of_measurement="EAQI",
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:air-filter",
-        value_fn=lambda data: data.get("air_quality", {}).get("current", {}).get("european_aqi"),
+        value_fn=_path("air_quality", "current", "european_aqi"),
     ),
     SeracSensorDescription(
         key=SENSOR_TYPE_PM2_5,
@@ -225,7 +295,7 @@ AIR_QUALITY_CURRENT_SENSORS: tuple[SeracSensorDescription, ...] = (
         native_unit_of_measurement="µg/m³",
         device_class=SensorDeviceClass.PM25,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("air_quality", {}).get("current", {}).get("pm2_5"),
+        value_fn=_path("air_quality", "current", "pm2_5"),
     ),
     SeracSensorDescription(
         key=SENSOR_TYPE_PM10,
@@ -233,7 +303,7 @@ AIR_QUALITY_CURRENT_SENSORS: tuple[SeracSensorDescription, ...] = (
         native_unit_of_measurement="µg/m³",
         device_class=SensorDeviceClass.PM10,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("air_quality", {}).get("current", {}).get("pm10"),
+        value_fn=_path("air_quality", "current", "pm10"),
     ),
     SeracSensorDescription(
         key=SENSOR_TYPE_NITROGEN_DIOXIDE,
@@ -242,7 +312,7 @@ AIR_QUALITY_CURRENT_SENSORS: tuple[SeracSensorDescription, ...] = (
         device_class=SensorDeviceClass.NITROGEN_DIOXIDE,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:molecule",
-        value_fn=lambda data: data.get("air_quality", {}).get("current", {}).get("nitrogen_dioxide"),
+        value_fn=_path("air_quality", "current", "nitrogen_dioxide"),
     ),
     SeracSensorDescription(
         key=SENSOR_TYPE_OZONE,
@@ -251,7 +321,7 @@ AIR_QUALITY_CURRENT_SENSORS: tuple[SeracSensorDescription, ...] = (
         device_class=SensorDeviceClass.OZONE,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:molecule",
-        value_fn=lambda data: data.get("air_quality", {}).get("current", {}).get("ozone"),
+        value_fn=_path("air_quality", "current", "ozone"),
     ),
     SeracSensorDescription(
         key=SENSOR_TYPE_SULPHUR_DIOXIDE,
@@ -260,206 +330,135 @@ AIR_QUALITY_CURRENT_SENSORS: tuple[SeracSensorDescription, ...] = (
         device_class=SensorDeviceClass.SULPHUR_DIOXIDE,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:molecule",
-        value_fn=lambda data: data.get("air_quality", {}).get("current", {}).get("sulphur_dioxide"),
+        value_fn=_path("air_quality", "current", "sulphur_dioxide"),
     ),
 )
 
 
-def _create_daily_aqi_sensors() -> tuple[SeracSensorDescription, ...]:
-    """Create daily air quality sensors for days 0-4 (5 days)."""
-    sensors = []
-    day_names = ["Today", "Tomorrow", "Day 2", "Day 3", "Day 4"]
-
-    for day_idx in range(5):
-        day_name = day_names[day_idx]
-
-        # European AQI Max
-        sensors.append(SeracSensorDescription(
-            key=f"european_aqi_max_day{day_idx}",
-            name=f"Air Quality Index Max {day_name}",
-            native_unit_of_measurement="EAQI",
-            state_class=SensorStateClass.MEASUREMENT,
-            icon="mdi:air-filter",
-            value_fn=lambda data, idx=day_idx: data.get("air_quality", {}).get("daily_forecast", [])[idx].get("aqi_max") if len(data.get("air_quality", {}).get("daily_forecast", [])) > idx else None,
-        ))
-
-        # PM2.5 Max
-        sensors.append(SeracSensorDescription(
-            key=f"pm2_5_max_day{day_idx}",
-            name=f"PM2.5 Max {day_name}",
-            native_unit_of_measurement="µg/m³",
-            device_class=SensorDeviceClass.PM25,
-            state_class=SensorStateClass.MEASUREMENT,
-            value_fn=lambda data, idx=day_idx: data.get("air_quality", {}).get("daily_forecast", [])[idx].get("pm25_max") if len(data.get("air_quality", {}).get("daily_forecast", [])) > idx else None,
-        ))
-
-        # PM10 Max
-        sensors.append(SeracSensorDescription(
-            key=f"pm10_max_day{day_idx}",
-            name=f"PM10 Max {day_name}",
-            native_unit_of_measurement="µg/m³",
-            device_class=SensorDeviceClass.PM10,
-            state_class=SensorStateClass.MEASUREMENT,
-            value_fn=lambda data, idx=day_idx: data.get("air_quality", {}).get("daily_forecast", [])[idx].get("pm10_max") if len(data.get("air_quality", {}).get("daily_forecast", [])) > idx else None,
-        ))
-
-    return tuple(sensors)
-
-
-DAILY_AQI_SENSORS = _create_daily_aqi_sensors()
-
-
-def _create_daily_sensors() -> tuple[SeracSensorDescription, ...]:
-    """Create daily sensors for days 0, 1, 2."""
-    sensors = []
-    day_names = ["Today", "Tomorrow", "Day 2"]
-
-    for day_idx in range(3):
-        day_name = day_names[day_idx]
-
-        # Wind Speed Max
-        sensors.append(SeracSensorDescription(
-            key=f"wind_speed_max_day{day_idx}",
-            name=f"Wind Speed Max {day_name}",
-            native_unit_of_measurement=UnitOfSpeed.KILOMETERS_PER_HOUR,
-            device_class=SensorDeviceClass.WIND_SPEED,
-            state_class=SensorStateClass.MEASUREMENT,
-            icon="mdi:weather-windy",
-            value_fn=lambda data, idx=day_idx: data.get("daily_forecast", [])[idx].get("wind_speed") if len(data.get("daily_forecast", [])) > idx else None,
-        ))
-
-        # Wind Gust Max
-        sensors.append(SeracSensorDescription(
-            key=f"wind_gust_max_day{day_idx}",
-            name=f"Wind Gust Max {day_name}",
-            native_unit_of_measurement=UnitOfSpeed.KILOMETERS_PER_HOUR,
-            device_class=SensorDeviceClass.WIND_SPEED,
-            state_class=SensorStateClass.MEASUREMENT,
-            icon="mdi:weather-windy-variant",
-            value_fn=lambda data, idx=day_idx: data.get("daily_forecast", [])[idx].get("wind_gust_speed") if len(data.get("daily_forecast", [])) > idx else None,
-        ))
-
-        # Wind Direction
-        sensors.append(SeracSensorDescription(
-            key=f"wind_direction_day{day_idx}",
-            name=f"Wind Direction {day_name}",
-            native_unit_of_measurement="°",
-            icon="mdi:compass",
-            state_class=SensorStateClass.MEASUREMENT,
-            value_fn=lambda data, idx=day_idx: data.get("daily_forecast", [])[idx].get("wind_bearing") if len(data.get("daily_forecast", [])) > idx else None,
-        ))
-
-        # Sunrise
-        sensors.append(SeracSensorDescription(
-            key=f"sunrise_day{day_idx}",
-            name=f"Sunrise {day_name}",
-            device_class=SensorDeviceClass.TIMESTAMP,
-            icon="mdi:weather-sunset-up",
-            value_fn=lambda data, idx=day_idx: data.get("daily_forecast", [])[idx].get("sunrise") if len(data.get("daily_forecast", [])) > idx else None,
-        ))
-
-        # Sunset
-        sensors.append(SeracSensorDescription(
-            key=f"sunset_day{day_idx}",
-            name=f"Sunset {day_name}",
-            device_class=SensorDeviceClass.TIMESTAMP,
-            icon="mdi:weather-sunset-down",
-            value_fn=lambda data, idx=day_idx: data.get("daily_forecast", [])[idx].get("sunset") if len(data.get("daily_forecast", [])) > idx else None,
-        ))
-
-        # Sunshine Duration
-        sensors.append(SeracSensorDescription(
-            key=f"sunshine_duration_day{day_idx}",
-            name=f"Sunshine Duration {day_name}",
-            native_unit_of_measurement=UnitOfTime.HOURS,
-            device_class=SensorDeviceClass.DURATION,
-            state_class=SensorStateClass.MEASUREMENT,
-            icon="mdi:weather-sunny",
-            value_fn=lambda data, idx=day_idx: (data.get("daily_forecast", [])[idx].get("sunshine_duration") / 3600) if len(data.get("daily_forecast", [])) > idx and data.get("daily_forecast", [])[idx].get("sunshine_duration") is not None else None,
-        ))
-
-        # Daylight Duration
-        sensors.append(SeracSensorDescription(
-            key=f"daylight_duration_day{day_idx}",
-            name=f"Daylight Duration {day_name}",
-            native_unit_of_measurement=UnitOfTime.HOURS,
-            device_class=SensorDeviceClass.DURATION,
-            state_class=SensorStateClass.MEASUREMENT,
-            icon="mdi:weather-sunset",
-            value_fn=lambda data, idx=day_idx: (data.get("daily_forecast", [])[idx].get("daylight_duration") / 3600) if len(data.get("daily_forecast", [])) > idx and data.get("daily_forecast", [])[idx].get("daylight_duration") is not None else None,
-        ))
-
-        # UV Index
-        sensors.append(SeracSensorDescription(
-            key=f"uv_index_day{day_idx}",
-            name=f"UV Index {day_name}",
-            state_class=SensorStateClass.MEASUREMENT,
-            icon="mdi:weather-sunny-alert",
-            value_fn=lambda data, idx=day_idx: data.get("daily_forecast", [])[idx].get("uv_index") if len(data.get("daily_forecast", [])) > idx else None,
-        ))
-
-        # Rain Sum
-        sensors.append(SeracSensorDescription(
-            key=f"rain_sum_day{day_idx}",
-            name=f"Rain Sum {day_name}",
-            native_unit_of_measurement=UnitOfLength.MILLIMETERS,
-            device_class=SensorDeviceClass.PRECIPITATION,
-            state_class=SensorStateClass.TOTAL,
-            icon="mdi:weather-rainy",
-            value_fn=lambda data, idx=day_idx: data.get("daily_forecast", [])[idx].get("rain_sum") if len(data.get("daily_forecast", [])) > idx else None,
-        ))
-
-        # Showers Sum
-        sensors.append(SeracSensorDescription(
-            key=f"showers_sum_day{day_idx}",
-            name=f"Showers Sum {day_name}",
-            native_unit_of_measurement=UnitOfLength.MILLIMETERS,
-            device_class=SensorDeviceClass.PRECIPITATION,
-            state_class=SensorStateClass.TOTAL,
-            icon="mdi:weather-partly-rainy",
-            value_fn=lambda data, idx=day_idx: data.get("daily_forecast", [])[idx].get("showers_sum") if len(data.get("daily_forecast", [])) > idx else None,
-        ))
-
-        # Snowfall Sum
-        sensors.append(SeracSensorDescription(
-            key=f"snowfall_sum_day{day_idx}",
-            name=f"Snowfall Sum {day_name}",
-            native_unit_of_measurement=UnitOfLength.CENTIMETERS,
-            device_class=SensorDeviceClass.PRECIPITATION,
-            state_class=SensorStateClass.TOTAL,
-            icon="mdi:weather-snowy",
-            value_fn=lambda data, idx=day_idx: data.get("daily_forecast", [])[idx].get("snowfall_sum") if len(data.get("daily_forecast", [])) > idx else None,
-        ))
-
-        # Precipitation Sum
-        sensors.append(SeracSensorDescription(
-            key=f"precipitation_sum_day{day_idx}",
-            name=f"Precipitation Sum {day_name}",
-            native_unit_of_measurement=UnitOfLength.MILLIMETERS,
-            device_class=SensorDeviceClass.PRECIPITATION,
-            state_class=SensorStateClass.TOTAL,
-            icon="mdi:weather-pouring",
-            value_fn=lambda data, idx=day_idx: data.get("daily_forecast", [])[idx].get("precipitation_sum") if len(data.get("daily_forecast", [])) > idx else None,
-        ))
-
-        # Precipitation Hours
-        sensors.append(SeracSensorDescription(
-            key=f"precipitation_hours_day{day_idx}",
-            name=f"Precipitation Hours {day_name}",
-            native_unit_of_measurement=UnitOfTime.HOURS,
-            device_class=SensorDeviceClass.DURATION,
-            state_class=SensorStateClass.MEASUREMENT,
-            icon="mdi:clock-outline",
-            value_fn=lambda data, idx=day_idx: data.get("daily_forecast", [])[idx].get("precipitation_hours") if len(data.get("daily_forecast", [])) > idx else None,
-        ))
+# Display names of forecast days 0-4, used in daily sensor names
+_DAY_NAMES = ("Today", "Tomorrow", "Day 2", "Day 3", "Day 4")
+
+# Daily air quality sensors: (key, name, forecast field, description kwargs)
+_DAILY_AQI_SPECS: tuple[tuple[str, str, str, dict[str, Any]], ...] = (
+    ("european_aqi_max", "Air Quality Index Max", "aqi_max", {
+        "native_unit_of_measurement": "EAQI",
+        "state_class": SensorStateClass.MEASUREMENT,
+        "icon": "mdi:air-filter",
+    }),
+    ("pm2_5_max", "PM2.5 Max", "pm25_max", {
+        "native_unit_of_measurement": "µg/m³",
+        "device_class": SensorDeviceClass.PM25,
+        "state_class": SensorStateClass.MEASUREMENT,
+    }),
+    ("pm10_max", "PM10 Max", "pm10_max", {
+        "native_unit_of_measurement": "µg/m³",
+        "device_class": SensorDeviceClass.PM10,
+        "state_class": SensorStateClass.MEASUREMENT,
+    }),
+)
 
-    return tuple(sensors)
+# Daily weather sensors: (key, name, forecast field, transform, description kwargs)
+_DAILY_SPECS: tuple[tuple[str, str, str, Callable[[Any], Any] | None, dict[str, Any]], ...] = (
+    ("wind_speed_max", "Wind Speed Max", "wind_speed", None, {
+        "native_unit_of_measurement": UnitOfSpeed.KILOMETERS_PER_HOUR,
+        "device_class": SensorDeviceClass.WIND_SPEED,
+        "state_class": SensorStateClass.MEASUREMENT,
+        "icon": "mdi:weather-windy",
+    }),
+    ("wind_gust_max", "Wind Gust Max", "wind_gust_speed", None, {
+        "native_unit_of_measurement": UnitOfSpeed.KILOMETERS_PER_HOUR,
+        "device_class": SensorDeviceClass.WIND_SPEED,
+        "state_class": SensorStateClass.MEASUREMENT,
+        "icon": "mdi:weather-windy-variant",
+    }),
+    ("wind_direction", "Wind Direction", "wind_bearing", None, {
+        "native_unit_of_measurement": "°",
+        "icon": "mdi:compass",
+        "state_class": SensorStateClass.MEASUREMENT,
+    }),
+    ("sunrise", "Sunrise", "sunrise", None, {
+        "device_class": SensorDeviceClass.TIMESTAMP,
+        "icon": "mdi:weather-sunset-up",
+    }),
+    ("sunset", "Sunset", "sunset", None, {
+        "device_class": SensorDeviceClass.TIMESTAMP,
+        "icon": "mdi:weather-sunset-down",
+    }),
+    ("sunshine_duration", "Sunshine Duration", "sunshine_duration", _seconds_to_hours, {
+        "native_unit_of_measurement": UnitOfTime.HOURS,
+        "device_class": SensorDeviceClass.DURATION,
+        "state_class": SensorStateClass.MEASUREMENT,
+        "icon": "mdi:weather-sunny",
+    }),
+    ("daylight_duration", "Daylight Duration", "daylight_duration", _seconds_to_hours, {
+        "native_unit_of_measurement": UnitOfTime.HOURS,
+        "device_class": SensorDeviceClass.DURATION,
+        "state_class": SensorStateClass.MEASUREMENT,
+        "icon": "mdi:weather-sunset",
+    }),
+    ("uv_index", "UV Index", "uv_index", None, {
+        "state_class": SensorStateClass.MEASUREMENT,
+        "icon": "mdi:weather-sunny-alert",
+    }),
+    ("rain_sum", "Rain Sum", "rain_sum", None, {
+        "native_unit_of_measurement": UnitOfLength.MILLIMETERS,
+        "device_class": SensorDeviceClass.PRECIPITATION,
+        "state_class": SensorStateClass.TOTAL,
+        "icon": "mdi:weather-rainy",
+    }),
+    ("showers_sum", "Showers Sum", "showers_sum", None, {
+        "native_unit_of_measurement": UnitOfLength.MILLIMETERS,
+        "device_class": SensorDeviceClass.PRECIPITATION,
+        "state_class": SensorStateClass.TOTAL,
+        "icon": "mdi:weather-partly-rainy",
+    }),
+    ("snowfall_sum", "Snowfall Sum", "snowfall_sum", None, {
+        "native_unit_of_measurement": UnitOfLength.CENTIMETERS,
+        "device_class": SensorDeviceClass.PRECIPITATION,
+        "state_class": SensorStateClass.TOTAL,
+        "icon": "mdi:weather-snowy",
+    }),
+    ("precipitation_sum", "Precipitation Sum", "precipitation_sum", None, {
+        "native_unit_of_measurement": UnitOfLength.MILLIMETERS,
+        "device_class": SensorDeviceClass.PRECIPITATION,
+        "state_class": SensorStateClass.TOTAL,
+        "icon": "mdi:weather-pouring",
+    }),
+    ("precipitation_hours", "Precipitation Hours", "precipitation_hours", None, {
+        "native_unit_of_measurement": UnitOfTime.HOURS,
+        "device_class": SensorDeviceClass.DURATION,
+        "state_class": SensorStateClass.MEASUREMENT,
+        "icon": "mdi:clock-outline",
+    }),
+)
 
+# Daily air quality sensors for days 0-4 (5 days)
+DAILY_AQI_SENSORS: tuple[SeracSensorDescription, ...] = tuple(
+    SeracSensorDescription(
+        key=f"{key}_day{day_idx}",
+        name=f"{name} {day_name}",
+        value_fn=_daily_value(_AIR_QUALITY_DAILY, day_idx, field),
+        **kwargs,
+    )
+    for day_idx, day_name in enumerate(_DAY_NAMES)
+    for key, name, field, kwargs in _DAILY_AQI_SPECS
+)
 
-DAILY_SENSORS = _create_daily_sensors()
+# Daily weather sensors for days 0, 1, 2
+DAILY_SENSORS: tuple[SeracSensorDescription, ...] = tuple(
+    SeracSensorDescription(
+        key=f"{key}_day{day_idx}",
+        name=f"{name} {day_name}",
+        value_fn=_daily_value(_WEATHER_DAILY, day_idx, field, transform),
+        **kwargs,
+    )
+    for day_idx, day_name in enumerate(_DAY_NAMES[:3])
+    for key, name, field, transform, kwargs in _DAILY_SPECS
+)
 
 
 # BRA (Avalanche Bulletin) Sensors
+# BraSensor only calls these functions when the bulletin has data
 BRA_SENSORS: tuple[SeracSensorDescription, ...] = (
     SeracSensorDescription(
         key=SENSOR_TYPE_AVALANCHE_RISK_TODAY,
@@ -469,7 +468,7 @@ BRA_SENSORS: tuple[SeracSensorDescription, ...] = (
         extra_attributes_fn=lambda data: {
             "risk_comment": data.get("risk_comment"),
             "warning": data.get("warning"),
-        } if data.get("has_data") else {},
+        },
     ),
     SeracSensorDescription(
         key=SENSOR_TYPE_AVALANCHE_RISK_TOMORROW,
@@ -480,56 +479,65 @@ BRA_SENSORS: tuple[SeracSensorDescription, ...] = (
             "date": data.get("date_risk_j2"),
             "risk_text": data.get("risk_j2_text"),
             "comment": data.get("risk_j2_comment"),
-        } if data.get("has_data") else {},
+        },
     ),
     SeracSensorDescription(
         key=SENSOR_TYPE_AVALANCHE_ACCIDENTAL,
         name="Avalanche Accidental Risk",
         icon="mdi:skiing",
-        value_fn=lambda data: data.get("accidental_text") if data.get("has_data") else None,
+        value_fn=lambda data: data.get("accidental_text"),
     ),
     SeracSensorDescription(
         key=SENSOR_TYPE_AVALANCHE_NATURAL,
         name="Avalanche Natural Risk",
         icon="mdi:landslide",
-        value_fn=lambda data: data.get("natural_text") if data.get("has_data") else None,
+        value_fn=lambda data: data.get("natural_text"),
     ),
     SeracSensorDescription(
         key=SENSOR_TYPE_AVALANCHE_SUMMARY,
         name="Avalanche Risk Summary",
         icon="mdi:text-box-multiple",
-        value_fn=lambda data: data.get("summary") if data.get("has_data") else None,
+        value_fn=lambda data: data.get("summary"),
     ),
     SeracSensorDescription(
         key=SENSOR_TYPE_AVALANCHE_BULLETIN_DATE,
         name="Avalanche Bulletin Date",
         device_class=SensorDeviceClass.TIMESTAMP,
         icon="mdi:calendar-clock",
-        value_fn=lambda data: _parse_bra_datetime(data.get("bulletin_date")) if data.get("has_data") else None,
+        value_fn=lambda data: _parse_bra_datetime(data.get("bulletin_date")),
         extra_attributes_fn=lambda data: {
             "massif": data.get("massif_name"),
-        } if data.get("has_data") else {},
+        },
     ),
     SeracSensorDescription(
         key=SENSOR_TYPE_AVALANCHE_RISK_HIGH_ALT,
         name="Avalanche Risk High Altitude",
         icon="mdi:image-filter-hdr",
-        value_fn=lambda data: data.get("risk_high_altitude") if data.get("has_data") else None,
+        value_fn=lambda data: data.get("risk_high_altitude"),
         extra_attributes_fn=lambda data: {
             "altitude_limit": data.get("altitude_limit"),
-        } if data.get("has_data") and data.get("altitude_limit") else {},
+        } if data.get("altitude_limit") else {},
     ),
     SeracSensorDescription(
         key=SENSOR_TYPE_AVALANCHE_RISK_LOW_ALT,
         name="Avalanche Risk Low Altitude",
         icon="mdi:terrain",
-        value_fn=lambda data: data.get("risk_low_altitude") if data.get("has_data") else None,
+        value_fn=lambda data: data.get("risk_low_altitude"),
         extra_attributes_fn=lambda data: {
             "altitude_limit": data.get("altitude_limit"),
-        } if data.get("has_data") and data.get("altitude_limit") else {},
+        } if data.get("altitude_limit") else {},
     ),
 )
 
+# Every description backed by the AROME coordinator, in entity creation order
+AROME_SENSORS: tuple[SeracSensorDescription, ...] = (
+    STATIC_SENSORS
+    + CURRENT_SENSORS
+    + DAILY_SENSORS
+    + AIR_QUALITY_CURRENT_SENSORS
+    + DAILY_AQI_SENSORS
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -543,47 +551,49 @@ async def async_setup_entry(
     latitude = entry.data[CONF_LATITUDE]
     longitude = entry.data[CONF_LONGITUDE]
 
-    # Create all sensors
-    entities = []
-
-    # Add static sensors (elevation)
-    for description in STATIC_SENSORS:
-        entities.append(SeracSensor(
-            coordinator, description, location_name, entity_prefix, latitude, longitude
-        ))
-
-    # Add current weather sensors
-    for description in CURRENT_SENSORS:
-        entities.append(SeracSensor(
-            coordinator, description, location_name, entity_prefix, latitude, longitude
-        ))
-
-    # Add daily sensors
-    for description in DAILY_SENSORS:
-        entities.append(SeracSensor(
-            coordinator, description, location_name, entity_prefix, latitude, longitude
-        ))
-
-    # Add current air quality sensors
-    for description in AIR_QUALITY_CURRENT_SENSORS:
-        entities.append(SeracSensor(
-            coordinator, description, location_name, entity_prefix, latitude, longitude
-        ))
-
-    # Add daily air quality sensors
-    for description in DAILY_AQI_SENSORS:
-        entities.append(SeracSensor(
-            coordinator, description, location_name, entity_prefix, latitude, longitude
-        ))
+    # Shared entity_id / unique_id heads, built once instead of per sensor
+    entity_id_base = f"sensor.serac_{sanitize_entity_id_part(entity_prefix)}_"
+    unique_id_base = f"serac_{latitude}_{longitude}_"
+
+    # One DeviceInfo shared by every weather sensor of this location
+    device_info = DeviceInfo(
+        identifiers={(DOMAIN, f"serac_{latitude}_{longitude}")},
+        name=f"{location_name} (Serac)",
+        manufacturer=MANUFACTURER,
+        model="Mountain Weather Station",
+        entry_type=DeviceEntryType.SERVICE,
+    )
+
+    # Add static, current, daily and air quality sensors in one pass
+    entities: list[SensorEntity] = [
+        SeracSensor(coordinator, description, device_info, entity_id_base, unique_id_base)
+        for description in AROME_SENSORS
+    ]
 
     # Add BRA (avalanche) sensors for each massif
     bra_coordinators = hass.data[DOMAIN][entry.entry_id].get("bra_coordinators", {})
     for massif_id, bra_coordinator in bra_coordinators.items():
         massif_name = bra_coordinator.massif_name
-        for description in BRA_SENSORS:
-            entities.append(BraSensor(
-                bra_coordinator, description, location_name, entity_prefix, latitude, longitude, massif_id, massif_name
-            ))
+        massif_entity_id_base = f"{entity_id_base}{sanitize_entity_id_part(massif_name)}_"
+        massif_unique_id_base = f"{unique_id_base}{massif_id}_"
+        massif_device_info = DeviceInfo(
+            identifiers={(DOMAIN, f"serac_{latitude}_{longitude}_massif_{massif_id}")},
+            name=f"{location_name} - {massif_name} (Serac)",
+            manufacturer=MANUFACTURER,
+            model="BRA Avalanche Bulletin",
+            entry_type=DeviceEntryType.SERVICE,
+        )
+        entities.extend(
+            BraSensor(
+                bra_coordinator,
+                description,
+                massif_name,
+                massif_device_info,
+                massif_entity_id_base,
+                massif_unique_id_base,
+            )
+            for description in BRA_SENSORS
+        )
 
     # Add Vigilance (weather alert) sensors if coordinator exists
     vigilance_coordinator = hass.data[DOMAIN][entry.entry_id].get("vigilance_coordinator")
@@ -622,68 +632,69 @@ class SeracSensor(CoordinatorEntity[AromeCoordinator], SensorEntity):
         self,
         coordinator: AromeCoordinator,
         description: SeracSensorDescription,
-        location_name: str,
-        entity_prefix: str,
-        latitude: float,
-        longitude: float,
+        device_info: DeviceInfo,
+        entity_id_base: str,
+        unique_id_base: str,
     ) -> None:
         """Initialize the sensor.
 
         Args:
             coordinator: Data coordinator
             description: Sensor entity description
-            location_name: Name of the location
-            entity_prefix: Prefix for entity ID
-            latitude: Location latitude
-            longitude: Location longitude
+            device_info: Location device shared by all weather sensors
+            entity_id_base: Entity ID head, "sensor.serac_{prefix}_"
+            unique_id_base: Unique ID head, "serac_{lat}_{lon}_"
         """
         super().__init__(coordinator)
         self.entity_description = description
-        self._location_name = location_name
-        self._entity_prefix = entity_prefix
-        self._latitude = latitude
-        self._longitude = longitude
+        self._attr_device_info = device_info
 
-        # Sanitize entity_prefix for entity_id (removes special characters like é, à, etc.)
-        safe_prefix = sanitize_entity_id_part(entity_prefix)
-
-        # Set entity_id using new pattern: sensor.serac_{prefix}_{sensor_type}
-        self.entity_id = f"sensor.serac_{safe_prefix}_{description.key}"
+        # Entity ID pattern: sensor.serac_{prefix}_{sensor_type}
+        self.entity_id = entity_id_base + description.key
 
         # Unique ID uses coordinates for uniqueness
-        self._attr_unique_id = f"serac_{latitude}_{longitude}_{description.key}"
+        self._attr_unique_id = unique_id_base + description.key
         self._attr_name = description.name
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information about this sensor."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"serac_{self._latitude}_{self._longitude}")},
-            name=f"{self._location_name} (Serac)",
-            manufacturer=MANUFACTURER,
-            model="Mountain Weather Station",
-            entry_type=DeviceEntryType.SERVICE,
-        )
+        # Last computed value and the coordinator payload it came from
+        self._cached_data: dict[str, Any] | None = None
+        self._cached_value: StateType = None
 
-    @property
-    def native_value(self) -> StateType:
-        """Return the state of the sensor."""
-        if not self.coordinator.data:
-            return None
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Drop the cached value and write the new state."""
+        self._cached_data = None
+        super()._handle_coordinator_update()
+
+    def _compute_value(self) -> StateType:
+        """Return the sensor value for the current coordinator data.
 
-        value = self.entity_description.value_fn(self.coordinator.data)
+        Returns:
+            Value from the description's value_fn, or None without data
+        """
+        data = self.coordinator.data
+        if not data:
+            return None
 
-        # Handle datetime objects
-        if isinstance(value, datetime):
-            return value
+        # value_fn only needs to run once per coordinator payload
+        if data is self._cached_data:
+            return self._cached_value
 
+        value = self.entity_description.value_fn(data)
+        self._cached_data = data
+        self._cached_value = value
         return value
 
+    @property
+    def native_value(self) -> StateType:
+        """Return the state of the sensor."""
+        return self._compute_value()
+
     @property
     def available(self) -> bool:
         """Return if entity is available."""
         # Sensor is available if coordinator has data and value is not None
-        return self.coordinator.last_update_success and self.native_value is not None
+        return self.coordinator.last_update_success and self._compute_value() is not None
 
 
 class BraSensor(CoordinatorEntity[BraCoordinator], SensorEntity):
@@ -697,77 +708,63 @@ class BraSensor(CoordinatorEntity[BraCoordinator], SensorEntity):
         self,
         coordinator: BraCoordinator,
         description: SeracSensorDescription,
-        location_name: str,
-        entity_prefix: str,
-        latitude: float,
-        longitude: float,
-        massif_id: int,
         massif_name: str,
+        device_info: DeviceInfo,
+        entity_id_base: str,
+        unique_id_base: str,
     ) -> None:
         """Initialize the BRA sensor."""
         super().__init__(coordinator)
         self.entity_description = description
-        self._location_name = location_name
-        self._entity_prefix = entity_prefix
-        self._latitude = latitude
-        self._longitude = longitude
-        self._massif_id = massif_id
-        self._massif_name = massif_name
-
-        # Sanitize both entity_prefix and massif_name for entity_id
-        safe_prefix = sanitize_entity_id_part(entity_prefix)
-        massif_slug = sanitize_entity_id_part(massif_name)
+        self._attr_device_info = device_info
 
-        # Set entity_id using new pattern: sensor.serac_{prefix}_{massif}_{sensor_type}
-        self.entity_id = f"sensor.serac_{safe_prefix}_{massif_slug}_{description.key}"
+        # Entity ID pattern: sensor.serac_{prefix}_{massif}_{sensor_type}
+        self.entity_id = entity_id_base + description.key
 
         # Unique ID uses coordinates and massif_id for uniqueness
-        self._attr_unique_id = f"serac_{latitude}_{longitude}_{massif_id}_{description.key}"
+        self._attr_unique_id = unique_id_base + description.key
 
         # Name includes massif
         self._attr_name = f"{description.name} - {massif_name}"
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"serac_{self._latitude}_{self._longitude}_massif_{self._massif_id}")},
-            name=f"{self._location_name} - {self._massif_name} (Serac)",
-            manufacturer=MANUFACTURER,
-            model="BRA Avalanche Bulletin",
-            entry_type=DeviceEntryType.SERVICE,
-        )
+        # Last computed value and the coordinator payload it came from
+        self._cached_data: dict[str, Any] | None = None
+        self._cached_value: StateType = None
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra state attributes."""
-        if not self.coordinator.data or not self.coordinator.data.get("has_data"):
+        data = self.coordinator.data
+        if not data or not data.get("has_data"):
             return {}
 
         # Get base attributes from description
-        if hasattr(self.entity_description, "extra_attributes_fn") and self.entity_description.extra_attributes_fn is not None:
-            attrs = self.entity_description.extra_attributes_fn(self.coordinator.data)
-            if attrs:
-                return attrs
+        extra_attributes_fn = self.entity_description.extra_attributes_fn
+        if extra_attributes_fn is None:
+            return {}
+        return extra_attributes_fn(data) or {}
 
-        return {}
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Drop the cached value and write the new state."""
+        self._cached_data = None
+        super()._handle_coordinator_update()
 
     @property
     def native_value(self) -> StateType:
         """Return the state of the sensor."""
-        if not self.coordinator.data:
-            return None
-
+        data = self.coordinator.data
         # Check if data is available
-        if not self.coordinator.data.get("has_data"):
+        if not data or not data.get("has_data"):
             return None
 
-        value = self.entity_description.value_fn(self.coordinator.data)
-
-        # Handle datetime objects
-        if isinstance(value, datetime):
-            return value
+        # value_fn only needs to run once per coordinator payload
+        if data is self._cached_data:
+            return self._cached_value
 
+        value = self.entity_description.value_fn(data)
+        self._cached_data = data
+        self._cached_value = value
         return value
 
     @property
@@ -778,10 +775,8 @@ class BraSensor(CoordinatorEntity[BraCoordinator], SensorEntity):
             return False
 
         # If data exists but has_data is False (out of season), mark unavailable
-        if self.coordinator.data and not self.coordinator.data.get("has_data"):
-            return False
-
-        return True
+        data = self.coordinator.data
+        return not data or bool(data.get("has_data"))
 
 
 class VigilanceSensor(CoordinatorEntity, SensorEntity):
@@ -1,9 +1,13 @@
 """Weather platform for Serac integration."""
 from __future__ import annotations
 
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
 from datetime import datetime
 import logging
-from typing import Any
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Any, Final
 
 from homeassistant.components.weather import (
     ATTR_FORECAST_CONDITION,
@@ -28,7 +32,7 @@ from homeassistant.const import (
     UnitOfTemperature,
     UnitOfLength,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -44,6 +48,300 @@ from .coordinator import AromeCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Shared read-only fallback for missing data sections
+_EMPTY: Final[Mapping[str, Any]] = MappingProxyType({})
+
+# Unit-suffixed attributes: (source field, attribute name, unit)
+_CURRENT_ATTRS: Final = (
+    ("temperature", "current_temperature", "°C"),
+    ("humidity", "current_humidity", "%"),
+    ("wind_speed", "current_wind_speed", "km/h"),
+    ("wind_bearing", "current_wind_direction", "°"),
+    ("wind_gust", "current_wind_gust", "km/h"),
+    ("precipitation", "current_precipitation", "mm"),
+    ("rain", "current_rain", "mm"),
+    ("showers", "current_showers", "mm"),
+    ("snowfall", "current_snowfall", "cm"),
+    ("cloud_coverage", "current_cloud_coverage", "%"),
+)
+
+# Unit-suffixed daily attributes: (source field, attribute suffix, unit)
+_DAY_ATTRS: Final = (
+    ("wind_speed", "wind_speed_max", "km/h"),
+    ("wind_gust_speed", "wind_gust_max", "km/h"),
+    ("wind_bearing", "wind_direction", "°"),
+    ("rain_sum", "rain_sum", "mm"),
+    ("showers_sum", "showers_sum", "mm"),
+    ("snowfall_sum", "snowfall_sum", "cm"),
+    ("precipitation_sum", "precipitation_sum", "mm"),
+    ("precipitation_hours", "precipitation_hours", "h"),
+)
+
+# Unit-suffixed hourly and daily air quality attributes, named after the
+# source field: (source field, unit)
+_HOURLY_ATTRS: Final = (
+    ("temperature", "°C"),
+    ("wind_speed", "km/h"),
+    ("wind_gust", "km/h"),
+    ("cloud_cover", "%"),
+    ("snowfall", "cm"),
+    ("rain", "mm"),
+    ("precipitation", "mm"),
+)
+_DAILY_AQI_ATTRS: Final = (
+    ("aqi_max", " EAQI"),
+    ("pm25_max", "µg/m³"),
+    ("pm10_max", "µg/m³"),
+)
+
+# Current air quality attributes: (source field, attribute name, unit)
+_CURRENT_AQI_ATTRS: Final = tuple(
+    (src, f"current_{src}", unit)
+    for src, unit in (
+        ("european_aqi", " EAQI"),
+        ("pm2_5", "µg/m³"),
+        ("pm10", "µg/m³"),
+        ("nitrogen_dioxide", "µg/m³"),
+        ("ozone", "µg/m³"),
+        ("sulphur_dioxide", "µg/m³"),
+    )
+)
+
+# Attribute name prefixes for forecast days 0-7
+_DAY_PREFIXES: Final = (
+    "today", "tomorrow", "day_2", "day_3", "day_4", "day_5", "day_6", "day_7",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class _DayKeys:
+    """Precomputed attribute names for one forecast day."""
+
+    fields: tuple[tuple[str, str, str], ...]
+    datetime: str
+    sunrise: str
+    sunset: str
+    sunshine_duration: str
+    daylight_duration: str
+    uv_index: str
+
+
+def _day_keys(prefix: str) -> _DayKeys:
+    """Build the attribute names for one forecast day.
+
+    Args:
+        prefix: Attribute name prefix for the day (e.g. "today", "day_3")
+
+    Returns:
+        Attribute names for every daily field
+    """
+    return _DayKeys(
+        fields=tuple((src, f"{prefix}_{suffix}", unit) for src, suffix, unit in _DAY_ATTRS),
+        datetime=f"{prefix}_datetime",
+        sunrise=f"{prefix}_sunrise",
+        sunset=f"{prefix}_sunset",
+        sunshine_duration=f"{prefix}_sunshine_duration",
+        daylight_duration=f"{prefix}_daylight_duration",
+        uv_index=f"{prefix}_uv_index",
+    )
+
+
+# Attribute names indexed by forecast day / hour, so the attribute builder
+# does no key formatting at runtime
+_DAY_KEYS: Final = tuple(_day_keys(prefix) for prefix in _DAY_PREFIXES)
+_HOUR_KEYS: Final = tuple(
+    (f"hour_{hour}_datetime", tuple((src, f"hour_{hour}_{src}", unit) for src, unit in _HOURLY_ATTRS))
+    for hour in range(1, 7)
+)
+_AQI_DAY_KEYS: Final = tuple(
+    (tuple((src, f"{prefix}_{src}", unit) for src, unit in _DAILY_AQI_ATTRS), f"{prefix}_aqi_date")
+    for prefix in _DAY_PREFIXES[:5]
+)
+
+
+# Forecast fields besides datetime: (coordinator field, Forecast key)
+_DAILY_FORECAST_FIELDS: Final = (
+    ("condition", "condition"),
+    ("temperature", "native_temperature"),
+    ("templow", "native_templow"),
+    ("precipitation", "native_precipitation"),
+    ("precipitation_probability", "precipitation_probability"),
+    ("wind_speed", "native_wind_speed"),
+    ("wind_gust_speed", "native_wind_gust_speed"),
+    ("wind_bearing", "wind_bearing"),
+)
+_HOURLY_FORECAST_FIELDS: Final = (
+    ("condition", "condition"),
+    ("temperature", "native_temperature"),
+    ("precipitation", "native_precipitation"),
+    ("precipitation_probability", "precipitation_probability"),
+    ("wind_speed", "native_wind_speed"),
+    ("wind_gust_speed", "native_wind_gust_speed"),
+    ("wind_bearing", "wind_bearing"),
+    ("cloud_coverage", "cloud_coverage"),
+)
+
+
+# Required datetime of a forecast entry
+_get_datetime: Final = itemgetter("datetime")
+
+
+def _to_forecast(
+    forecast_data: Mapping[str, Any],
+    fields: tuple[tuple[str, str], ...],
+) -> Forecast:
+    """Convert one coordinator forecast entry to a Forecast.
+
+    Args:
+        forecast_data: Daily or hourly forecast entry
+        fields: (coordinator field, Forecast key) pairs to copy
+
+    Returns:
+        Forecast with the entry's datetime and mapped fields
+    """
+    get = forecast_data.get
+    forecast = Forecast(datetime=_get_datetime(forecast_data))
+    for src, key in fields:
+        forecast[key] = get(src)
+    return forecast
+
+
+def _fmt(value: Any, unit: str) -> str | None:
+    """Format a value with its unit, passing None through."""
+    if value is None:
+        return None
+    return f"{value}{unit}"
+
+
+def _unit_values(
+    get: Callable[[str], Any],
+    fields: tuple[tuple[str, str, str], ...],
+) -> dict[str, str | None]:
+    """Format a group of source values with their units.
+
+    Args:
+        get: Bound get of the source entry
+        fields: (source field, attribute name, unit) triples
+
+    Returns:
+        Attribute names mapped to "{value}{unit}", or None for missing values
+    """
+    fmt = _fmt
+    return {key: fmt(get(src), unit) for src, key, unit in fields}
+
+
+def _add_day_attrs(
+    attrs: dict[str, Any],
+    keys: _DayKeys,
+    day_data: Mapping[str, Any],
+    skip_missing_sun_times: bool = False,
+) -> None:
+    """Add the attributes of one daily forecast entry.
+
+    Args:
+        attrs: Attribute dict to fill in
+        keys: Attribute names for the day
+        day_data: Daily forecast entry
+        skip_missing_sun_times: Leave out sunrise/sunset when missing instead
+            of setting them to None
+    """
+    get = day_data.get
+    attrs.update(_unit_values(get, keys.fields))
+
+    # Sun times
+    sunrise = get("sunrise")
+    if sunrise or not skip_missing_sun_times:
+        attrs[keys.sunrise] = sunrise.isoformat() if sunrise else None
+    sunset = get("sunset")
+    if sunset or not skip_missing_sun_times:
+        attrs[keys.sunset] = sunset.isoformat() if sunset else None
+
+    # Sun duration (seconds to hours)
+    sunshine = get("sunshine_duration")
+    attrs[keys.sunshine_duration] = f"{sunshine / 3600:.1f}h" if sunshine is not None else None
+    daylight = get("daylight_duration")
+    attrs[keys.daylight_duration] = f"{daylight / 3600:.1f}h" if daylight is not None else None
+
+    # UV index (no unit)
+    attrs[keys.uv_index] = get("uv_index")
+
+
+def _build_attributes(
+    data: Mapping[str, Any],
+    latitude: float,
+    longitude: float,
+    location_name: str,
+) -> dict[str, Any]:
+    """Build the weather entity's state attributes from coordinator data.
+
+    Args:
+        data: AROME coordinator data
+        latitude: Location latitude
+        longitude: Location longitude
+        location_name: Name of the location
+
+    Returns:
+        Flat dict of formatted current, daily, hourly and air quality values
+    """
+    current = data.get("current") or _EMPTY
+    daily_forecast = data.get("daily_forecast") or ()
+    hourly_6h = data.get("hourly_6h") or ()
+    air_quality = data.get("air_quality") or _EMPTY
+
+    # Base attributes
+    attrs = {
+        "elevation": _fmt(data.get("elevation"), "m"),
+        "latitude": latitude,
+        "longitude": longitude,
+        "location_name": location_name,
+    }
+
+    # Add current weather data
+    if current:
+        get = current.get
+        attrs.update(_unit_values(get, _CURRENT_ATTRS))
+        attrs["current_is_day"] = "day" if get("is_day") else "night"
+
+    # Add daily data for days 0, 1, 2 (sun times only when known)
+    n_days = len(daily_forecast)
+    for day_idx in range(min(3, n_days)):
+        _add_day_attrs(
+            attrs, _DAY_KEYS[day_idx], daily_forecast[day_idx], skip_missing_sun_times=True
+        )
+
+    # Add hourly forecast for next 6 hours
+    for hour_data, (datetime_key, fields) in zip(hourly_6h, _HOUR_KEYS):
+        get = hour_data.get
+        hour_dt = get("datetime")
+        attrs[datetime_key] = hour_dt.isoformat() if hour_dt else None
+
+        # Add values with units
+        attrs.update(_unit_values(get, fields))
+
+    # Add extended daily forecast (days 3-7)
+    if n_days > 3:
+        for day_idx in range(3, min(8, n_days)):
+            day_data = daily_forecast[day_idx]
+            keys = _DAY_KEYS[day_idx]
+            attrs[keys.datetime] = day_data.get("datetime")
+            _add_day_attrs(attrs, keys, day_data)
+
+    # Add current air quality data
+    current_aqi = air_quality.get("current") or _EMPTY
+    if current_aqi:
+        attrs.update(_unit_values(current_aqi.get, _CURRENT_AQI_ATTRS))
+
+    # Add daily air quality forecast (next 5 days)
+    daily_aqi = air_quality.get("daily_forecast") or ()
+    if daily_aqi:
+        for day_idx in range(min(5, len(daily_aqi))):
+            fields, date_key = _AQI_DAY_KEYS[day_idx]
+            get = daily_aqi[day_idx].get
+            attrs.update(_unit_values(get, fields))
+            attrs[date_key] = get("date")
+
+    return attrs
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -104,354 +402,126 @@ class SeracWeather(CoordinatorEntity[AromeCoordinator], WeatherEntity):
         # Unique ID uses coordinates for uniqueness
         self._attr_unique_id = f"serac_{latitude}_{longitude}_weather"
         self._attr_name = location_name
-        self._attr_attribution = ATTRIBUTION
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information about this weather entity."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"serac_{self._latitude}_{self._longitude}")},
-            name=f"{self._location_name} (Serac)",
+        # Formatted attributes and the coordinator payload they were built from
+        self._attrs_data: dict[str, Any] | None = None
+        self._attrs: dict[str, Any] = {}
+        self._attr_attribution = ATTRIBUTION
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, f"serac_{latitude}_{longitude}")},
+            name=f"{location_name} (Serac)",
             manufacturer=MANUFACTURER,
             model="Mountain Weather Station",
             entry_type=DeviceEntryType.SERVICE,
         )
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Drop the cached attributes and write the new state."""
+        self._attrs_data = None
+        super()._handle_coordinator_update()
+
+    def _current_value(self, key: str) -> Any:
+        """Return a value from the current conditions section.
+
+        Args:
+            key: Field name in the current conditions
+
+        Returns:
+            Field value, or None if data or the field is missing
+        """
+        data = self.coordinator.data
+        if not data:
+            return None
+        return (data.get("current") or _EMPTY).get(key)
+
     @property
     def condition(self) -> str | None:
         """Return the current condition."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get("current", {}).get("condition")
+        return self._current_value("condition")
 
     @property
     def native_temperature(self) -> float | None:
         """Return the current temperature."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get("current", {}).get("temperature")
+        return self._current_value("temperature")
 
     @property
     def humidity(self) -> int | None:
         """Return the current humidity."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get("current", {}).get("humidity")
+        return self._current_value("humidity")
 
     @property
     def native_pressure(self) -> float | None:
         """Return the current pressure."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get("current", {}).get("pressure")
+        return self._current_value("pressure")
 
     @property
     def native_wind_speed(self) -> float | None:
         """Return the current wind speed."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get("current", {}).get("wind_speed")
+        return self._current_value("wind_speed")
 
     @property
     def wind_bearing(self) -> int | None:
         """Return the current wind bearing."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get("current", {}).get("wind_bearing")
+        return self._current_value("wind_bearing")
 
     @property
     def native_wind_gust_speed(self) -> float | None:
         """Return the current wind gust speed."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get("current", {}).get("wind_gust")
+        return self._current_value("wind_gust")
 
     @property
     def cloud_coverage(self) -> int | None:
         """Return the current cloud coverage."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get("current", {}).get("cloud_coverage")
+        return self._current_value("cloud_coverage")
 
     @property
     def native_visibility(self) -> float | None:
         """Return the current visibility."""
-        if not self.coordinator.data:
-            return None
-        return self.coordinator.data.get("current", {}).get("visibility")
+        return self._current_value("visibility")
 
     @property
     def uv_index(self) -> float | None:
         """Return the current UV index."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return None
-        daily_forecast = self.coordinator.data.get("daily_forecast", [])
-        if daily_forecast and len(daily_forecast) > 0:
-            return daily_forecast[0].get("uv_index")
-        return None
+        daily_forecast = data.get("daily_forecast")
+        return daily_forecast[0].get("uv_index") if daily_forecast else None
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return {}
 
-        # Base attributes
-        elevation = self.coordinator.data.get("elevation")
-        attrs = {
-            "elevation": f"{elevation}m" if elevation is not None else None,
-            "latitude": self._latitude,
-            "longitude": self._longitude,
-            "location_name": self._location_name,
-        }
-
-        # Add current weather data
-        current = self.coordinator.data.get("current", {})
-        if current:
-            temp = current.get("temperature")
-            attrs["current_temperature"] = f"{temp}°C" if temp is not None else None
-
-            humidity = current.get("humidity")
-            attrs["current_humidity"] = f"{humidity}%" if humidity is not None else None
-
-            attrs["current_is_day"] = "day" if current.get("is_day") else "night"
-
-            wind_speed = current.get("wind_speed")
-            attrs["current_wind_speed"] = f"{wind_speed}km/h" if wind_speed is not None else None
-
-            wind_bearing = current.get("wind_bearing")
-            attrs["current_wind_direction"] = f"{wind_bearing}°" if wind_bearing is not None else None
-
-            wind_gust = current.get("wind_gust")
-            attrs["current_wind_gust"] = f"{wind_gust}km/h" if wind_gust is not None else None
-
-            precip = current.get("precipitation")
-            attrs["current_precipitation"] = f"{precip}mm" if precip is not None else None
-
-            rain = current.get("rain")
-            attrs["current_rain"] = f"{rain}mm" if rain is not None else None
-
-            showers = current.get("showers")
-            attrs["current_showers"] = f"{showers}mm" if showers is not None else None
-
-            snowfall = current.get("snowfall")
-            attrs["current_snowfall"] = f"{snowfall}cm" if snowfall is not None else None
-
-            cloud = current.get("cloud_coverage")
-            attrs["current_cloud_coverage"] = f"{cloud}%" if cloud is not None else None
-
-        # Add daily data for days 0, 1, 2
-        daily_forecast = self.coordinator.data.get("daily_forecast", [])
-        day_names = ["today", "tomorrow", "day_2"]
-
-        for day_idx in range(min(3, len(daily_forecast))):
-            day_data = daily_forecast[day_idx]
-            day_name = day_names[day_idx]
-
-            # Wind
-            wind_speed = day_data.get("wind_speed")
-            attrs[f"{day_name}_wind_speed_max"] = f"{wind_speed}km/h" if wind_speed is not None else None
-
-            wind_gust = day_data.get("wind_gust_speed")
-            attrs[f"{day_name}_wind_gust_max"] = f"{wind_gust}km/h" if wind_gust is not None else None
-
-            wind_bearing = day_data.get("wind_bearing")
-            attrs[f"{day_name}_wind_direction"] = f"{wind_bearing}°" if wind_bearing is not None else None
-
-            # Sun times
-            if sunrise := day_data.get("sunrise"):
-                attrs[f"{day_name}_sunrise"] = sunrise.isoformat()
-            if sunset := day_data.get("sunset"):
-                attrs[f"{day_name}_sunset"] = sunset.isoformat()
-
-            # Sun duration
-            sunshine = day_data.get("sunshine_duration")
-            attrs[f"{day_name}_sunshine_duration"] = f"{sunshine / 3600:.1f}h" if sunshine is not None else None
-
-            daylight = day_data.get("daylight_duration")
-            attrs[f"{day_name}_daylight_duration"] = f"{daylight / 3600:.1f}h" if daylight is not None else None
-
-            # UV index
-            attrs[f"{day_name}_uv_index"] = day_data.get("uv_index")
-
-            # Precipitation
-            rain_sum = day_data.get("rain_sum")
-            attrs[f"{day_name}_rain_sum"] = f"{rain_sum}mm" if rain_sum is not None else None
-
-            showers = day_data.get("showers_sum")
-            attrs[f"{day_name}_showers_sum"] = f"{showers}mm" if showers is not None else None
-
-            snow_sum = day_data.get("snowfall_sum")
-            attrs[f"{day_name}_snowfall_sum"] = f"{snow_sum}cm" if snow_sum is not None else None
-
-            precip_sum = day_data.get("precipitation_sum")
-            attrs[f"{day_name}_precipitation_sum"] = f"{precip_sum}mm" if precip_sum is not None else None
-
-            precip_hours = day_data.get("precipitation_hours")
-            attrs[f"{day_name}_precipitation_hours"] = f"{precip_hours}h" if precip_hours is not None else None
-
-        # Add hourly forecast for next 6 hours
-        hourly_6h = self.coordinator.data.get("hourly_6h", [])
-        for i, hour_data in enumerate(hourly_6h, start=1):
-            prefix = f"hour_{i}"
-            attrs[f"{prefix}_datetime"] = hour_data.get("datetime").isoformat() if hour_data.get("datetime") else None
-
-            # Add values with units
-            temp = hour_data.get("temperature")
-            attrs[f"{prefix}_temperature"] = f"{temp}°C" if temp is not None else None
-
-            wind = hour_data.get("wind_speed")
-            attrs[f"{prefix}_wind_speed"] = f"{wind}km/h" if wind is not None else None
-
-            gust = hour_data.get("wind_gust")
-            attrs[f"{prefix}_wind_gust"] = f"{gust}km/h" if gust is not None else None
-
-            cloud = hour_data.get("cloud_cover")
-            attrs[f"{prefix}_cloud_cover"] = f"{cloud}%" if cloud is not None else None
-
-            snow = hour_data.get("snowfall")
-            attrs[f"{prefix}_snowfall"] = f"{snow}cm" if snow is not None else None
-
-            rain = hour_data.get("rain")
-            attrs[f"{prefix}_rain"] = f"{rain}mm" if rain is not None else None
-
-            precip = hour_data.get("precipitation")
-            attrs[f"{prefix}_precipitation"] = f"{precip}mm" if precip is not None else None
-
-        # Add extended daily forecast (days 3-7)
-        for day_idx in range(3, min(8, len(daily_forecast))):  # Days 3-7
-            day_data = daily_forecast[day_idx]
-            prefix = f"day_{day_idx}"
-
-            attrs[f"{prefix}_datetime"] = day_data.get("datetime")
-
-            # Wind with units
-            wind_speed = day_data.get("wind_speed")
-            attrs[f"{prefix}_wind_speed_max"] = f"{wind_speed}km/h" if wind_speed is not None else None
-
-            wind_gust = day_data.get("wind_gust_speed")
-            attrs[f"{prefix}_wind_gust_max"] = f"{wind_gust}km/h" if wind_gust is not None else None
-
-            wind_dir = day_data.get("wind_bearing")
-            attrs[f"{prefix}_wind_direction"] = f"{wind_dir}°" if wind_dir is not None else None
-
-            # Sun times
-            attrs[f"{prefix}_sunrise"] = day_data.get("sunrise").isoformat() if day_data.get("sunrise") else None
-            attrs[f"{prefix}_sunset"] = day_data.get("sunset").isoformat() if day_data.get("sunset") else None
-
-            # Duration (convert seconds to hours)
-            sunshine = day_data.get("sunshine_duration")
-            attrs[f"{prefix}_sunshine_duration"] = f"{sunshine / 3600:.1f}h" if sunshine is not None else None
-
-            daylight = day_data.get("daylight_duration")
-            attrs[f"{prefix}_daylight_duration"] = f"{daylight / 3600:.1f}h" if daylight is not None else None
-
-            # UV index (no unit)
-            attrs[f"{prefix}_uv_index"] = day_data.get("uv_index")
-
-            # Precipitation with units
-            rain_sum = day_data.get("rain_sum")
-            attrs[f"{prefix}_rain_sum"] = f"{rain_sum}mm" if rain_sum is not None else None
-
-            showers = day_data.get("showers_sum")
-            attrs[f"{prefix}_showers_sum"] = f"{showers}mm" if showers is not None else None
-
-            snow_sum = day_data.get("snowfall_sum")
-            attrs[f"{prefix}_snowfall_sum"] = f"{snow_sum}cm" if snow_sum is not None else None
-
-            precip_sum = day_data.get("precipitation_sum")
-            attrs[f"{prefix}_precipitation_sum"] = f"{precip_sum}mm" if precip_sum is not None else None
-
-            precip_hours = day_data.get("precipitation_hours")
-            attrs[f"{prefix}_precipitation_hours"] = f"{precip_hours}h" if precip_hours is not None else None
-
-        # Add current air quality data
-        air_quality = self.coordinator.data.get("air_quality", {})
-        current_aqi = air_quality.get("current", {})
-        if current_aqi:
-            aqi = current_aqi.get("european_aqi")
-            attrs["current_european_aqi"] = f"{aqi} EAQI" if aqi is not None else None
-
-            pm25 = current_aqi.get("pm2_5")
-            attrs["current_pm2_5"] = f"{pm25}µg/m³" if pm25 is not None else None
-
-            pm10 = current_aqi.get("pm10")
-            attrs["current_pm10"] = f"{pm10}µg/m³" if pm10 is not None else None
-
-            no2 = current_aqi.get("nitrogen_dioxide")
-            attrs["current_nitrogen_dioxide"] = f"{no2}µg/m³" if no2 is not None else None
-
-            o3 = current_aqi.get("ozone")
-            attrs["current_ozone"] = f"{o3}µg/m³" if o3 is not None else None
-
-            so2 = current_aqi.get("sulphur_dioxide")
-            attrs["current_sulphur_dioxide"] = f"{so2}µg/m³" if so2 is not None else None
-
-        # Add daily air quality forecast (next 5 days)
-        daily_aqi = air_quality.get("daily_forecast", [])
-        aqi_day_names = ["today", "tomorrow", "day_2", "day_3", "day_4"]
-
-        for day_idx in range(min(5, len(daily_aqi))):
-            day_data = daily_aqi[day_idx]
-            day_name = aqi_day_names[day_idx]
-
-            aqi_max = day_data.get("aqi_max")
-            attrs[f"{day_name}_aqi_max"] = f"{aqi_max} EAQI" if aqi_max is not None else None
-
-            pm25_max = day_data.get("pm25_max")
-            attrs[f"{day_name}_pm25_max"] = f"{pm25_max}µg/m³" if pm25_max is not None else None
-
-            pm10_max = day_data.get("pm10_max")
-            attrs[f"{day_name}_pm10_max"] = f"{pm10_max}µg/m³" if pm10_max is not None else None
-
-            attrs[f"{day_name}_aqi_date"] = day_data.get("date")
-
-        return attrs
+        # Formatting runs once per coordinator payload, not on every state read
+        if data is not self._attrs_data:
+            self._attrs = _build_attributes(
+                data, self._latitude, self._longitude, self._location_name
+            )
+            self._attrs_data = data
+        return self._attrs
 
     async def async_forecast_daily(self) -> list[Forecast] | None:
         """Return the daily forecast."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return None
 
-        daily_forecast = self.coordinator.data.get("daily_forecast", [])
-        forecasts: list[Forecast] = []
-
-        for forecast_data in daily_forecast:
-            forecast = Forecast(
-                datetime=forecast_data["datetime"],
-                condition=forecast_data.get("condition"),
-                native_temperature=forecast_data.get("temperature"),
-                native_templow=forecast_data.get("templow"),
-                native_precipitation=forecast_data.get("precipitation"),
-                precipitation_probability=forecast_data.get("precipitation_probability"),
-                native_wind_speed=forecast_data.get("wind_speed"),
-                native_wind_gust_speed=forecast_data.get("wind_gust_speed"),
-                wind_bearing=forecast_data.get("wind_bearing"),
-            )
-            forecasts.append(forecast)
-
-        return forecasts
+        return [
+            _to_forecast(forecast_data, _DAILY_FORECAST_FIELDS)
+            for forecast_data in data.get("daily_forecast") or ()
+        ]
 
     async def async_forecast_hourly(self) -> list[Forecast] | None:
         """Return the hourly forecast."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return None
 
-        hourly_forecast = self.coordinator.data.get("hourly_forecast", [])
-        forecasts: list[Forecast] = []
-
-        for forecast_data in hourly_forecast:
-            forecast = Forecast(
-                datetime=forecast_data["datetime"],
-                condition=forecast_data.get("condition"),
-                native_temperature=forecast_data.get("temperature"),
-                native_precipitation=forecast_data.get("precipitation"),
-                precipitation_probability=forecast_data.get("precipitation_probability"),
-                native_wind_speed=forecast_data.get("wind_speed"),
-                native_wind_gust_speed=forecast_data.get("wind_gust_speed"),
-                wind_bearing=forecast_data.get("wind_bearing"),
-                cloud_coverage=forecast_data.get("cloud_coverage"),
-            )
-            forecasts.append(forecast)
-
-        return forecasts
+        return [
+            _to_forecast(forecast_data, _HOURLY_FORECAST_FIELDS)
+            for forecast_data in data.get("hourly_forecast") or ()
+        ]
@@ -84,8 +84,8 @@ async def test_bra_api(api_key: str, massif_id: str = "CHABLAIS"):
 
         # Save full XML to file
         output_file = Path(__file__).parent / f"bra_bulletin_{massif_id}.xml"
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(raw_xml)
+        # Write off the event loop so the blocking disk I/O doesn't stall it
+        await asyncio.to_thread(output_file.write_text, raw_xml, encoding="utf-8")
         print(f"✓ Full XML saved to: {output_file}")
         print()
 
@@ -120,6 +120,8 @@ async def test_bra_api(api_key: str, massif_id: str = "CHABLAIS"):
         import traceback
         traceback.print_exc()
         return
+    finally:
+        await client.async_close()
 
 
 def main():
@@ -1,11 +1,27 @@
 #!/usr/bin/env python3
 """Test script for direct AROME API access."""
 
+import asyncio
 import sys
-import requests
 import json
 
-def test_direct_arome_api(token: str, lat: float, lon: float):
+import aiohttp
+
+
+async def _probe_endpoint(
+    session: aiohttp.ClientSession, url: str, params: dict, endpoint: str
+) -> str:
+    """Request one alternative endpoint and describe the outcome."""
+    try:
+        async with session.get(
+            url, params=params, timeout=aiohttp.ClientTimeout(total=5)
+        ) as response:
+            return f"{endpoint}: {response.status}"
+    except Exception as e:
+        return f"{endpoint}: ❌ {str(e)[:50]}"
+
+
+async def test_direct_arome_api(token: str, lat: float, lon: float):
     """Test direct AROME API with authentication."""
 
     print("=" * 70)
@@ -24,73 +40,81 @@ def test_direct_arome_api(token: str, lat: float, lon: float):
     print(f"\nTesting with coordinates: {lat}, {lon}")
     print(f"Token: {token[:20]}...")
 
-    # Test 1: Simple forecast endpoint
-    print("\n" + "-" * 70)
-    print("Test 1: Trying /forecast endpoint")
-    print("-" * 70)
+    # One session for every request so the TLS connection is reused
+    async with aiohttp.ClientSession(
+        headers=headers, timeout=aiohttp.ClientTimeout(total=10)
+    ) as session:
+        # Test 1: Simple forecast endpoint
+        print("\n" + "-" * 70)
+        print("Test 1: Trying /forecast endpoint")
+        print("-" * 70)
 
-    try:
-        url = f"{base_url}/forecast"
-        params = {
-            "lat": lat,
-            "lon": lon
-        }
-        response = requests.get(url, headers=headers, params=params, timeout=10)
-        print(f"Status: {response.status_code}")
-        print(f"Response length: {len(response.content)} bytes")
-
-        if response.status_code == 200:
-            print("✅ SUCCESS!")
-            data = response.json()
-            print("\nResponse structure:")
-            print(json.dumps(data, indent=2)[:1000] + "...")
-        else:
-            print(f"❌ Error: {response.text[:500]}")
-    except Exception as e:
-        print(f"❌ Exception: {e}")
-
-    # Test 2: WCS GetCapabilities
-    print("\n" + "-" * 70)
-    print("Test 2: Trying WCS GetCapabilities")
-    print("-" * 70)
-
-    try:
-        url = f"{base_url}/wcs/MF-NWP-HIGHRES-AROME-001-FRANCE-WCS"
-        params = {
-            "service": "WCS",
-            "version": "2.0.1",
-            "request": "GetCapabilities"
-        }
-        response = requests.get(url, headers=headers, params=params, timeout=10)
-        print(f"Status: {response.status_code}")
-
-        if response.status_code == 200:
-            print("✅ WCS endpoint accessible!")
-            print(f"Response preview: {response.text[:500]}...")
-        else:
-            print(f"❌ Error: {response.text[:500]}")
-    except Exception as e:
-        print(f"❌ Exception: {e}")
-
-    # Test 3: Alternative API structure
-    print("\n" + "-" * 70)
-    print("Test 3: Trying alternative endpoints")
-    print("-" * 70)
+        try:
+            url = f"{base_url}/forecast"
+            params = {
+                "lat": lat,
+                "lon": lon
+            }
+            async with session.get(url, params=params) as response:
+                content = await response.read()
+                print(f"Status: {response.status}")
+                print(f"Response length: {len(content)} bytes")
+
+                if response.status == 200:
+                    print("✅ SUCCESS!")
+                    data = json.loads(content)
+                    print("\nResponse structure:")
+                    print(json.dumps(data, indent=2)[:1000] + "...")
+                else:
+                    print(f"❌ Error: {content.decode(errors='replace')[:500]}")
+        except Exception as e:
+            print(f"❌ Exception: {e}")
 
-    endpoints = [
-        "/forecast/grid",
-        "/data",
-        "/coverage",
-    ]
+        # Test 2: WCS GetCapabilities
+        print("\n" + "-" * 70)
+        print("Test 2: Trying WCS GetCapabilities")
+        print("-" * 70)
 
-    for endpoint in endpoints:
         try:
-            url = f"{base_url}{endpoint}"
-            params = {"lat": lat, "lon": lon}
-            response = requests.get(url, headers=headers, params=params, timeout=5)
-            print(f"{endpoint}: {response.status_code}")
+            url = f"{base_url}/wcs/MF-NWP-HIGHRES-AROME-001-FRANCE-WCS"
+            params = {
+                "service": "WCS",
+                "version": "2.0.1",
+                "request": "GetCapabilities"
+            }
+            async with session.get(url, params=params) as response:
+                text = await response.text()
+                print(f"Status: {response.status}")
+
+                if response.status == 200:
+                    print("✅ WCS endpoint accessible!")
+                    print(f"Response preview: {text[:500]}...")
+                else:
+                    print(f"❌ Error: {text[:500]}")
         except Exception as e:
-            print(f"{endpoint}: ❌ {str(e)[:50]}")
+            print(f"❌ Exception: {e}")
+
+        # Test 3: Alternative API structure
+        print("\n" + "-" * 70)
+        print("Test 3: Trying alternative endpoints")
+        print("-" * 70)
+
+        endpoints = [
+            "/forecast/grid",
+            "/data",
+            "/coverage",
+        ]
+
+        # Probe the endpoints concurrently; results print in list order
+        params = {"lat": lat, "lon": lon}
+        results = await asyncio.gather(
+            *(
+                _probe_endpoint(session, f"{base_url}{endpoint}", params, endpoint)
+                for endpoint in endpoints
+            )
+        )
+        for line in results:
+            print(line)
 
     print("\n" + "=" * 70)
     print("Test Complete")
@@ -108,4 +132,4 @@ if __name__ == "__main__":
     lat = float(sys.argv[2])
     lon = float(sys.argv[3])
 
-    test_direct_arome_api(token, lat, lon)
+    asyncio.run(test_direct_arome_api(token, lat, lon))
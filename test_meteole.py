@@ -1,12 +1,37 @@
 #!/usr/bin/env python3
 """Test meteole library for AROME data access."""
 
+import asyncio
+import pickle
 import sys
+import time
 from meteole import AromeForecast
 import datetime as dt
+from itertools import islice
+from pathlib import Path
 import json
 
-def test_meteole(application_id: str, lat: float, lon: float):
+# The WCS capabilities document is large and only changes with new model runs
+CACHE_DIR = Path.home() / ".cache" / "serac_tests"
+CAPABILITIES_TTL = 6 * 3600
+
+
+def _cached_capabilities(arome: AromeForecast):
+    """Return AROME capabilities, reusing a disk copy younger than 6 hours."""
+    path = CACHE_DIR / "arome_capabilities.pickle"
+    try:
+        if time.time() - path.stat().st_mtime < CAPABILITIES_TTL:
+            return pickle.loads(path.read_bytes())
+    except (OSError, EOFError, pickle.UnpicklingError):
+        pass
+
+    capabilities = arome.get_capabilities()
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(pickle.dumps(capabilities))
+    return capabilities
+
+
+async def test_meteole(application_id: str, lat: float, lon: float):
     """Test meteole library with user's coordinates."""
 
     print("=" * 70)
@@ -22,28 +47,59 @@ def test_meteole(application_id: str, lat: float, lon: float):
         print("✅ Client initialized successfully!")
 
         # Get current forecast run time (use latest available)
-        now = dt.datetime.utcnow()
-        # AROME runs every 3 hours (00, 03, 06, 09, 12, 15, 18, 21 UTC)
+        now = dt.datetime.now(tz=dt.timezone.utc)
+        # AROME runs every 3 hours (00, 03, 06, 09, 12, 15, 18, 21 UTC);
+        # computed once and shared by every coverage request below
         run_hour = (now.hour // 3) * 3
         run_time = now.replace(hour=run_hour, minute=0, second=0, microsecond=0)
         run_str = run_time.strftime("%Y-%m-%dT%H.%M.%SZ")
 
         print(f"\nUsing forecast run: {run_str}")
 
+        def fetch(indicator: str, horizons: list, heights: list):
+            """Download one coverage for the single requested point."""
+            return arome.get_coverage(
+                indicator=indicator,
+                run=run_str,
+                forecast_horizons=horizons,
+                heights=heights,
+                lat=(lat, lat),  # Single point
+                long=(lon, lon)
+            )
+
+        # meteole is synchronous: run the three independent WCS downloads
+        # in worker threads concurrently, then report them in order
+        wind_result, temp_result, gust_result = await asyncio.gather(
+            asyncio.to_thread(
+                fetch,
+                "U_COMPONENT_OF_WIND__SPECIFIC_HEIGHT_LEVEL_ABOVE_GROUND",
+                [dt.timedelta(hours=1)],
+                [10],
+            ),
+            asyncio.to_thread(
+                fetch,
+                "TEMPERATURE__SPECIFIC_HEIGHT_LEVEL_ABOVE_GROUND",
+                [dt.timedelta(hours=1), dt.timedelta(hours=2)],
+                [2],
+            ),
+            asyncio.to_thread(
+                fetch,
+                "V_COMPONENT_OF_WIND_GUST__SPECIFIC_HEIGHT_LEVEL_ABOVE_GROUND",
+                [dt.timedelta(hours=1)],
+                [10],
+            ),
+            return_exceptions=True,
+        )
+
         # Try to get wind data at 10m height for next hour
         print("\n" + "-" * 70)
         print("Test 1: Wind Speed at 10m height")
         print("-" * 70)
 
         try:
-            wind_data = arome.get_coverage(
-                indicator="U_COMPONENT_OF_WIND__SPECIFIC_HEIGHT_LEVEL_ABOVE_GROUND",
-                run=run_str,
-                forecast_horizons=[dt.timedelta(hours=1)],
-                heights=[10],
-                lat=(lat, lat),  # Single point
-                long=(lon, lon)
-            )
+            if isinstance(wind_result, BaseException):
+                raise wind_result
+            wind_data = wind_result
 
             print("✅ Got wind U-component data!")
             print(f"Data shape: {wind_data.shape}")
@@ -60,19 +116,14 @@ def test_meteole(application_id: str, lat: float, lon: float):
         print("-" * 70)
 
         try:
-            temp_data = arome.get_coverage(
-                indicator="TEMPERATURE__SPECIFIC_HEIGHT_LEVEL_ABOVE_GROUND",
-                run=run_str,
-                forecast_horizons=[dt.timedelta(hours=1), dt.timedelta(hours=2)],
-                heights=[2],
-                lat=(lat, lat),
-                long=(lon, lon)
-            )
+            if isinstance(temp_result, BaseException):
+                raise temp_result
+            temp_data = temp_result
 
             print("✅ Got temperature data!")
             print(f"Data shape: {temp_data.shape}")
-            print("\nData:")
-            print(temp_data)
+            print("\nFirst few rows:")
+            print(temp_data.head())
 
         except Exception as e:
             print(f"❌ Error getting temperature: {e}")
@@ -83,19 +134,14 @@ def test_meteole(application_id: str, lat: float, lon: float):
         print("-" * 70)
 
         try:
-            gust_data = arome.get_coverage(
-                indicator="V_COMPONENT_OF_WIND_GUST__SPECIFIC_HEIGHT_LEVEL_ABOVE_GROUND",
-                run=run_str,
-                forecast_horizons=[dt.timedelta(hours=1)],
-                heights=[10],
-                lat=(lat, lat),
-                long=(lon, lon)
-            )
+            if isinstance(gust_result, BaseException):
+                raise gust_result
+            gust_data = gust_result
 
             print("✅ Got wind gust data!")
             print(f"Data shape: {gust_data.shape}")
-            print("\nData:")
-            print(gust_data)
+            print("\nFirst few rows:")
+            print(gust_data.head())
 
         except Exception as e:
             print(f"❌ Error getting wind gust: {e}")
@@ -106,13 +152,16 @@ def test_meteole(application_id: str, lat: float, lon: float):
         print("-" * 70)
 
         try:
-            capabilities = arome.get_capabilities()
+            capabilities = await asyncio.to_thread(_cached_capabilities, arome)
             print(f"Found {len(capabilities)} indicators")
 
             # Look for wind-related indicators
-            wind_indicators = [c for c in capabilities if 'WIND' in c or 'GUST' in c]
+            # Stop scanning once the first 10 matches are found
+            wind_indicators = islice(
+                (c for c in capabilities if 'WIND' in c or 'GUST' in c), 10
+            )
             print("\nWind-related indicators:")
-            for ind in wind_indicators[:10]:
+            for ind in wind_indicators:
                 print(f"  - {ind}")
 
         except Exception as e:
@@ -139,4 +188,4 @@ if __name__ == "__main__":
     lat = float(sys.argv[2])
     lon = float(sys.argv[3])
 
-    test_meteole(app_id, lat, lon)
+    asyncio.run(test_meteole(app_id, lat, lon))
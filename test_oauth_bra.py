@@ -4,26 +4,34 @@ import asyncio
 import sys
 import aiohttp
 
-async def test_bra_oauth(token: str):
-    """Test BRA API with OAuth2 Bearer token."""
+async def test_bra_oauth(token: str, session: aiohttp.ClientSession | None = None):
+    """Test BRA API with OAuth2 Bearer token.
+
+    Pass a session to reuse its pooled TLS connection across several calls;
+    otherwise a temporary one is opened and closed.
+    """
+    if session is None:
+        async with aiohttp.ClientSession() as own_session:
+            return await test_bra_oauth(token, own_session)
+
     print("Testing BRA API with OAuth2...")
     
     url = "https://public-api.meteofrance.fr/public/DPBRA/v1/massif/BRA"
     params = {"id-massif": 1, "format": "xml"}
     headers = {"Authorization": f"Bearer {token}"}
     
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url, headers=headers, params=params) as response:
-            print(f"Status: {response.status}")
-            if response.status == 200:
-                xml = await response.text()
-                print(f"✓ SUCCESS! Received {len(xml)} bytes")
-                print(f"\nFirst 500 chars:\n{xml[:500]}")
-                return True
-            else:
-                error = await response.text()
-                print(f"✗ FAILED: {error}")
-                return False
+    async with session.get(url, headers=headers, params=params) as response:
+        print(f"Status: {response.status}")
+        if response.status == 200:
+            # Only the head is printed, so skip decoding the whole bulletin
+            xml = await response.read()
+            print(f"✓ SUCCESS! Received {len(xml)} bytes")
+            print(f"\nFirst 500 bytes:\n{xml[:500].decode('utf-8', errors='replace')}")
+            return True
+        else:
+            error = await response.text()
+            print(f"✗ FAILED: {error}")
+            return False
 
 if __name__ == "__main__":
     token = sys.argv[1] if len(sys.argv) > 1 else ""
@@ -1,12 +1,24 @@
 #!/usr/bin/env python3
 """Test Open-Meteo API for comparison with Météo-France data."""
 
+import asyncio
 import sys
-import requests
 import json
 from datetime import datetime
+from itertools import islice
 
-def test_openmeteo(lat: float, lon: float):
+import aiohttp
+
+
+async def _fetch(session: aiohttp.ClientSession, url: str, params: dict):
+    """Fetch one endpoint, returning (status, decoded JSON or error text)."""
+    async with session.get(url, params=params) as response:
+        if response.status == 200:
+            return response.status, json.loads(await response.read())
+        return response.status, await response.text()
+
+
+async def test_openmeteo(lat: float, lon: float):
     """Test Open-Meteo API with user's coordinates."""
 
     print("=" * 70)
@@ -16,11 +28,8 @@ def test_openmeteo(lat: float, lon: float):
 
     # Open-Meteo Météo-France API endpoint
     base_url = "https://api.open-meteo.com/v1/meteofrance"
-
-    # Test 1: Current + Hourly forecast
-    print("\n" + "-" * 70)
-    print("Test 1: Hourly Forecast with Wind Data")
-    print("-" * 70)
+    std_url = "https://api.open-meteo.com/v1/forecast"
+    icon_url = "https://api.open-meteo.com/v1/dwd-icon"
 
     params = {
         "latitude": lat,
@@ -31,13 +40,31 @@ def test_openmeteo(lat: float, lon: float):
         "forecast_days": 3
     }
 
-    try:
-        response = requests.get(base_url, params=params, timeout=10)
-        print(f"Status: {response.status_code}")
+    # Fetch all three models concurrently over one keep-alive session,
+    # then report them in order
+    async with aiohttp.ClientSession(
+        timeout=aiohttp.ClientTimeout(total=10),
+        connector=aiohttp.TCPConnector(limit=10, keepalive_timeout=30),
+    ) as session:
+        meteofrance, standard, icon = await asyncio.gather(
+            _fetch(session, base_url, params),
+            _fetch(session, std_url, params),
+            _fetch(session, icon_url, params),
+            return_exceptions=True,
+        )
 
-        if response.status_code == 200:
-            data = response.json()
+    # Test 1: Current + Hourly forecast
+    print("\n" + "-" * 70)
+    print("Test 1: Hourly Forecast with Wind Data")
+    print("-" * 70)
 
+    try:
+        if isinstance(meteofrance, BaseException):
+            raise meteofrance
+        status, data = meteofrance
+        print(f"Status: {status}")
+
+        if status == 200:
             print("✅ SUCCESS!\n")
 
             # Current conditions
@@ -82,7 +109,7 @@ def test_openmeteo(lat: float, lon: float):
                 print(f"\n24h Maximum Wind Speed: {max_wind} km/h")
                 print(f"24h Maximum Wind Gust: {max_gust} km/h")
         else:
-            print(f"❌ Error: {response.text}")
+            print(f"❌ Error: {data}")
 
     except Exception as e:
         print(f"❌ Exception: {e}")
@@ -94,13 +121,12 @@ def test_openmeteo(lat: float, lon: float):
     print("Test 2: Standard Open-Meteo API (for comparison)")
     print("-" * 70)
 
-    std_url = "https://api.open-meteo.com/v1/forecast"
-
     try:
-        response = requests.get(std_url, params=params, timeout=10)
+        if isinstance(standard, BaseException):
+            raise standard
+        status, data = standard
 
-        if response.status_code == 200:
-            data = response.json()
+        if status == 200:
 
             if "current" in data:
                 current = data["current"]
@@ -109,7 +135,7 @@ def test_openmeteo(lat: float, lon: float):
 
             if "hourly" in data:
                 hourly = data["hourly"]
-                max_gust = max([g for g in hourly["wind_gusts_10m"][:24] if g is not None], default=0)
+                max_gust = max((g for g in islice(hourly["wind_gusts_10m"], 24) if g is not None), default=0)
                 print(f"24h Max Gust: {max_gust} km/h")
 
     except Exception as e:
@@ -120,13 +146,12 @@ def test_openmeteo(lat: float, lon: float):
     print("Test 3: DWD ICON Model (2km resolution)")
     print("-" * 70)
 
-    icon_url = "https://api.open-meteo.com/v1/dwd-icon"
-
     try:
-        response = requests.get(icon_url, params=params, timeout=10)
+        if isinstance(icon, BaseException):
+            raise icon
+        status, data = icon
 
-        if response.status_code == 200:
-            data = response.json()
+        if status == 200:
 
             if "current" in data:
                 current = data["current"]
@@ -135,7 +160,7 @@ def test_openmeteo(lat: float, lon: float):
 
             if "hourly" in data:
                 hourly = data["hourly"]
-                max_gust = max([g for g in hourly["wind_gusts_10m"][:24] if g is not None], default=0)
+                max_gust = max((g for g in islice(hourly["wind_gusts_10m"], 24) if g is not None), default=0)
                 print(f"24h Max Gust: {max_gust} km/h")
 
     except Exception as e:
@@ -156,4 +181,4 @@ if __name__ == "__main__":
     lat = float(sys.argv[1])
     lon = float(sys.argv[2])
 
-    test_openmeteo(lat, lon)
+    asyncio.run(test_openmeteo(lat, lon))
@@ -1,43 +1,76 @@
 #!/usr/bin/env python3
 """Detailed Open-Meteo API comparison."""
 
+import asyncio
+import hashlib
+import json
 import sys
-import requests
 from datetime import datetime, timedelta
+from itertools import groupby
+from pathlib import Path
 
-def analyze_daily_max(hourly_data, days=3):
-    """Calculate daily max wind/gust from hourly data."""
-    times = hourly_data["time"]
-    wind_speeds = hourly_data["wind_speed_10m"]
-    wind_gusts = hourly_data["wind_gusts_10m"]
+import aiohttp
 
-    daily_max = {}
+# Successful responses are reused for the rest of the clock hour; the
+# models behind these endpoints update every 1-3 hours at best
+CACHE_DIR = Path.home() / ".cache" / "serac_tests"
 
-    for i, time_str in enumerate(times):
-        dt = datetime.fromisoformat(time_str)
-        date = dt.date()
 
-        if date not in daily_max:
-            daily_max[date] = {"wind_max": 0, "gust_max": 0}
+def _cache_path(url: str, params: dict) -> Path:
+    """Return the cache file for a request made during the current hour."""
+    hour = datetime.now().strftime("%Y%m%d%H")
+    key = f"{url}?{sorted(params.items())}@{hour}"
+    return CACHE_DIR / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
 
-        wind = wind_speeds[i] if wind_speeds[i] is not None else 0
-        gust = wind_gusts[i] if wind_gusts[i] is not None else 0
 
-        daily_max[date]["wind_max"] = max(daily_max[date]["wind_max"], wind)
-        daily_max[date]["gust_max"] = max(daily_max[date]["gust_max"], gust)
+async def _cached_get(session: aiohttp.ClientSession, url: str, params: dict):
+    """GET a JSON endpoint, reusing this hour's cached response if present.
 
-    return daily_max
+    Returns (status, JSON or error text). Only 200 responses are cached.
+    """
+    path = _cache_path(url, params)
+    if path.exists():
+        return 200, json.loads(await asyncio.to_thread(path.read_bytes))
 
+    async with session.get(url, params=params) as response:
+        if response.status != 200:
+            return response.status, await response.text()
+        body = await response.read()
 
-def test_source(name: str, url: str, lat: float, lon: float, description: str):
-    """Test a specific Open-Meteo source."""
+    data = json.loads(body)
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    await asyncio.to_thread(path.write_bytes, body)
+    return 200, data
 
-    print("\n" + "=" * 70)
-    print(f"{name}")
-    print("=" * 70)
-    print(description)
-    print()
 
+def analyze_daily_max(hourly_data, days=3):
+    """Calculate daily max wind/gust from hourly data."""
+    rows = zip(
+        hourly_data["time"],
+        hourly_data["wind_speed_10m"],
+        hourly_data["wind_gusts_10m"],
+    )
+
+    # Hours arrive in chronological order, so each day is one contiguous run.
+    # Times look like "2026-02-12T13:00": group on the date prefix and parse
+    # it once per day rather than once per hour.
+    daily_max = {}
+    for day, day_rows in groupby(rows, key=lambda row: row[0][:10]):
+        _, winds, gusts = zip(*day_rows)
+        daily_max[datetime.fromisoformat(day).date()] = {
+            "wind_max": max([0, *(w for w in winds if w is not None)]),
+            "gust_max": max([0, *(g for g in gusts if g is not None)]),
+        }
+
+    return daily_max
+
+
+async def fetch_source(session: aiohttp.ClientSession, url: str, lat: float, lon: float):
+    """Fetch a source's hourly forecast.
+
+    Returns (status, JSON or error text), or the exception raised by the
+    request so one failing source doesn't cancel the others.
+    """
     params = {
         "latitude": lat,
         "longitude": lon,
@@ -45,12 +78,27 @@ def test_source(name: str, url: str, lat: float, lon: float, description: str):
         "timezone": "Europe/Paris",
         "forecast_days": 7
     }
+    try:
+        return await _cached_get(session, url, params)
+    except Exception as e:
+        return e
+
+
+def test_source(name: str, lat: float, lon: float, description: str, fetched):
+    """Report on a specific Open-Meteo source from its fetch result."""
+
+    print("\n" + "=" * 70)
+    print(f"{name}")
+    print("=" * 70)
+    print(description)
+    print()
 
     try:
-        response = requests.get(url, params=params, timeout=10)
+        if isinstance(fetched, BaseException):
+            raise fetched
+        status, data = fetched
 
-        if response.status_code == 200:
-            data = response.json()
+        if status == 200:
 
             # Location info
             print(f"📍 Location:")
@@ -90,7 +138,7 @@ def test_source(name: str, url: str, lat: float, lon: float, description: str):
             return daily_max
 
         else:
-            print(f"❌ Error {response.status_code}: {response.text[:200]}")
+            print(f"❌ Error {status}: {data[:200]}")
             return None
 
     except Exception as e:
@@ -98,7 +146,7 @@ def test_source(name: str, url: str, lat: float, lon: float, description: str):
         return None
 
 
-def main(lat: float, lon: float):
+async def main(lat: float, lon: float):
     """Compare different Open-Meteo sources."""
 
     print("=" * 70)
@@ -146,15 +194,27 @@ Best for: Central Europe, alternative to Météo-France
         }
     ]
 
+    # Fetch every source concurrently over one keep-alive session, then
+    # report them in order
+    async with aiohttp.ClientSession(
+        timeout=aiohttp.ClientTimeout(total=10),
+        connector=aiohttp.TCPConnector(limit=10, keepalive_timeout=30),
+    ) as session:
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(fetch_source(session, source["url"], lat, lon))
+                for source in sources
+            ]
+
     results = {}
 
-    for source in sources:
+    for source, task in zip(sources, tasks):
         results[source["name"]] = test_source(
             source["name"],
-            source["url"],
             lat,
             lon,
-            source["description"]
+            source["description"],
+            task.result(),
         )
 
     # Summary comparison
@@ -195,4 +255,4 @@ if __name__ == "__main__":
 
     lat = float(sys.argv[1])
     lon = float(sys.argv[2])
-    main(lat, lon)
+    asyncio.run(main(lat, lon))
@@ -3,6 +3,10 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from custom_components.serac.api.airquality_client import AirQualityClient
+from custom_components.serac.api.bra_client import BraClient
+from custom_components.serac.api.openmeteo_client import OpenMeteoClient
+
 
 @pytest.fixture
 def mock_hass():
@@ -31,7 +35,7 @@ def mock_config_entry():
 @pytest.fixture
 def mock_openmeteo_client():
     """Mock Open-Meteo API client."""
-    client = MagicMock()
+    client = MagicMock(spec=OpenMeteoClient)
     client._latitude = 45.9237
     client._longitude = 6.8694
 
@@ -77,7 +81,7 @@ def mock_openmeteo_client():
 @pytest.fixture
 def mock_airquality_client():
     """Mock Air Quality API client."""
-    client = MagicMock()
+    client = MagicMock(spec=AirQualityClient)
 
     client.async_get_air_quality = AsyncMock(return_value={
         "european_aqi": 25,
@@ -91,7 +95,7 @@ def mock_airquality_client():
 @pytest.fixture
 def mock_bra_client():
     """Mock BRA API client."""
-    client = MagicMock()
+    client = MagicMock(spec=BraClient)
 
     client.async_get_bulletin = AsyncMock(return_value={
         "has_data": True,
@@ -0,0 +1,36 @@
+"""Tests for the Open-Meteo Air Quality API client."""
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.serac.api.airquality_client import (
+    AirQualityApiError,
+    AirQualityClient,
+)
+
+RESULT = {"current": {"european_aqi": 21}, "daily_forecast": []}
+
+
+class TestAirQualityCache:
+    """Test reuse of recent air quality results."""
+
+    async def test_cache_outlives_client(self):
+        """Test a new client on the same cache reuses a recent result."""
+        cache = {(45.924, 6.869): (time.monotonic() + 60, RESULT)}
+        session = MagicMock(closed=False)
+        client = AirQualityClient(45.92371, 6.86941, session=session, cache=cache)
+
+        assert await client.async_get_air_quality() is RESULT
+        session.get.assert_not_called()
+
+    async def test_expired_result_refetched(self):
+        """Test an expired result is not served."""
+        cache = {(45.924, 6.869): (time.monotonic() - 1, RESULT)}
+        session = MagicMock(closed=False)
+        session.get.side_effect = RuntimeError("request sent")
+        client = AirQualityClient(45.92371, 6.86941, session=session, cache=cache)
+
+        with pytest.raises(AirQualityApiError, match="request sent"):
+            await client.async_get_air_quality()
+        session.get.assert_called_once()
@@ -0,0 +1,125 @@
+"""Tests for the Météo-France BRA API client."""
+import pytest
+
+from custom_components.serac.api.bra_client import BraApiError, BraClient
+
+BULLETIN = """<?xml version="1.0" encoding="UTF-8"?>
+<BULLETINS_NEIGE_AVALANCHE TYPEBULLETIN="BRA" ID="2" MASSIF="ARAVIS"
+    DATEBULLETIN="2026-02-12T16:00:00" DATEECHEANCE="2026-02-13T16:00:00">
+  <DateValidite>2026-02-13T16:00:00</DateValidite>
+  <CARTOUCHERISQUE>
+    <RISQUE RISQUE1="3" EVOLURISQUE1="" LOC1="&gt;" ALTITUDE="2000"
+        RISQUE2="2" EVOLURISQUE2="" LOC2="&lt;" RISQUEMAXI="3"
+        COMMENTAIRE=" Risque marqué au-dessus de 2000 m. "
+        RISQUEMAXIJ2="2" DATE_RISQUE_J2="2026-02-14T00:00:00"/>
+    <PENTE NE="true" E="true" SE="false" S="false" W="false" NW="true" N="true"/>
+    <ACCIDENTEL><![CDATA[ Plaques friables en altitude. ]]></ACCIDENTEL>
+    <NATUREL><![CDATA[Coulées possibles aux heures chaudes.]]></NATUREL>
+    <RESUME><![CDATA[Risque marqué.]]></RESUME>
+    <AVIS><![CDATA[]]></AVIS>
+    <RisqueJ2>Risque limité</RisqueJ2>
+    <CommentaireRisqueJ2>Baisse du risque.</CommentaireRisqueJ2>
+  </CARTOUCHERISQUE>
+  <STABILITE><TITRE>Stabilité</TITRE><TEXTE>Manteau instable.</TEXTE></STABILITE>
+  <ENNEIGEMENT DATE="2026-02-12"><NIVEAU ALTI="1500" N="40" S="20"/></ENNEIGEMENT>
+</BULLETINS_NEIGE_AVALANCHE>
+""".encode()
+
+SPARSE_BULLETIN = b"""<?xml version="1.0" encoding="UTF-8"?>
+<BULLETINS_NEIGE_AVALANCHE MASSIF="MONT-BLANC" DATEBULLETIN="2026-02-12T16:00:00">
+  <CARTOUCHERISQUE>
+    <RISQUE RISQUE1="4" RISQUE2="" RISQUEMAXI="4" ALTITUDE=""/>
+  </CARTOUCHERISQUE>
+</BULLETINS_NEIGE_AVALANCHE>
+"""
+
+NO_CARTOUCHE_BULLETIN = b"""<?xml version="1.0" encoding="UTF-8"?>
+<BULLETINS_NEIGE_AVALANCHE MASSIF="CHABLAIS" DATEBULLETIN="2026-06-01T16:00:00">
+  <STABILITE><TEXTE>Fin de saison.</TEXTE></STABILITE>
+</BULLETINS_NEIGE_AVALANCHE>
+"""
+
+NO_RISK_BULLETIN = b"""<?xml version="1.0" encoding="UTF-8"?>
+<BULLETINS_NEIGE_AVALANCHE MASSIF="CHABLAIS" DATEBULLETIN="2026-06-01T16:00:00">
+  <CARTOUCHERISQUE><RESUME>Pas de risque.</RESUME></CARTOUCHERISQUE>
+</BULLETINS_NEIGE_AVALANCHE>
+"""
+
+
+@pytest.fixture
+def client():
+    """BRA client without a session (no request is made)."""
+    return BraClient(api_key="test_key", massif_id=2)
+
+
+class TestParseBulletin:
+    """Test parsing of bulletin XML."""
+
+    def test_full_bulletin(self, client):
+        """Test every field is read from the risk cartridge."""
+        assert client._parse_bulletin_xml(BULLETIN) == {
+            "bulletin_date": "2026-02-12T16:00:00",
+            "massif_name": "ARAVIS",
+            "has_data": True,
+            "risk_max": 3,
+            "risk_high_altitude": 3,
+            "risk_low_altitude": 2,
+            "altitude_limit": 2000,
+            "risk_comment": "Risque marqué au-dessus de 2000 m.",
+            "risk_max_j2": 2,
+            "date_risk_j2": "2026-02-14T00:00:00",
+            "risk_j2_text": "Risque limité",
+            "risk_j2_comment": "Baisse du risque.",
+            "accidental_text": "Plaques friables en altitude.",
+            "natural_text": "Coulées possibles aux heures chaudes.",
+            "summary": "Risque marqué.",
+            "warning": "",
+        }
+
+    def test_sparse_bulletin(self, client):
+        """Test missing attributes and texts fall back to empty values."""
+        assert client._parse_bulletin_xml(SPARSE_BULLETIN) == {
+            "bulletin_date": "2026-02-12T16:00:00",
+            "massif_name": "MONT-BLANC",
+            "has_data": True,
+            "risk_max": 4,
+            "risk_high_altitude": 4,
+            "risk_low_altitude": None,
+            "altitude_limit": None,
+            "risk_comment": "",
+            "risk_max_j2": None,
+            "date_risk_j2": None,
+            "risk_j2_text": "",
+            "risk_j2_comment": "",
+            "accidental_text": "",
+            "natural_text": "",
+            "summary": "",
+            "warning": "",
+        }
+
+    @pytest.mark.parametrize(
+        "xml_content",
+        [
+            pytest.param(NO_CARTOUCHE_BULLETIN, id="no_cartouche"),
+            pytest.param(NO_RISK_BULLETIN, id="no_risk"),
+        ],
+    )
+    def test_bulletin_without_risk(self, client, xml_content):
+        """Test a bulletin without risk data is reported as having no data."""
+        assert client._parse_bulletin_xml(xml_content) == {
+            "bulletin_date": "2026-06-01T16:00:00",
+            "massif_name": "CHABLAIS",
+            "has_data": False,
+        }
+
+    @pytest.mark.parametrize(
+        "xml_content",
+        [
+            pytest.param(b"<BULLETINS_NEIGE_AVALANCHE", id="truncated"),
+            pytest.param(b"", id="empty"),
+        ],
+    )
+    def test_malformed_xml(self, client, xml_content):
+        """Test unparseable XML raises an API error."""
+        with pytest.raises(BraApiError, match="XML parsing failed"):
+            client._parse_bulletin_xml(xml_content)
@@ -12,7 +12,6 @@ from custom_components.serac.const import DOMAIN
 class TestConfigFlow:
     """Test Serac config flow."""
 
-    @pytest.mark.asyncio
     async def test_user_step_valid_coordinates(self, mock_hass):
         """Test user step with valid coordinates."""
         flow = SeracConfigFlow()
@@ -42,7 +41,6 @@ class TestConfigFlow:
         assert flow.latitude == 45.9237
         assert flow.longitude == 6.8694
 
-    @pytest.mark.asyncio
     async def test_user_step_invalid_coordinates(self, mock_hass):
         """Test user step with invalid coordinates."""
         flow = SeracConfigFlow()
@@ -70,7 +68,6 @@ class TestConfigFlow:
         assert result["step_id"] == "user"
         assert "cannot_connect" in result["errors"]["base"]
 
-    @pytest.mark.asyncio
     async def test_prefix_step_valid(self, mock_hass):
         """Test prefix step with valid input."""
         flow = SeracConfigFlow()
@@ -87,7 +84,6 @@ class TestConfigFlow:
         assert result["step_id"] == "massifs"
         assert flow.entity_prefix == "test"
 
-    @pytest.mark.asyncio
     async def test_prefix_step_invalid(self, mock_hass):
         """Test prefix step with invalid input."""
         flow = SeracConfigFlow()
@@ -102,7 +98,6 @@ class TestConfigFlow:
         assert result["step_id"] == "prefix"
         assert "invalid_prefix" in result["errors"]["entity_prefix"]
 
-    @pytest.mark.asyncio
     async def test_massifs_step_with_token(self, mock_hass):
         """Test massifs step with BRA token."""
         flow = SeracConfigFlow()
@@ -124,7 +119,6 @@ class TestConfigFlow:
         assert result["data"]["bra_token"] == "test_token_123"
         assert result["data"]["massif_ids"] == ["1", "2"]
 
-    @pytest.mark.asyncio
     async def test_massifs_step_without_token(self, mock_hass):
         """Test massifs step without BRA token (weather only)."""
         flow = SeracConfigFlow()
@@ -146,57 +140,35 @@ class TestConfigFlow:
         assert "bra_token" not in result["data"]
         assert result["data"]["massif_ids"] == []
 
-    @pytest.mark.asyncio
-    async def test_prefix_validation_start_with_letter(self):
-        """Test prefix must start with a letter."""
-        flow = SeracConfigFlow()
-
-        # Test invalid prefixes
-        assert not flow._is_valid_prefix("1test")  # Starts with number
-        assert not flow._is_valid_prefix("_test")  # Starts with underscore
-
-        # Test valid prefixes
-        assert flow._is_valid_prefix("test")
-        assert flow._is_valid_prefix("test123")
-        assert flow._is_valid_prefix("test_home")
-
-    @pytest.mark.asyncio
-    async def test_prefix_validation_characters(self):
-        """Test prefix character validation."""
-        flow = SeracConfigFlow()
-
-        # Test invalid characters
-        assert not flow._is_valid_prefix("test-home")  # Dash not allowed
-        assert not flow._is_valid_prefix("test home")  # Space not allowed
-        assert not flow._is_valid_prefix("test!home")  # Special char not allowed
-        assert not flow._is_valid_prefix("Test")  # Uppercase not allowed
-
-        # Test valid
-        assert flow._is_valid_prefix("test")
-        assert flow._is_valid_prefix("test_123")
-        assert flow._is_valid_prefix("my_home_station")
-
-    @pytest.mark.asyncio
-    async def test_prefix_validation_length(self):
-        """Test prefix length validation."""
-        flow = SeracConfigFlow()
-
-        # Too short (empty)
-        assert not flow._is_valid_prefix("")
-
-        # Too long (>20 characters)
-        assert not flow._is_valid_prefix("a" * 21)
-
-        # Valid lengths
-        assert flow._is_valid_prefix("a")  # Minimum
-        assert flow._is_valid_prefix("a" * 20)  # Maximum
-        assert flow._is_valid_prefix("test")  # Normal
-
-    @pytest.mark.asyncio
-    async def test_prefix_suggestion(self):
+    @pytest.mark.parametrize(
+        ("prefix", "expected"),
+        [
+            # Must start with a letter
+            ("1test", False),
+            ("_test", False),
+            # Only lowercase letters, digits and underscores
+            ("test-home", False),
+            ("test home", False),
+            ("test!home", False),
+            ("Test", False),
+            # 1 to 20 characters
+            ("", False),
+            ("a" * 21, False),
+            ("a", True),
+            ("a" * 20, True),
+            ("test", True),
+            ("test123", True),
+            ("test_123", True),
+            ("test_home", True),
+            ("my_home_station", True),
+        ],
+    )
+    def test_prefix_validation(self, prefix, expected):
+        """Test entity prefix validation rules."""
+        assert SeracConfigFlow._validate_prefix(prefix) is expected
+
+    def test_prefix_suggestion(self):
         """Test automatic prefix suggestion."""
-        flow = SeracConfigFlow()
-
         # Test various location names
         suggestions = [
             ("Chamonix Mont-Blanc", "chamonix"),
@@ -208,5 +180,5 @@ class TestConfigFlow:
         ]
 
         for location, expected in suggestions:
-            suggested = flow._suggest_prefix(location)
+            suggested = SeracConfigFlow._suggest_prefix(location)
             assert suggested == expected or len(suggested) <= 20
@@ -1,6 +1,6 @@
 """Tests for Serac coordinators."""
 import asyncio
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import aiohttp
 import pytest
@@ -12,73 +12,81 @@ from custom_components.serac.coordinator import (
 )
 from homeassistant.helpers.update_coordinator import UpdateFailed
 
+# Only .status is read by the retry logic, so the instances can be shared;
+# str() of the errors (when logged) needs request_info.real_url
+REQUEST_INFO = MagicMock(real_url="https://example.com")
+AUTH_ERROR = aiohttp.ClientResponseError(REQUEST_INFO, history=(), status=401)
+SERVER_ERROR = aiohttp.ClientResponseError(REQUEST_INFO, history=(), status=503)
+
+
+async def bypass_retry(func, **kwargs):
+    """Stand-in for async_retry_with_backoff that makes a single attempt."""
+    return await func()
+
 
 class TestRetryLogic:
     """Test retry logic with exponential backoff."""
 
-    @pytest.mark.asyncio
-    async def test_retry_success_first_attempt(self):
-        """Test successful call on first attempt."""
-        mock_func = AsyncMock(return_value="success")
-        result = await async_retry_with_backoff(mock_func, context="Test call")
-        assert result == "success"
-        assert mock_func.call_count == 1
-
-    @pytest.mark.asyncio
-    async def test_retry_success_after_failure(self):
-        """Test successful call after one failure."""
-        mock_func = AsyncMock(
-            side_effect=[aiohttp.ClientError("Network error"), "success"]
-        )
+    @pytest.fixture(autouse=True)
+    def mock_sleep(self, monkeypatch):
+        """Run retries without waiting out the backoff delays."""
+        sleep = AsyncMock()
+        monkeypatch.setattr("custom_components.serac.coordinator._sleep", sleep)
+        return sleep
+
+    @pytest.mark.parametrize(
+        ("side_effect", "expected_calls"),
+        [
+            pytest.param(["success"], 1, id="first_attempt"),
+            pytest.param(
+                [aiohttp.ClientError("Network error"), "success"],
+                2,
+                id="after_network_error",
+            ),
+            pytest.param([SERVER_ERROR, "success"], 2, id="after_server_error"),
+        ],
+    )
+    async def test_retry_success(self, side_effect, expected_calls):
+        """Test success on the first attempt or after retryable failures."""
+        mock_func = AsyncMock(side_effect=side_effect)
         result = await async_retry_with_backoff(
-            mock_func, max_retries=2, initial_delay=0.01, context="Test call"
+            mock_func, max_retries=2, context="Test call"
         )
         assert result == "success"
-        assert mock_func.call_count == 2
-
-    @pytest.mark.asyncio
-    async def test_retry_max_attempts_exceeded(self):
-        """Test failure after max retries."""
-        mock_func = AsyncMock(side_effect=aiohttp.ClientError("Persistent error"))
-        with pytest.raises(aiohttp.ClientError):
-            await async_retry_with_backoff(
-                mock_func, max_retries=2, initial_delay=0.01, context="Test call"
-            )
-        assert mock_func.call_count == 3  # Initial + 2 retries
-
-    @pytest.mark.asyncio
-    async def test_no_retry_on_auth_error(self):
-        """Test no retry on 401 auth error."""
-        error = aiohttp.ClientResponseError(
-            request_info=None, history=None, status=401
-        )
+        assert mock_func.call_count == expected_calls
+
+    @pytest.mark.parametrize(
+        ("error", "expected_calls", "expected_delays"),
+        [
+            # Initial + 2 retries, exponential backoff between attempts
+            pytest.param(
+                aiohttp.ClientError("Persistent error"),
+                3,
+                [1.0, 2.0],
+                id="max_attempts_exceeded",
+            ),
+            # No retries on auth error
+            pytest.param(AUTH_ERROR, 1, [], id="auth_error"),
+        ],
+    )
+    async def test_retry_terminal_error(
+        self, mock_sleep, error, expected_calls, expected_delays
+    ):
+        """Test the error is raised once retries are exhausted or not allowed."""
         mock_func = AsyncMock(side_effect=error)
-        with pytest.raises(aiohttp.ClientResponseError):
+        with pytest.raises(type(error)):
             await async_retry_with_backoff(
-                mock_func, max_retries=2, initial_delay=0.01, context="Test call"
+                mock_func, max_retries=2, context="Test call"
             )
-        assert mock_func.call_count == 1  # No retries on auth error
-
-    @pytest.mark.asyncio
-    async def test_retry_on_server_error(self):
-        """Test retry on 503 server error."""
-        error = aiohttp.ClientResponseError(
-            request_info=None, history=None, status=503
-        )
-        mock_func = AsyncMock(side_effect=[error, "success"])
-        result = await async_retry_with_backoff(
-            mock_func, max_retries=2, initial_delay=0.01, context="Test call"
-        )
-        assert result == "success"
-        assert mock_func.call_count == 2
+        assert mock_func.call_count == expected_calls
+        assert [c.args[0] for c in mock_sleep.await_args_list] == expected_delays
 
 
 class TestAromeCoordinator:
     """Test AromeCoordinator."""
 
-    @pytest.mark.asyncio
     async def test_successful_update(
-        self, mock_hass, mock_openmeteo_client, mock_airquality_client
+        self, mock_hass, mock_openmeteo_client, mock_airquality_client, monkeypatch
     ):
         """Test successful weather data update."""
         coordinator = AromeCoordinator(
@@ -88,12 +96,12 @@ class TestAromeCoordinator:
             airquality_client=mock_airquality_client,
         )
 
-        # Mock retry function to bypass delays
-        with patch(
+        # Bypass the retry wrapper and its delays
+        monkeypatch.setattr(
             "custom_components.serac.coordinator.async_retry_with_backoff",
-            side_effect=lambda func, **kwargs: func(),
-        ):
-            data = await coordinator._async_update_data()
+            bypass_retry,
+        )
+        data = await coordinator._async_update_data()
 
         assert data is not None
         assert "current" in data
@@ -107,8 +115,9 @@ class TestAromeCoordinator:
         mock_openmeteo_client.async_get_daily_forecast.assert_called_once()
         mock_airquality_client.async_get_air_quality.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_update_without_air_quality(self, mock_hass, mock_openmeteo_client):
+    async def test_update_without_air_quality(
+        self, mock_hass, mock_openmeteo_client, monkeypatch
+    ):
         """Test weather update without air quality client."""
         coordinator = AromeCoordinator(
             hass=mock_hass,
@@ -117,17 +126,18 @@ class TestAromeCoordinator:
             airquality_client=None,
         )
 
-        with patch(
+        monkeypatch.setattr(
             "custom_components.serac.coordinator.async_retry_with_backoff",
-            side_effect=lambda func, **kwargs: func(),
-        ):
-            data = await coordinator._async_update_data()
+            bypass_retry,
+        )
+        data = await coordinator._async_update_data()
 
         assert data is not None
         assert data["air_quality"] == {}
 
-    @pytest.mark.asyncio
-    async def test_update_api_error(self, mock_hass, mock_openmeteo_client):
+    async def test_update_api_error(
+        self, mock_hass, mock_openmeteo_client, monkeypatch
+    ):
         """Test update with API error."""
         coordinator = AromeCoordinator(
             hass=mock_hass,
@@ -139,19 +149,18 @@ class TestAromeCoordinator:
         error = aiohttp.ClientError("Network error")
         mock_openmeteo_client.async_get_current_weather = AsyncMock(side_effect=error)
 
-        with pytest.raises(UpdateFailed):
-            with patch(
-                "custom_components.serac.coordinator.async_retry_with_backoff",
-                side_effect=error,
-            ):
-                await coordinator._async_update_data()
+        monkeypatch.setattr(
+            "custom_components.serac.coordinator.async_retry_with_backoff",
+            AsyncMock(side_effect=error),
+        )
+        with pytest.raises(UpdateFailed, match="Network error"):
+            await coordinator._async_update_data()
 
 
 class TestBraCoordinator:
     """Test BraCoordinator."""
 
-    @pytest.mark.asyncio
-    async def test_successful_update(self, mock_hass, mock_bra_client):
+    async def test_successful_update(self, mock_hass, mock_bra_client, monkeypatch):
         """Test successful BRA bulletin update."""
         coordinator = BraCoordinator(
             hass=mock_hass,
@@ -159,13 +168,14 @@ class TestBraCoordinator:
             location_name="Test Location",
             massif_id=1,
             massif_name="Chablais",
+            fetch_semaphore=asyncio.Semaphore(3),
         )
 
-        with patch(
+        monkeypatch.setattr(
             "custom_components.serac.coordinator.async_retry_with_backoff",
-            side_effect=lambda func, **kwargs: func(),
-        ):
-            data = await coordinator._async_update_data()
+            bypass_retry,
+        )
+        data = await coordinator._async_update_data()
 
         assert data is not None
         assert data["has_data"] is True
@@ -175,8 +185,7 @@ class TestBraCoordinator:
 
         mock_bra_client.async_get_bulletin.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_update_no_data(self, mock_hass, mock_bra_client):
+    async def test_update_no_data(self, mock_hass, mock_bra_client, monkeypatch):
         """Test update when bulletin has no data (out of season)."""
         coordinator = BraCoordinator(
             hass=mock_hass,
@@ -184,6 +193,7 @@ class TestBraCoordinator:
             location_name="Test Location",
             massif_id=1,
             massif_name="Chablais",
+            fetch_semaphore=asyncio.Semaphore(3),
         )
 
         # Simulate no data available (out of season)
@@ -191,17 +201,16 @@ class TestBraCoordinator:
             return_value={"has_data": False}
         )
 
-        with patch(
+        monkeypatch.setattr(
             "custom_components.serac.coordinator.async_retry_with_backoff",
-            side_effect=lambda func, **kwargs: func(),
-        ):
-            data = await coordinator._async_update_data()
+            bypass_retry,
+        )
+        data = await coordinator._async_update_data()
 
         assert data is not None
         assert data["has_data"] is False
 
-    @pytest.mark.asyncio
-    async def test_update_api_error(self, mock_hass, mock_bra_client):
+    async def test_update_api_error(self, mock_hass, mock_bra_client, monkeypatch):
         """Test update with API error."""
         coordinator = BraCoordinator(
             hass=mock_hass,
@@ -209,15 +218,43 @@ class TestBraCoordinator:
             location_name="Test Location",
             massif_id=1,
             massif_name="Chablais",
+            fetch_semaphore=asyncio.Semaphore(3),
         )
 
         # Simulate API error
         error = aiohttp.ClientError("Network error")
         mock_bra_client.async_get_bulletin = AsyncMock(side_effect=error)
 
-        with pytest.raises(UpdateFailed):
-            with patch(
-                "custom_components.serac.coordinator.async_retry_with_backoff",
-                side_effect=error,
-            ):
-                await coordinator._async_update_data()
+        monkeypatch.setattr(
+            "custom_components.serac.coordinator.async_retry_with_backoff",
+            AsyncMock(side_effect=error),
+        )
+        with pytest.raises(UpdateFailed, match="Network error"):
+            await coordinator._async_update_data()
+
+    async def test_fetch_holds_shared_semaphore(
+        self, mock_hass, mock_bra_client, monkeypatch
+    ):
+        """Test the bulletin is fetched while holding the injected semaphore."""
+        semaphore = asyncio.Semaphore(1)
+        coordinator = BraCoordinator(
+            hass=mock_hass,
+            client=mock_bra_client,
+            location_name="Test Location",
+            massif_id=1,
+            massif_name="Chablais",
+            fetch_semaphore=semaphore,
+        )
+        held = []
+
+        async def fetch(func, **kwargs):
+            held.append(semaphore.locked())
+            return await func()
+
+        monkeypatch.setattr(
+            "custom_components.serac.coordinator.async_retry_with_backoff", fetch
+        )
+        await coordinator._async_update_data()
+
+        assert held == [True]
+        assert not semaphore.locked()
@@ -0,0 +1,264 @@
+"""Tests for Serac setup, unload and entity migration."""
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.serac import (
+    async_migrate_entity_ids,
+    async_setup_entry,
+    async_unload_entry,
+)
+from custom_components.serac.api.openmeteo_client import OpenMeteoApiError
+from custom_components.serac.const import DOMAIN, SHARED_CLIENTS
+from homeassistant.exceptions import ConfigEntryNotReady
+
+
+def make_entry(entry_id, latitude=45.9237, longitude=6.8694):
+    """Build a weather-only config entry."""
+    entry = MagicMock()
+    entry.entry_id = entry_id
+    entry.data = {
+        "latitude": latitude,
+        "longitude": longitude,
+        "location_name": "Test Location",
+        "entity_prefix": "test",
+    }
+    return entry
+
+
+@pytest.fixture
+def setup_hass(mock_hass):
+    """Mock hass with the config entry and service helpers used by setup."""
+    mock_hass.config_entries.async_forward_entry_setups = AsyncMock()
+    mock_hass.config_entries.async_unload_platforms = AsyncMock(return_value=True)
+    mock_hass.services.has_service.return_value = True
+    return mock_hass
+
+
+@pytest.fixture
+def arome_refresh(monkeypatch):
+    """Stub out everything setup touches besides the shared clients.
+
+    Returns the first refresh mock shared by every AromeCoordinator.
+    """
+    refresh = AsyncMock()
+    monkeypatch.setattr(
+        "custom_components.serac.AromeCoordinator",
+        MagicMock(return_value=MagicMock(async_config_entry_first_refresh=refresh)),
+    )
+    for name in ("OpenMeteoClient", "AirQualityClient"):
+        monkeypatch.setattr(
+            f"custom_components.serac.{name}",
+            MagicMock(side_effect=lambda **kwargs: MagicMock(async_close=AsyncMock())),
+        )
+    monkeypatch.setattr(
+        "custom_components.serac.async_get_clientsession", MagicMock()
+    )
+    monkeypatch.setattr("custom_components.serac.async_migrate_entity_ids", AsyncMock())
+    monkeypatch.setattr(
+        "custom_components.serac.async_cleanup_removed_massifs", AsyncMock()
+    )
+    return refresh
+
+
+def shared_clients(hass):
+    """Return the shared client registry."""
+    return hass.data[DOMAIN][SHARED_CLIENTS]
+
+
+class TestSharedClients:
+    """Test reference-counted sharing of Open-Meteo and Air Quality clients."""
+
+    async def test_entries_at_same_location_share_clients(
+        self, setup_hass, arome_refresh
+    ):
+        """Test entries at the same rounded location reuse one client pair."""
+        first = make_entry("first", 45.92371, 6.86941)
+        second = make_entry("second", 45.92374, 6.86944)
+
+        assert await async_setup_entry(setup_hass, first)
+        assert await async_setup_entry(setup_hass, second)
+
+        first_data = setup_hass.data[DOMAIN]["first"]
+        second_data = setup_hass.data[DOMAIN]["second"]
+        assert first_data["arome_client"] is second_data["arome_client"]
+        assert first_data["airquality_client"] is second_data["airquality_client"]
+        assert shared_clients(setup_hass)[first_data["client_key"]]["refcount"] == 2
+
+    async def test_entries_at_different_locations(self, setup_hass, arome_refresh):
+        """Test entries at different locations get their own clients."""
+        assert await async_setup_entry(setup_hass, make_entry("first", 45.9237, 6.8694))
+        assert await async_setup_entry(setup_hass, make_entry("second", 45.0, 6.0))
+
+        assert (
+            setup_hass.data[DOMAIN]["first"]["arome_client"]
+            is not setup_hass.data[DOMAIN]["second"]["arome_client"]
+        )
+        assert len(shared_clients(setup_hass)) == 2
+
+    async def test_unload_closes_clients_after_last_entry(
+        self, setup_hass, arome_refresh
+    ):
+        """Test clients stay open until the last entry using them unloads."""
+        first = make_entry("first")
+        second = make_entry("second")
+        await async_setup_entry(setup_hass, first)
+        await async_setup_entry(setup_hass, second)
+        key = setup_hass.data[DOMAIN]["first"]["client_key"]
+        arome_client = setup_hass.data[DOMAIN]["first"]["arome_client"]
+        airquality_client = setup_hass.data[DOMAIN]["first"]["airquality_client"]
+
+        assert await async_unload_entry(setup_hass, first)
+
+        assert shared_clients(setup_hass)[key]["refcount"] == 1
+        arome_client.async_close.assert_not_awaited()
+        airquality_client.async_close.assert_not_awaited()
+
+        assert await async_unload_entry(setup_hass, second)
+
+        assert key not in shared_clients(setup_hass)
+        arome_client.async_close.assert_awaited_once()
+        airquality_client.async_close.assert_awaited_once()
+
+    async def test_first_refresh_failure_releases_clients(
+        self, setup_hass, arome_refresh
+    ):
+        """Test a failed first refresh drops the reference it acquired."""
+        arome_refresh.side_effect = OpenMeteoApiError("API down")
+
+        with pytest.raises(ConfigEntryNotReady):
+            await async_setup_entry(setup_hass, make_entry("first"))
+
+        assert shared_clients(setup_hass) == {}
+        assert "first" not in setup_hass.data[DOMAIN]
+
+    async def test_first_refresh_failure_keeps_clients_in_use(
+        self, setup_hass, arome_refresh
+    ):
+        """Test a failed entry doesn't close clients another entry still uses."""
+        await async_setup_entry(setup_hass, make_entry("first"))
+        key = setup_hass.data[DOMAIN]["first"]["client_key"]
+        arome_client = setup_hass.data[DOMAIN]["first"]["arome_client"]
+
+        arome_refresh.side_effect = RuntimeError("Unexpected")
+        with pytest.raises(ConfigEntryNotReady):
+            await async_setup_entry(setup_hass, make_entry("second"))
+
+        assert shared_clients(setup_hass)[key]["refcount"] == 1
+        arome_client.async_close.assert_not_awaited()
+
+    async def test_platform_setup_failure_releases_clients(
+        self, setup_hass, arome_refresh
+    ):
+        """Test a failure after the first refresh drops the reference too."""
+        setup_hass.config_entries.async_forward_entry_setups.side_effect = (
+            RuntimeError("Platform failed")
+        )
+
+        with pytest.raises(RuntimeError, match="Platform failed"):
+            await async_setup_entry(setup_hass, make_entry("first"))
+
+        assert shared_clients(setup_hass) == {}
+        assert "first" not in setup_hass.data[DOMAIN]
+
+
+class FakeEntityRegistry:
+    """In-memory entity registry with the calls used by the migration."""
+
+    def __init__(self, *entries):
+        """Initialize with (entity_id, unique_id, config_entry_id) tuples."""
+        self.entities = {
+            entity_id: SimpleNamespace(
+                entity_id=entity_id,
+                unique_id=unique_id,
+                config_entry_id=config_entry_id,
+            )
+            for entity_id, unique_id, config_entry_id in entries
+        }
+
+    def async_get(self, entity_id):
+        """Return the entry for an entity ID, if registered."""
+        return self.entities.get(entity_id)
+
+    def async_remove(self, entity_id):
+        """Remove an entity."""
+        del self.entities[entity_id]
+
+    def async_update_entity(self, entity_id, *, new_entity_id):
+        """Rename an entity, refusing to overwrite an existing one."""
+        if new_entity_id in self.entities:
+            raise ValueError(f"Entity {new_entity_id} is already registered")
+        entry = self.entities.pop(entity_id)
+        entry.entity_id = new_entity_id
+        self.entities[new_entity_id] = entry
+
+
+OLD = "station_de_ski_orange_mountain_weather"
+FULL = "location_45_9237_6_8694_mountain_weather"
+NEW = "location_45_92_6_87_mountain_weather"
+
+
+class TestEntityMigration:
+    """Test migration of old entity IDs to the rounded coordinate pattern."""
+
+    @pytest.fixture
+    def registry(self, monkeypatch):
+        """Registry holding old-format, new-format and foreign entities."""
+        registry = FakeEntityRegistry(
+            # Old pattern, target free: renamed
+            (f"weather.{OLD}", "weather_uid", "entry"),
+            # Old pattern, target already registered: old entity removed
+            (f"sensor.{OLD}_humidity", "humidity_old_uid", "entry"),
+            (f"sensor.{NEW}_humidity", "humidity_uid", "entry"),
+            # Full precision coordinates: renamed to the rounded pattern
+            (f"sensor.{FULL}_elevation", "elevation_uid", "entry"),
+            # Two old IDs mapping to one target: first renamed, second removed
+            (f"sensor.{OLD}_wind_speed", "wind_old_uid", "entry"),
+            (f"sensor.{FULL}_wind_speed", "wind_full_uid", "entry"),
+            # Sensor that no longer exists: removed
+            (f"sensor.{OLD}_sunrise", "sunrise_uid", "entry"),
+            # Old BRA unique ID without massif: removed; new format kept
+            ("sensor.old_avalanche", f"{NEW}_avalanche_risk_today", "entry"),
+            ("sensor.new_avalanche", f"{NEW}_3_avalanche_risk_today", "entry"),
+            # Already migrated
+            (f"sensor.{NEW}_wind_gust", "gust_uid", "entry"),
+            # Another config entry's entities are left alone
+            (f"sensor.{OLD}_uv_index", "other_uv_uid", "other"),
+            (f"sensor.{OLD}_cloud_coverage", "other_cloud_uid", "other"),
+        )
+        monkeypatch.setattr(
+            "custom_components.serac.er",
+            SimpleNamespace(async_get=lambda hass: registry),
+        )
+        return registry
+
+    async def test_migrate_entity_ids(self, mock_hass, registry):
+        """Test old entities are renamed or removed in one pass."""
+        entry = make_entry("entry")
+
+        await async_migrate_entity_ids(mock_hass, entry)
+
+        assert {
+            entity_id: entity.unique_id
+            for entity_id, entity in registry.entities.items()
+        } == {
+            f"weather.{NEW}": "weather_uid",
+            f"sensor.{NEW}_humidity": "humidity_uid",
+            f"sensor.{NEW}_elevation": "elevation_uid",
+            f"sensor.{NEW}_wind_speed": "wind_old_uid",
+            "sensor.new_avalanche": f"{NEW}_3_avalanche_risk_today",
+            f"sensor.{NEW}_wind_gust": "gust_uid",
+            f"sensor.{OLD}_uv_index": "other_uv_uid",
+            f"sensor.{OLD}_cloud_coverage": "other_cloud_uid",
+        }
+
+    async def test_migration_is_idempotent(self, mock_hass, registry):
+        """Test running the migration again changes nothing."""
+        entry = make_entry("entry")
+        await async_migrate_entity_ids(mock_hass, entry)
+        migrated = dict(registry.entities)
+
+        await async_migrate_entity_ids(mock_hass, entry)
+
+        assert registry.entities == migrated
@@ -0,0 +1,335 @@
+"""Tests for the Open-Meteo API client."""
+import asyncio
+import contextlib
+from datetime import datetime, timedelta
+import json
+
+import pytest
+
+from custom_components.serac.api.openmeteo_client import (
+    OpenMeteoApiError,
+    OpenMeteoClient,
+)
+
+BASE = datetime(2026, 2, 12, 0, 0)
+
+
+def hourly_times(count, start=BASE, skip=()):
+    """Build an hourly ISO timestamp series, leaving out the given indexes."""
+    return [
+        (start + timedelta(hours=i)).isoformat(timespec="minutes")
+        for i in range(count)
+        if i not in skip
+    ]
+
+
+@pytest.fixture
+def client():
+    """Open-Meteo client without a session (no request is made)."""
+    return OpenMeteoClient(latitude=45.9237, longitude=6.8694)
+
+
+@pytest.fixture
+def freeze_now(monkeypatch):
+    """Pin the client's notion of now to a given naive datetime."""
+
+    def _freeze(now):
+        class FrozenDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return now if tz is None else now.replace(tzinfo=tz)
+
+        monkeypatch.setattr(
+            "custom_components.serac.api.openmeteo_client.datetime", FrozenDatetime
+        )
+
+    return _freeze
+
+
+PAYLOAD = {"current": {"temperature_2m": 5.2, "cloud_cover": 10}, "elevation": 1035}
+
+
+class FakeResponse:
+    """Minimal aiohttp response returning a fixed status and body."""
+
+    def __init__(self, status=200, body=b"", headers=None):
+        """Initialize the response."""
+        self.status = status
+        self.headers = headers or {}
+        self._body = body
+
+    async def read(self):
+        """Return the raw body."""
+        return self._body
+
+    def raise_for_status(self):
+        """Accept every status used by these tests."""
+
+
+class FakeSession:
+    """Minimal aiohttp session serving queued responses.
+
+    When a gate is given, responses are held until it is set so tests can
+    act while a request is in flight.
+    """
+
+    closed = False
+
+    def __init__(self, *responses, gate=None):
+        """Initialize the session."""
+        self.responses = list(responses)
+        self.requests = []
+        self.gate = gate
+
+    def get(self, url, *, params=None, headers=None, timeout=None):
+        """Record the request headers and serve the next response."""
+        self.requests.append(headers or {})
+        return self._respond(self.responses.pop(0))
+
+    @contextlib.asynccontextmanager
+    async def _respond(self, response):
+        if self.gate is not None:
+            await self.gate.wait()
+        yield response
+
+
+def ok_response(headers=None):
+    """Return a 200 response carrying the test payload."""
+    return FakeResponse(200, json.dumps(PAYLOAD).encode(), headers)
+
+
+def slow_future_hours(times, now, limit):
+    """Reference selection: parse every row and keep those after now."""
+    rows = [
+        (i, datetime.fromisoformat(t))
+        for i, t in enumerate(times)
+        if datetime.fromisoformat(t) > now
+    ]
+    return rows[:limit]
+
+
+class TestRegularSeries:
+    """Test detection of evenly spaced series."""
+
+    def test_regular_series(self):
+        """Test an unbroken hourly series returns its first timestamp."""
+        times = hourly_times(48)
+        assert OpenMeteoClient._regular_series_start(times, timedelta(hours=1)) == BASE
+
+    def test_gapped_series(self):
+        """Test a series with a missing hour must be parsed row by row."""
+        times = hourly_times(48, skip={10})
+        assert OpenMeteoClient._regular_series_start(times, timedelta(hours=1)) is None
+
+    def test_irregular_daily_series(self):
+        """Test a daily series with uneven spacing is rejected."""
+        times = ["2026-02-12", "2026-02-13", "2026-02-15"]
+        assert OpenMeteoClient._regular_series_start(times, timedelta(days=1)) is None
+
+    def test_single_row(self):
+        """Test a one-row series is trivially regular."""
+        times = hourly_times(1)
+        assert OpenMeteoClient._regular_series_start(times, timedelta(hours=1)) == BASE
+
+    def test_empty_series(self):
+        """Test an empty series has no start."""
+        assert OpenMeteoClient._regular_series_start([], timedelta(hours=1)) is None
+
+
+class TestFirstFutureIndex:
+    """Test the first future row index of a regular hourly series."""
+
+    @pytest.mark.parametrize(
+        ("now", "expected"),
+        [
+            pytest.param(BASE - timedelta(hours=3), 0, id="before_series"),
+            pytest.param(BASE, 1, id="equal_to_first_row"),
+            pytest.param(BASE + timedelta(hours=5), 6, id="equal_to_row"),
+            pytest.param(BASE + timedelta(hours=5, minutes=1), 6, id="just_after_row"),
+            pytest.param(
+                BASE + timedelta(hours=5, minutes=59, seconds=59),
+                6,
+                id="just_before_next",
+            ),
+        ],
+    )
+    def test_first_future_index(self, now, expected):
+        """Test rows equal to now are excluded and later rows included."""
+        assert OpenMeteoClient._first_future_index(BASE, now) == expected
+
+
+class TestFutureHours:
+    """Test selection of future hourly rows."""
+
+    @pytest.mark.parametrize(
+        "now",
+        [
+            pytest.param(BASE + timedelta(hours=5), id="on_the_hour"),
+            pytest.param(BASE + timedelta(hours=5, minutes=30), id="mid_hour"),
+        ],
+    )
+    @pytest.mark.parametrize(
+        "skip",
+        [pytest.param((), id="regular"), pytest.param({7, 8}, id="gapped")],
+    )
+    def test_matches_per_row_parsing(self, client, freeze_now, now, skip):
+        """Test the fast and fallback paths select the same rows as parsing."""
+        freeze_now(now)
+        times = hourly_times(48, skip=skip)
+
+        assert client._future_hours(times, 6) == slow_future_hours(times, now, 6)
+
+    def test_gapped_series_keeps_indexes(self, client, freeze_now):
+        """Test the fallback path returns row indexes around the gap."""
+        freeze_now(BASE + timedelta(hours=5))
+        times = hourly_times(12, skip={7})
+
+        rows = client._future_hours(times, 3)
+
+        assert [i for i, _ in rows] == [6, 7, 8]
+        assert [dt.hour for _, dt in rows] == [6, 8, 9]
+
+    def test_now_equal_to_last_row(self, client, freeze_now):
+        """Test no rows are returned once the last row is no longer future."""
+        freeze_now(BASE + timedelta(hours=11))
+        assert client._future_hours(hourly_times(12), 6) == []
+
+    def test_short_series(self, client, freeze_now):
+        """Test a series shorter than the limit returns the remaining rows."""
+        freeze_now(BASE + timedelta(hours=1))
+        rows = client._future_hours(hourly_times(4), 6)
+        assert [i for i, _ in rows] == [2, 3]
+
+    def test_empty_series(self, client, freeze_now):
+        """Test an empty series returns no rows."""
+        freeze_now(BASE)
+        assert client._future_hours([], 6) == []
+
+
+class TestParseHourly:
+    """Test hourly forecast parsing."""
+
+    def test_datetime_is_api_string(self, client, freeze_now):
+        """Test hourly rows keep the timestamp string returned by the API."""
+        freeze_now(BASE + timedelta(minutes=30))
+        times = hourly_times(4)
+        data = {"hourly": {"time": times, "temperature_2m": [1.0, 2.0, 3.0, 4.0]}}
+
+        hourly = client._parse_hourly(data)
+
+        assert [row["datetime"] for row in hourly] == times[1:]
+        assert [row["temperature"] for row in hourly] == [2.0, 3.0, 4.0]
+        assert hourly[0]["wind_speed"] is None  # Missing column
+
+    def test_empty_hourly(self, client):
+        """Test a response without hourly data yields no rows."""
+        assert client._parse_hourly({}) == []
+        assert client._parse_hourly_6h({"hourly": {"time": []}}) == []
+
+
+class TestParseDaily:
+    """Test daily forecast parsing."""
+
+    @pytest.mark.parametrize(
+        "times",
+        [
+            pytest.param(["2026-02-12", "2026-02-13", "2026-02-14"], id="regular"),
+            pytest.param(["2026-02-12", "2026-02-13", "2026-02-15"], id="gapped"),
+        ],
+    )
+    def test_datetimes_match_api_dates(self, client, times):
+        """Test derived and parsed daily timestamps match the API dates."""
+        daily = client._parse_daily({"daily": {"time": times}})
+
+        assert [row["datetime"] for row in daily] == [
+            datetime.fromisoformat(t).isoformat() for t in times
+        ]
+
+    def test_empty_daily(self, client):
+        """Test a response without daily data yields no rows."""
+        assert client._parse_daily({}) == []
+
+
+class TestBundleRequests:
+    """Test request sharing and caching of the forecast bundle."""
+
+    async def test_concurrent_callers_share_request(self):
+        """Test all section getters resolve from a single HTTP request."""
+        gate = asyncio.Event()
+        session = FakeSession(ok_response(), gate=gate)
+        client = OpenMeteoClient(45.9237, 6.8694, session=session)
+
+        pending = asyncio.gather(
+            client.async_get_current_weather(),
+            client.async_get_daily_forecast(),
+            client.async_get_hourly_forecast(),
+            client.async_get_hourly_6h(),
+            client.async_get_additional_data(),
+        )
+        await asyncio.sleep(0)
+        gate.set()
+        current, daily, hourly, hourly_6h, additional = await pending
+
+        assert len(session.requests) == 1
+        assert current["temperature"] == 5.2
+        assert additional == {"elevation": 1035}
+
+    async def test_cancelled_caller_does_not_cancel_fetch(self):
+        """Test cancelling one caller leaves the shared request running."""
+        gate = asyncio.Event()
+        session = FakeSession(ok_response(), gate=gate)
+        client = OpenMeteoClient(45.9237, 6.8694, session=session)
+
+        cancelled = asyncio.ensure_future(client.async_get_current_weather())
+        waiting = asyncio.ensure_future(client.async_get_daily_forecast())
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        gate.set()
+
+        assert await waiting == []
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        assert len(session.requests) == 1
+        assert client._last_data == PAYLOAD
+
+    async def test_fresh_payload_reused(self):
+        """Test a payload fetched moments ago is reused without a request."""
+        session = FakeSession(ok_response())
+        client = OpenMeteoClient(45.9237, 6.8694, session=session)
+
+        first = await client.async_get_bundle()
+        second = await client.async_get_bundle()
+
+        assert len(session.requests) == 1
+        assert second == first
+
+    async def test_not_modified_reuses_last_payload(self):
+        """Test a stale payload is revalidated and reused on 304."""
+        session = FakeSession(
+            ok_response(
+                {"ETag": '"v1"', "Last-Modified": "Thu, 12 Feb 2026 10:00:00 GMT"}
+            ),
+            FakeResponse(304),
+        )
+        client = OpenMeteoClient(45.9237, 6.8694, session=session)
+
+        first = await client.async_get_bundle()
+        client._last_fetched -= 3600  # Past the freshness window
+        second = await client.async_get_bundle()
+
+        assert session.requests[0] == {}
+        assert session.requests[1] == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Thu, 12 Feb 2026 10:00:00 GMT",
+        }
+        assert second["current"] == first["current"]
+
+    async def test_not_modified_without_payload_is_error(self):
+        """Test a 304 is an error when there is no payload to reuse."""
+        client = OpenMeteoClient(
+            45.9237, 6.8694, session=FakeSession(FakeResponse(304))
+        )
+
+        with pytest.raises(OpenMeteoApiError, match="304"):
+            await client.async_get_bundle()
+        assert client._last_data is None